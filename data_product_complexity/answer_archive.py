@@ -0,0 +1,328 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from .data_product_complexity import DataProductComplexityAssessment, Question
+from .data_product_complexity_tool import load_questionnaire
+from .responses import RESPONSES_CHUNK_SIZE, iter_answer_sets
+from .scoring import (
+    NOT_SURE,
+    AnswerSet,
+    bin_weighted_scores,
+    is_multi_select,
+    multi_select_rule,
+    multi_select_scores,
+    scorable_questions,
+    split_selections,
+)
+
+ARCHIVE_FORMAT = "data-product-complexity-answer-archive"
+# Version 2 stores CheckBox questions as selection bitmasks
+ARCHIVE_VERSION = 2
+SCORE_BLOCK_ROWS = 64 * 1024
+
+
+def archive_paths(path: str) -> tuple[Path, Path, Path]:
+    """
+    (header, codes, rows) files of the archive at `path`: a JSON header, the
+    raw option index matrix it describes, and a CSV of who/when per row
+    """
+    base = Path(path)
+    if base.suffix == ".json":
+        base = base.with_suffix("")
+    return (
+        base.with_name(base.name + ".json"),
+        base.with_name(base.name + ".codes"),
+        base.with_name(base.name + ".rows.csv"),
+    )
+
+
+def _codes_dtype(max_code: int) -> np.dtype:
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_code <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _question_header(question: Question) -> dict[str, Any]:
+    header = {"id": question.question_id, "options": [o.option_text for o in question.options]}
+    if is_multi_select(question):
+        header["multiSelect"] = multi_select_rule(question).value
+    return header
+
+
+def _selection_mask(question: dict[str, Any], answer: str) -> int:
+    indexes = {option: i for i, option in enumerate(question["options"])}
+    try:
+        selections = split_selections(indexes, answer)
+    except ValueError:
+        raise ValueError(
+            f"'{answer}' is not a selection of options for question {question['id']}"
+        ) from None
+    return sum(1 << indexes[s] for s in set(selections))
+
+
+class AnswerArchive:
+    """
+    Assessments stored as option indices: one row per assessment and one
+    column per scorable question (scorable question order), each cell the
+    index of the selected option in Question.options, or `missing_code` if
+    the question was left unanswered. CheckBox questions hold their
+    scoring.selection_mask bitmask instead (0 if unanswered).
+
+    The codes are a raw C-ordered matrix memory-mapped straight from disk;
+    its shape and dtype live in the JSON header, along with the hash of the
+    questionnaire the indices refer to. The header is written last, so rows
+    appended by an interrupted run are simply ignored (and overwritten).
+    """
+
+    def __init__(self, path: str, header: dict[str, Any]):
+        self.path = path
+        self.header_path, self.codes_path, self.rows_path = archive_paths(path)
+        self.header = header
+        self.dtype = np.dtype(header["dtype"])
+        self.missing_code: int = header["missingCode"]
+        self.question_ids: list[str] = [q["id"] for q in header["questions"]]
+
+    @property
+    def questionnaire_hash(self) -> str:
+        return self.header["questionnaireHash"]
+
+    @property
+    def rows(self) -> int:
+        return self.header["rows"]
+
+    @staticmethod
+    def create(path: str, assessment: DataProductComplexityAssessment) -> "AnswerArchive":
+        questions = scorable_questions(assessment)
+        # The code one past the last option marks an unanswered question
+        max_options = max((len(q.options) for q in questions), default=0)
+        max_mask = max(
+            ((1 << len(q.options)) - 1 for q in questions if is_multi_select(q)), default=0
+        )
+        dtype = _codes_dtype(max(max_options, max_mask))
+        archive = AnswerArchive(
+            path,
+            {
+                "format": ARCHIVE_FORMAT,
+                "formatVersion": ARCHIVE_VERSION,
+                "questionnaireHash": assessment.version_hash(),
+                "dtype": dtype.str,
+                "missingCode": max_options,
+                "rows": 0,
+                "rowsBytes": 0,
+                "questions": [_question_header(q) for q in questions],
+            },
+        )
+        archive.codes_path.write_bytes(b"")
+        with open(archive.rows_path, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerow(["product_name", "submitted_at"])
+        archive.header["rowsBytes"] = archive.rows_path.stat().st_size
+        archive._save_header()
+        return archive
+
+    @staticmethod
+    def open(path: str) -> "AnswerArchive":
+        header_path = archive_paths(path)[0]
+        with open(header_path, "r", encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("format") != ARCHIVE_FORMAT:
+            raise ValueError(f"{header_path} is not an answer archive (format {header.get('format')!r})")
+        if header.get("formatVersion") != ARCHIVE_VERSION:
+            raise ValueError(
+                f"Unsupported answer archive version {header.get('formatVersion')!r}, "
+                f"this reader reads version {ARCHIVE_VERSION}"
+            )
+        return AnswerArchive(path, header)
+
+    @staticmethod
+    def open_or_create(path: str, assessment: DataProductComplexityAssessment) -> "AnswerArchive":
+        if archive_paths(path)[0].exists():
+            return AnswerArchive.open(path)
+        return AnswerArchive.create(path, assessment)
+
+    def _save_header(self) -> None:
+        tmp = self.header_path.with_name(self.header_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.header, f, ensure_ascii=False)
+        os.replace(tmp, self.header_path)
+
+    def check_questionnaire(self, assessment: DataProductComplexityAssessment) -> None:
+        if assessment.version_hash() != self.questionnaire_hash:
+            raise ValueError(
+                f"{self.header_path} was archived against questionnaire "
+                f"{self.questionnaire_hash[:12]}, not {assessment.version_hash()[:12]}; "
+                "remap the answers to this questionnaire version first"
+            )
+
+    def codes(self) -> np.ndarray:
+        """The (rows, questions) option index matrix, memory-mapped read-only"""
+        if self.rows == 0:
+            return np.empty((0, len(self.question_ids)), dtype=self.dtype)
+        return np.memmap(
+            self.codes_path, dtype=self.dtype, mode="r", shape=(self.rows, len(self.question_ids))
+        )
+
+    def encode(self, answer_sets: list[AnswerSet]) -> np.ndarray:
+        questions = self.header["questions"]
+        # option text -> index, or for CheckBox questions answer text ->
+        # bitmask, filled in as answers are seen
+        lookups = [
+            {} if "multiSelect" in q else {option: i for i, option in enumerate(q["options"])}
+            for q in questions
+        ]
+        codes = np.empty((len(answer_sets), len(lookups)), dtype=self.dtype)
+        for row, answer_set in enumerate(answer_sets):
+            for col, (question, lookup) in enumerate(zip(questions, lookups)):
+                answer = answer_set.answers.get(question["id"])
+                if not answer:
+                    codes[row, col] = 0 if "multiSelect" in question else self.missing_code
+                    continue
+                code = lookup.get(answer)
+                if code is None:
+                    if "multiSelect" not in question:
+                        raise ValueError(
+                            f"'{answer}' is not an option for question {question['id']}"
+                        )
+                    code = lookup[answer] = _selection_mask(question, answer)
+                codes[row, col] = code
+        return codes
+
+    def append(self, answer_sets: Iterable[AnswerSet], batch_size: int = RESPONSES_CHUNK_SIZE) -> int:
+        """Encode and append `answer_sets`, returning how many were added"""
+        row_bytes = len(self.question_ids) * self.dtype.itemsize
+        rows_bytes = self.header["rowsBytes"]
+        added = 0
+        answer_sets = iter(answer_sets)
+        with open(self.codes_path, "r+b") as codes, open(
+            self.rows_path, "r+", encoding="utf-8", newline=""
+        ) as rows:
+            # Drop anything an interrupted append wrote past the header's row count
+            codes.truncate(self.rows * row_bytes)
+            codes.seek(0, os.SEEK_END)
+            rows.truncate(rows_bytes)
+            rows.seek(rows_bytes)
+            writer = csv.writer(rows)
+            while batch := list(islice(answer_sets, batch_size)):
+                codes.write(self.encode(batch).tobytes())
+                writer.writerows([a.product_name, a.submitted_at or ""] for a in batch)
+                added += len(batch)
+            rows.flush()
+            self.header["rowsBytes"] = rows.tell()
+        self.header["rows"] += added
+        self._save_header()
+        return added
+
+    def iter_row_labels(self) -> Iterator[tuple[str, str]]:
+        """(product_name, submitted_at) for each archived row"""
+        with open(self.rows_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+            for row in islice(reader, self.rows):
+                yield row[0], row[1]
+
+    def score_table(self, assessment: DataProductComplexityAssessment) -> np.ndarray:
+        """
+        (questions, missing_code + 1) weighted score of each option index;
+        the last column, for unanswered questions, holds 'Not sure' (NaN if
+        the question has no such option). CheckBox rows are left NaN, their
+        masks are scored by scoring.multi_select_scores instead.
+        """
+        questions = scorable_questions(assessment)
+        table = np.full((len(questions), self.missing_code + 1), np.nan)
+        for i, question in enumerate(questions):
+            if is_multi_select(question):
+                continue
+            for j, option in enumerate(question.options):
+                table[i, j] = option.score * question.weight
+                if option.option_text == NOT_SURE:
+                    table[i, self.missing_code] = option.score * question.weight
+        return table
+
+    def iter_scores(
+        self, assessment: DataProductComplexityAssessment, block_rows: int = SCORE_BLOCK_ROWS
+    ) -> Iterator[np.ndarray]:
+        """
+        (block, n_sections) arrays of 1-5 bins for every archived row. Each
+        block is a slice of the memory map gathered straight through the
+        score table (CheckBox columns scored from their masks), so the codes
+        are never decoded back into text.
+        """
+        self.check_questionnaire(assessment)
+        codes = self.codes()
+        table = self.score_table(assessment)
+        questions = scorable_questions(assessment)
+        multi = [(i, q) for i, q in enumerate(questions) if is_multi_select(q)]
+        single = np.array([i for i, q in enumerate(questions) if not is_multi_select(q)], dtype=np.intp)
+        for start in range(0, codes.shape[0], block_rows):
+            block = codes[start:start + block_rows]
+            if multi:
+                weighted = np.empty(block.shape, dtype=np.float64)
+                weighted[:, single] = table[single, block[:, single]]
+                for i, question in multi:
+                    weighted[:, i] = multi_select_scores(question, block[:, i]) * question.weight
+            else:
+                weighted = table[np.arange(table.shape[0]), block]
+            if np.isnan(weighted).any():
+                row, col = np.argwhere(np.isnan(weighted))[0]
+                raise ValueError(
+                    f"Archived row {start + row + 1} leaves question {self.question_ids[col]} "
+                    f"unanswered and it has no '{NOT_SURE}' option"
+                )
+            yield bin_weighted_scores(assessment, weighted)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Keep assessments in a compact option index archive and score it."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Append assessments to an archive, creating it if needed.")
+    add.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    add.add_argument("archive", help="Archive path (its .json, .codes and .rows.csv files share this stem).")
+    add.add_argument("inputs", nargs="+",
+                     help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+
+    score = commands.add_parser("score", help="Score every archived assessment.")
+    score.add_argument("yaml_path", help="Path to the questionnaire YAML the archive was built against.")
+    score.add_argument("archive", help="Archive path.")
+    score.add_argument("-o", "--output", default="archive_scores.csv",
+                       help="CSV of section scores per archived assessment.")
+
+    args = parser.parse_args(argv)
+
+    assessment = load_questionnaire(args.yaml_path)
+    try:
+        if args.command == "add":
+            archive = AnswerArchive.open_or_create(args.archive, assessment)
+            archive.check_questionnaire(assessment)
+            added = archive.append(iter_answer_sets(args.inputs, assessment))
+            print(f"✅ Archived {added} assessments in {archive.header_path} ({archive.rows} in total).")
+        elif args.command == "score":
+            archive = AnswerArchive.open(args.archive)
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(
+                    ["product_name", "submitted_at"] + [s.title for s in assessment.scorable_sections]
+                )
+                labels = archive.iter_row_labels()
+                for bins in archive.iter_scores(assessment):
+                    writer.writerows(
+                        list(label) + row for label, row in zip(labels, bins.tolist())
+                    )
+            print(f"✅ {archive.rows} archived assessments scored into: {args.output}")
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
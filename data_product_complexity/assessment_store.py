@@ -0,0 +1,318 @@
+import argparse
+import sqlite3
+import sys
+from datetime import datetime, timezone, tzinfo
+from itertools import islice
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .responses import RESPONSES_CHUNK_SIZE, iter_answer_sets
+from .scoring import (
+    AnswerSet,
+    bin_weighted_scores,
+    scorable_questions,
+    weighted_scores,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questionnaires (
+    version_hash TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    first_seen TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sections (
+    version_hash TEXT NOT NULL REFERENCES questionnaires(version_hash),
+    section_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (version_hash, section_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS assessments (
+    assessment_id INTEGER PRIMARY KEY,
+    product_name TEXT NOT NULL,
+    version_hash TEXT NOT NULL REFERENCES questionnaires(version_hash),
+    submitted_at TEXT NOT NULL,
+    UNIQUE (product_name, version_hash, submitted_at)
+);
+CREATE INDEX IF NOT EXISTS assessments_by_product_time
+    ON assessments (product_name, submitted_at);
+CREATE INDEX IF NOT EXISTS assessments_by_version_time
+    ON assessments (version_hash, submitted_at);
+
+CREATE TABLE IF NOT EXISTS answers (
+    assessment_id INTEGER NOT NULL REFERENCES assessments(assessment_id),
+    question_id TEXT NOT NULL,
+    answer TEXT,
+    score REAL,
+    PRIMARY KEY (assessment_id, question_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS section_scores (
+    assessment_id INTEGER NOT NULL REFERENCES assessments(assessment_id),
+    section_id TEXT NOT NULL,
+    bin INTEGER NOT NULL,
+    PRIMARY KEY (assessment_id, section_id)
+) WITHOUT ROWID;
+"""
+
+# How Google Forms response sheets write timestamps, depending on the
+# spreadsheet's locale; ISO-8601 is tried first
+MONTH_FIRST_FORMATS = ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M")
+DAY_FIRST_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M")
+
+
+def normalise_timestamp(
+    text: str, day_first: bool = False, tz: tzinfo = timezone.utc
+) -> str:
+    """
+    `text` as an ISO-8601 UTC timestamp, so stored submission times sort
+    chronologically. Timestamps without a zone are taken to be in `tz` (the
+    response sheet's time zone); dates like 9/10/2024 are read month first
+    unless `day_first`.
+    """
+    text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        formats = (
+            DAY_FIRST_FORMATS + MONTH_FIRST_FORMATS
+            if day_first
+            else MONTH_FIRST_FORMATS + DAY_FIRST_FORMATS
+        )
+        for fmt in formats:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"Can't read '{text}' as a submission time") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+SECTION_SCORES_WITH_TITLES = """
+    SELECT a.product_name, a.submitted_at, s.title, ss.bin
+    FROM assessments a
+    JOIN section_scores ss ON ss.assessment_id = a.assessment_id
+    JOIN sections s ON s.version_hash = a.version_hash AND s.section_id = ss.section_id
+"""
+
+
+class AssessmentStore:
+    """
+    Scored assessments in a local SQLite database, keyed by data product
+    name, questionnaire version hash and submission time (ISO-8601 UTC),
+    with the answer and weighted score of every question and the bin of
+    every section.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _register_questionnaire(self, assessment: DataProductComplexityAssessment) -> str:
+        version_hash = assessment.version_hash()
+        self._conn.execute(
+            "INSERT OR IGNORE INTO questionnaires VALUES (?, ?, ?)",
+            (version_hash, assessment.title, datetime.now(timezone.utc).isoformat()),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO sections VALUES (?, ?, ?)",
+            [(version_hash, s.section_id, s.title) for s in assessment.scorable_sections],
+        )
+        return version_hash
+
+    def add(
+        self,
+        assessment: DataProductComplexityAssessment,
+        answer_sets: Iterable[AnswerSet],
+        batch_size: int = RESPONSES_CHUNK_SIZE,
+        day_first: bool = False,
+        tz: tzinfo = timezone.utc,
+    ) -> tuple[int, int]:
+        """
+        Score and store `answer_sets`, one transaction per batch. Answer
+        sets already stored for the same product, questionnaire version and
+        submission time are skipped, so every answer set needs a submission
+        time (see normalise_timestamp). Returns (added, skipped).
+        """
+        questions = scorable_questions(assessment)
+        sections = assessment.scorable_sections
+        added = skipped = 0
+        answer_sets = iter(answer_sets)
+        with self._conn:
+            version_hash = self._register_questionnaire(assessment)
+
+        while batch := list(islice(answer_sets, batch_size)):
+            weighted = weighted_scores(assessment, batch)
+            bins = bin_weighted_scores(assessment, weighted)
+            answer_rows = []
+            section_rows = []
+            with self._conn:
+                for answer_set, scores, section_bins in zip(batch, weighted, bins):
+                    if not answer_set.submitted_at:
+                        raise ValueError(
+                            f"'{answer_set.product_name}' has no submission time to tell it apart from other assessments"
+                        )
+                    submitted_at = normalise_timestamp(answer_set.submitted_at, day_first, tz)
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO assessments (product_name, version_hash, submitted_at) VALUES (?, ?, ?)",
+                        (answer_set.product_name, version_hash, submitted_at),
+                    )
+                    if cursor.rowcount == 0:
+                        skipped += 1
+                        continue
+                    added += 1
+                    assessment_id = cursor.lastrowid
+                    scored = {q.question_id: float(s) for q, s in zip(questions, scores)}
+                    answer_rows.extend(
+                        (assessment_id, question_id, answer, scored.get(question_id))
+                        for question_id, answer in answer_set.answers.items()
+                    )
+                    section_rows.extend(
+                        (assessment_id, s.section_id, int(b))
+                        for s, b in zip(sections, section_bins)
+                    )
+                self._conn.executemany(
+                    "INSERT INTO answers VALUES (?, ?, ?, ?)", answer_rows
+                )
+                self._conn.executemany(
+                    "INSERT INTO section_scores VALUES (?, ?, ?)", section_rows
+                )
+        return added, skipped
+
+    def trend(
+        self, product_name: str, section_title: Optional[str] = None
+    ) -> list[tuple[str, str, int]]:
+        """
+        (submitted_at, section title, bin) for every stored assessment of
+        `product_name`, oldest first, optionally for one section only
+        """
+        query = SECTION_SCORES_WITH_TITLES + " WHERE a.product_name = ?"
+        params = [product_name]
+        if section_title is not None:
+            query += " AND s.title = ?"
+            params.append(section_title)
+        query += " ORDER BY a.submitted_at, ss.section_id"
+        return [row[1:] for row in self._conn.execute(query, params)]
+
+    def question_history(
+        self, product_name: str, question_id: str
+    ) -> list[tuple[str, str, Optional[str], Optional[float]]]:
+        """
+        (submitted_at, version_hash, answer, weighted score) of one question
+        across every stored assessment of `product_name`, oldest first
+        """
+        return self._conn.execute(
+            """
+            SELECT a.submitted_at, a.version_hash, ans.answer, ans.score
+            FROM assessments a
+            JOIN answers ans ON ans.assessment_id = a.assessment_id
+            WHERE a.product_name = ? AND ans.question_id = ?
+            ORDER BY a.submitted_at
+            """,
+            (product_name, question_id),
+        ).fetchall()
+
+    def compare(
+        self, product_names: Optional[list[str]] = None
+    ) -> list[tuple[str, str, str, int]]:
+        """
+        (product name, submitted_at, section title, bin) from the latest
+        assessment of each product, or of just `product_names`
+        """
+        query = (
+            """
+            WITH latest AS (
+                SELECT product_name, MAX(submitted_at) AS submitted_at
+                FROM assessments
+                GROUP BY product_name
+            )
+            """
+            + SECTION_SCORES_WITH_TITLES
+            + " JOIN latest l ON l.product_name = a.product_name AND l.submitted_at = a.submitted_at"
+        )
+        params: list[str] = []
+        if product_names:
+            query += f" WHERE a.product_name IN ({', '.join('?' for _ in product_names)})"
+            params.extend(product_names)
+        query += " ORDER BY a.product_name, ss.section_id"
+        return self._conn.execute(query, params).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Store scored data product assessments in SQLite and query their history."
+    )
+    parser.add_argument("--db", default="assessments.sqlite",
+                        help="Path to the SQLite assessment store (default assessments.sqlite).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Score and store assessments.")
+    ingest.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    ingest.add_argument("inputs", nargs="+",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    ingest.add_argument("--day-first", action="store_true",
+                        help="Read response timestamps like 9/10/2024 as 9 October rather than September 10.")
+    ingest.add_argument("--timezone", default="UTC",
+                        help="Time zone of the response sheet's timestamps (default UTC), e.g. Europe/London.")
+
+    trend = commands.add_parser("trend", help="Section scores of one product over time.")
+    trend.add_argument("product", help="Data product name.")
+    trend.add_argument("--section", default=None, help="Only this section.")
+
+    history = commands.add_parser("history", help="Answers to one question of one product over time.")
+    history.add_argument("product", help="Data product name.")
+    history.add_argument("question_id", help="Question id, e.g. 1.3.")
+
+    compare = commands.add_parser("compare", help="Latest section scores of several products.")
+    compare.add_argument("products", nargs="*", help="Data product names (default all).")
+
+    args = parser.parse_args(argv)
+
+    with AssessmentStore(args.db) as store:
+        if args.command == "ingest":
+            assessment = load_questionnaire(args.yaml_path)
+            try:
+                added, skipped = store.add(
+                    assessment,
+                    iter_answer_sets(args.inputs, assessment),
+                    day_first=args.day_first,
+                    tz=ZoneInfo(args.timezone),
+                )
+            except (ValueError, ZoneInfoNotFoundError) as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            print(f"✅ Stored {added} assessments in {args.db} ({skipped} already present).")
+        elif args.command == "trend":
+            for submitted_at, section, score in store.trend(args.product, args.section):
+                print(f"{submitted_at}\t{section}\t{score}")
+        elif args.command == "history":
+            for submitted_at, version_hash, answer, score in store.question_history(
+                args.product, args.question_id
+            ):
+                print(f"{submitted_at}\t{version_hash[:12]}\t{answer}\t{score}")
+        elif args.command == "compare":
+            for product, submitted_at, section, score in store.compare(args.products):
+                print(f"{product}\t{submitted_at}\t{section}\t{score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from importlib import metadata
+
+from .data_product_complexity import Backend
+
+ENTRY_POINT_GROUP = "data_product_complexity.backends"
+
+# Also declared as entry points in pyproject.toml; listed here too so a
+# source checkout that was never pip installed still has its own backends
+BUILTIN_BACKENDS = {
+    "excel": "data_product_complexity.excel_backend:ExcelBackend",
+    "excel-stream": "data_product_complexity.xlsx_stream_backend:StreamingExcelBackend",
+    "google-form": "data_product_complexity.google_form_backend:GoogleFormBackend",
+    "scoring-table": "data_product_complexity.scoring_table:ScoringTableBackend",
+}
+
+
+def _entry_points() -> dict[str, metadata.EntryPoint]:
+    points = {
+        name: metadata.EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP)
+        for name, value in BUILTIN_BACKENDS.items()
+    }
+    discovered = metadata.entry_points()
+    if hasattr(discovered, "select"):
+        discovered = discovered.select(group=ENTRY_POINT_GROUP)
+    else:  # Python < 3.10
+        discovered = discovered.get(ENTRY_POINT_GROUP, [])
+    for point in discovered:
+        points[point.name] = point
+    return points
+
+
+def available_backends() -> list[str]:
+    """Names of every registered backend; nothing is imported to list them"""
+    return list(_entry_points())
+
+
+def backend_distribution(name: str) -> str:
+    """
+    'name==version' of the installed distribution that registered backend
+    `name`, or "" for this package's own backends in a source checkout
+    """
+    dist = getattr(_entry_points()[name], "dist", None)  # Python >= 3.10
+    if dist is None:
+        return ""
+    return f"{dist.metadata['Name']}=={dist.version}"
+
+
+def load_backend(name: str) -> type[Backend]:
+    """Import the backend registered as `name`"""
+    points = _entry_points()
+    if name not in points:
+        raise KeyError(f"No backend named {name!r}; available: {', '.join(points)}")
+    backend = points[name].load()
+    if not (isinstance(backend, type) and issubclass(backend, Backend)):
+        raise TypeError(f"Backend {name!r} ({points[name].value}) does not implement Backend")
+    return backend
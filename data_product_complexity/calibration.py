@@ -0,0 +1,237 @@
+import argparse
+import io
+import sys
+from dataclasses import dataclass
+from datetime import timezone, tzinfo
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+import pandas as pd
+
+from .assessment_store import normalise_timestamp
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .migrate import _round_trip_yaml, keep_original_wrapping
+from .responses import iter_answer_sets
+from .scoring import AnswerSet, option_scores
+
+MAX_ITERATIONS = 5000
+TOLERANCE = 1e-10
+WEIGHT_DECIMALS = 3
+
+
+def fit_nonnegative_least_squares(
+    x: np.ndarray, y: np.ndarray, iterations: int = MAX_ITERATIONS
+) -> tuple[np.ndarray, float]:
+    """
+    Fit y ~ x @ w + intercept with w >= 0, by accelerated projected gradient
+    descent (each step is a couple of matrix-vector products over the whole
+    history). Returns (w, intercept).
+    """
+    x_mean = x.mean(axis=0)
+    y_mean = y.mean()
+    xc = x - x_mean
+    yc = y - y_mean
+
+    gram = xc.T @ xc
+    xty = xc.T @ yc
+    # Step size from the Lipschitz constant of the gradient
+    lipschitz = np.linalg.norm(gram, 2)
+    if lipschitz == 0:
+        return np.zeros(x.shape[1]), float(y_mean)
+
+    w = np.zeros(x.shape[1])
+    momentum = w.copy()
+    t = 1.0
+    for _ in range(iterations):
+        w_next = np.maximum(momentum - (gram @ momentum - xty) / lipschitz, 0.0)
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        momentum = w_next + (t - 1) / t_next * (w_next - w)
+        converged = np.max(np.abs(w_next - w)) < TOLERANCE
+        w, t = w_next, t_next
+        if converged:
+            break
+    return w, float(y_mean - x_mean @ w)
+
+
+def r_squared(predicted: np.ndarray, actual: np.ndarray) -> float:
+    residual = ((actual - predicted) ** 2).sum()
+    total = ((actual - actual.mean()) ** 2).sum()
+    return float(1 - residual / total) if total > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class WeightCalibration:
+    """
+    Per-question weights (in scorable question order) fitted to delivery
+    effort, plus how well they explain it overall and per section.
+    """
+
+    weights: np.ndarray
+    overall_r_squared: float
+    section_r_squared: dict[str, float]
+    products: int
+
+
+def calibrate_weights(
+    assessment: DataProductComplexityAssessment,
+    answer_sets: list[AnswerSet],
+    effort: np.ndarray,
+) -> WeightCalibration:
+    """
+    Fit question weights so that the weighted option scores best predict
+    `effort` (one value per answer set).
+
+    Section scores are normalised by their weighted min/max, so only the
+    relative size of weights matters: the non-negative fit is rescaled so
+    the most predictive question gets weight 1, keeping every weight
+    within the schema's [0, 1]. Sections where no question predicts
+    effort keep equal weights.
+    """
+    x = option_scores(assessment, answer_sets)
+    y = np.asarray(effort, dtype=np.float64)
+    w, intercept = fit_nonnegative_least_squares(x, y)
+    overall = r_squared(x @ w + intercept, y)
+
+    scale = w.max()
+    weights = np.round(w / scale, WEIGHT_DECIMALS) if scale > 0 else np.ones_like(w)
+
+    section_fit = {}
+    start = 0
+    for section in assessment.scorable_sections:
+        end = start + len(section.questions)
+        if not weights[start:end].any():
+            # Nothing in this section predicts effort; keep it usable (a
+            # section of all-zero weights can't be normalised) by leaving
+            # its questions equally weighted
+            weights[start:end] = 1.0
+        section_total = x[:, start:end] @ weights[start:end]
+        # How much of the effort this section's weighted total explains on its own
+        design = np.column_stack([section_total, np.ones_like(section_total)])
+        coef, *_ = np.linalg.lstsq(design, y, rcond=None)
+        section_fit[section.title] = r_squared(design @ coef, y)
+        start = end
+
+    return WeightCalibration(
+        weights=weights,
+        overall_r_squared=overall,
+        section_r_squared=section_fit,
+        products=len(answer_sets),
+    )
+
+
+def read_effort_csv(path: str) -> dict[str, float]:
+    """
+    Delivery effort per data product from a CSV with 'product_name' and
+    'effort' columns
+    """
+    df = pd.read_csv(path, dtype={"product_name": str})
+    missing = {"product_name", "effort"} - set(df.columns)
+    if missing:
+        raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+    return dict(zip(df["product_name"], df["effort"].astype(float)))
+
+
+def latest_answer_sets(
+    answer_sets: Iterable[AnswerSet],
+    product_names: Iterable[str],
+    day_first: bool = False,
+    tz: tzinfo = timezone.utc,
+) -> list[AnswerSet]:
+    """
+    The latest answer set of each of `product_names`, by submission time
+    (see assessment_store.normalise_timestamp). Where either of two answer
+    sets has no submission time, the later one in input order wins.
+    """
+    wanted = set(product_names)
+    latest: dict[str, tuple[Optional[str], AnswerSet]] = {}
+    for answer_set in answer_sets:
+        if answer_set.product_name not in wanted:
+            continue
+        submitted_at = (
+            normalise_timestamp(answer_set.submitted_at, day_first, tz)
+            if answer_set.submitted_at
+            else None
+        )
+        current = latest.get(answer_set.product_name)
+        if current is None or current[0] is None or submitted_at is None or submitted_at >= current[0]:
+            latest[answer_set.product_name] = (submitted_at, answer_set)
+    return [answer_set for _, answer_set in latest.values()]
+
+
+def write_weighted_questionnaire(
+    yaml_path: str, weights: np.ndarray, output_path: str
+) -> None:
+    """
+    Copy the questionnaire at `yaml_path` to `output_path` with the
+    scorable questions' weights replaced by `weights`, keeping its
+    comments, quoting and wrapping as migrate does
+    """
+    yaml = _round_trip_yaml()
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        original = f.read()
+    data = yaml.load(original)
+
+    new_weights = iter(float(w) for w in weights)
+    for section in data["data_product_complexity"]["sections"][1:]:
+        for question in section["questions"]:
+            question["weight"] = next(new_weights)
+
+    buf = io.StringIO()
+    yaml.dump(data, buf)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(keep_original_wrapping(original, buf.getvalue()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Fit question weights to historical delivery effort."
+    )
+    parser.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    parser.add_argument("inputs", nargs="+",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    parser.add_argument("--effort", required=True,
+                        help="CSV of actual delivery effort with 'product_name' and 'effort' columns.")
+    parser.add_argument("-o", "--output", default="calibrated_questionnaire.yaml",
+                        help="Path to write the questionnaire YAML with fitted weights.")
+    parser.add_argument("--day-first", action="store_true",
+                        help="Read response timestamps like 9/10/2024 as 9 October rather than September 10.")
+    parser.add_argument("--timezone", default="UTC",
+                        help="Time zone of the response sheet's timestamps (default UTC), e.g. Europe/London.")
+
+    args = parser.parse_args(argv)
+
+    assessment = load_questionnaire(args.yaml_path)
+    effort_by_product = read_effort_csv(args.effort)
+
+    # Latest assessment of each product that has a recorded effort
+    try:
+        _round_trip_yaml()  # fail before fitting if ruamel.yaml is missing
+        answer_sets = latest_answer_sets(
+            iter_answer_sets(args.inputs, assessment),
+            effort_by_product,
+            day_first=args.day_first,
+            tz=ZoneInfo(args.timezone),
+        )
+    except (ImportError, ValueError, ZoneInfoNotFoundError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if len(answer_sets) < 2:
+        print(f"❌ Need at least 2 assessed products with a recorded effort, found {len(answer_sets)}.")
+        sys.exit(1)
+
+    calibration = calibrate_weights(
+        assessment, answer_sets, np.array([effort_by_product[a.product_name] for a in answer_sets])
+    )
+    write_weighted_questionnaire(args.yaml_path, calibration.weights, args.output)
+
+    print(f"Fitted {len(calibration.weights)} weights on {calibration.products} products "
+          f"(R² {calibration.overall_r_squared:.3f})")
+    for section, fit in calibration.section_r_squared.items():
+        print(f"  {section}: R² {fit:.3f}")
+    print(f"✅ Calibrated questionnaire written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import importlib
+import sys
+
+# Sub-commands are imported only when used, so the default render path does
+# not pay for numpy/pandas-heavy tooling it never touches.
+COMMANDS = {
+    "portfolio": "data_product_complexity.portfolio",
+    "export": "data_product_complexity.columnar_export",
+    "store": "data_product_complexity.assessment_store",
+    "sensitivity": "data_product_complexity.sensitivity",
+    "calibrate": "data_product_complexity.calibration",
+    "migrate": "data_product_complexity.migrate",
+    "remap": "data_product_complexity.version_mapping",
+    "validate": "data_product_complexity.validate_input",
+    "score": "data_product_complexity.incremental_scoring",
+    "archive": "data_product_complexity.answer_archive",
+}
+# Shown by `data-product-complexity --help`, without importing the commands
+COMMAND_HELP = {
+    "portfolio": "Summarise many scored assessments in one workbook.",
+    "export": "Export scored assessments as Parquet or Arrow IPC.",
+    "store": "Store scored assessments in SQLite and query their history.",
+    "sensitivity": "Report how far 'Not sure' answers could move section scores.",
+    "calibrate": "Fit question weights to recorded delivery effort.",
+    "migrate": "Apply score and weight transforms to questionnaire files.",
+    "remap": "Re-score answers collected against an older questionnaire.",
+    "validate": "Validate many questionnaire files in parallel.",
+    "score": "Score a growing Google Form response export incrementally.",
+    "archive": "Keep assessments in an option index archive and score it.",
+}
+
+
+def commands_epilog() -> str:
+    width = max(map(len, COMMANDS))
+    lines = [f"  {name:<{width}}  {COMMAND_HELP[name]}" for name in COMMANDS]
+    return (
+        "commands (data-product-complexity <command> --help for their options):\n"
+        + "\n".join(lines)
+    )
+
+
+def main(argv=None):
+    """
+    `data-product-complexity <command> ...` runs one of COMMANDS; anything
+    else is treated as the original `data-product-complexity yaml_path ...`
+    render invocation.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        return importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+
+    from .data_product_complexity_tool import main as render_main
+
+    return render_main(argv)
+
+
+if __name__ == "__main__":
+    main()
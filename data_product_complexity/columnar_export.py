@@ -0,0 +1,193 @@
+import argparse
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Iterable
+
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .responses import all_questions, iter_answer_sets
+from .scoring import (
+    AnswerSet,
+    bin_weighted_scores,
+    is_multi_select,
+    scorable_questions,
+    weighted_scores,
+)
+
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Columnar export needs pyarrow: pip install 'data-product-complexity-tool[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def answer_column(question_id: str) -> str:
+    return f"{question_id}_answer"
+
+
+def score_column(question_id: str) -> str:
+    return f"{question_id}_score"
+
+
+def bin_column(section_id: str) -> str:
+    return f"section_{section_id}_bin"
+
+
+class ScoredAssessmentSchema:
+    """
+    Column layout for scored assessments: one row per assessment with the
+    answer to every question, the weighted score of every scorable question
+    and the 1-5 bin of every section. Columns are named after
+    Question.question_id / Section.section_id; the titles travel in the
+    schema metadata.
+
+    Answers to scored single choice questions are dictionary encoded
+    against the question's options, the same dictionary in every batch
+    (Arrow IPC files can't replace a dictionary between batches).
+    Unanswered is null. Other answers (free text, several CheckBox
+    options) are plain strings.
+    """
+
+    def __init__(self, assessment: DataProductComplexityAssessment):
+        pa = _import_pyarrow()
+        self._assessment = assessment
+        self.questions = all_questions(assessment)
+        self.scorable_questions = scorable_questions(assessment)
+        # question_id -> (option text -> dictionary index, dictionary)
+        self._dictionaries = {
+            q.question_id: (
+                {o.option_text: i for i, o in enumerate(q.options)},
+                pa.array([o.option_text for o in q.options], pa.string()),
+            )
+            for q in self.scorable_questions
+            if not is_multi_select(q)
+        }
+        fields = [
+            pa.field("product_name", pa.string()),
+            pa.field("submitted_at", pa.string()),
+        ]
+        fields += [
+            pa.field(
+                answer_column(q.question_id),
+                pa.dictionary(pa.int32(), pa.string())
+                if q.question_id in self._dictionaries
+                else pa.string(),
+            )
+            for q in self.questions
+        ]
+        fields += [
+            pa.field(score_column(q.question_id), pa.float64())
+            for q in self.scorable_questions
+        ]
+        fields += [
+            pa.field(bin_column(s.section_id), pa.int8())
+            for s in assessment.scorable_sections
+        ]
+        metadata = {
+            "form_title": assessment.title,
+            "questions": json.dumps({q.question_id: q.question_text for q in self.questions}),
+            "sections": json.dumps(
+                {s.section_id: s.title for s in assessment.scorable_sections}
+            ),
+        }
+        self.schema = pa.schema(fields, metadata=metadata)
+
+    def answer_array(self, question_id: str, answers: list):
+        pa = _import_pyarrow()
+        if question_id not in self._dictionaries:
+            return pa.array([a or None for a in answers], pa.string())
+        indices, dictionary = self._dictionaries[question_id]
+        # Scoring has already rejected answers that aren't options
+        return pa.DictionaryArray.from_arrays(
+            pa.array([indices[a] if a else None for a in answers], pa.int32()),
+            dictionary,
+        )
+
+    def record_batch(self, answer_sets: list[AnswerSet]):
+        pa = _import_pyarrow()
+        weighted = weighted_scores(self._assessment, answer_sets)
+        bins = bin_weighted_scores(self._assessment, weighted)
+
+        columns = [
+            pa.array([a.product_name for a in answer_sets], pa.string()),
+            pa.array([a.submitted_at for a in answer_sets], pa.string()),
+        ]
+        columns += [
+            self.answer_array(q.question_id, [a.answers.get(q.question_id) for a in answer_sets])
+            for q in self.questions
+        ]
+        columns += [pa.array(weighted[:, i]) for i in range(weighted.shape[1])]
+        columns += [pa.array(bins[:, i].astype("int8")) for i in range(bins.shape[1])]
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+
+def export_scored_assessments(
+    assessment: DataProductComplexityAssessment,
+    answer_sets: Iterable[AnswerSet],
+    output_path: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Score `answer_sets` and write them to Parquet or Arrow IPC (picked by
+    the output suffix), one row group / record batch of `row_group_size`
+    rows at a time. Returns the number of rows written.
+    """
+    pa = _import_pyarrow()
+    suffix = Path(output_path).suffix.lower()
+    layout = ScoredAssessmentSchema(assessment)
+    if suffix in PARQUET_SUFFIXES:
+        writer = pa.parquet.ParquetWriter(output_path, layout.schema)
+    elif suffix in ARROW_SUFFIXES:
+        writer = pa.ipc.new_file(output_path, layout.schema)
+    else:
+        raise ValueError(
+            f"Don't know which columnar format to write for '{output_path}', use one of "
+            f"{', '.join(sorted(PARQUET_SUFFIXES | ARROW_SUFFIXES))}"
+        )
+
+    rows = 0
+    answer_sets = iter(answer_sets)
+    with writer:
+        while batch := list(islice(answer_sets, row_group_size)):
+            writer.write_batch(layout.record_batch(batch))
+            rows += len(batch)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export scored data product assessments as Parquet or Arrow IPC."
+    )
+    parser.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    parser.add_argument("inputs", nargs="+",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    parser.add_argument("-o", "--output", default="scored_assessments.parquet",
+                        help="Output path; .parquet for Parquet, .arrow/.feather for Arrow IPC.")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE,
+                        help=f"Rows per Parquet row group / Arrow record batch (default {DEFAULT_ROW_GROUP_SIZE}).")
+
+    args = parser.parse_args(argv)
+
+    assessment = load_questionnaire(args.yaml_path)
+    rows = export_scored_assessments(
+        assessment,
+        iter_answer_sets(args.inputs, assessment),
+        args.output,
+        row_group_size=args.row_group_size,
+    )
+    print(f"✅ {rows} scored assessments exported to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
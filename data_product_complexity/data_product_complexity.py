@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
+from typing import Optional
 import abc
+import hashlib
+import json
 
 
 class QuestionType(str, Enum):
@@ -9,6 +12,14 @@ class QuestionType(str, Enum):
     SHORT_ANSWER = "ShortAnswer"
 
 
+class MultiSelectRule(str, Enum):
+    """How the scores of a CheckBox question's selected options combine"""
+
+    MAX = "max"
+    SUM_CAPPED = "sum-capped"  # summed, but no higher than the best option
+    MEAN = "mean"
+
+
 @dataclass(frozen=True)
 class Option:
     option_text: str
@@ -27,6 +38,8 @@ class Question:
     weight: float
     options: list[Option]
     question_type: QuestionType
+    # CheckBox questions only; None scores them by MultiSelectRule.MAX
+    scoring_rule: Optional[MultiSelectRule] = None
 
     @staticmethod
     def from_dict(d: dict, question_id: str):
@@ -37,6 +50,7 @@ class Question:
             question_type=QuestionType(d["questionType"]),
             weight=d.get("weight", 1.0),
             options=[Option.from_dict(_) for _ in d.get("options", [])],
+            scoring_rule=MultiSelectRule(d["scoringRule"]) if "scoringRule" in d else None,
         )
 
 
@@ -69,8 +83,30 @@ class DataProductComplexityAssessment:
             scorable_sections=[Section.from_dict(s, section_id=section_num) for section_num, s in enumerate(d["sections"][1:], start=1)],
         )
 
+    def version_hash(self) -> str:
+        """
+        Identifies this version of the questionnaire: any change to the
+        questions, options, scores or weights gives a new hash, YAML
+        formatting and comments do not. Optional fields that are unset are
+        left out, so adding one doesn't change existing questionnaires' hashes.
+        """
+        fields = asdict(self, dict_factory=lambda items: {k: v for k, v in items if v is not None})
+        canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
 
 class Backend(abc.ABC):
+    """
+    An output format. Backends are registered under the
+    "data_product_complexity.backends" entry point group and instantiated
+    with no arguments.
+    """
+
+    # Where render writes when no output path is given, and how to describe
+    # what it wrote
+    default_output: str = "data_product_complexity_output"
+    description: str = "Output"
+
     @abc.abstractmethod
     def render(self, data: DataProductComplexityAssessment, output_path: str) -> None:
         pass
@@ -1,37 +1,139 @@
-
 import yaml
 import argparse
-from .excel_backend import ExcelBackend
-from .google_form_backend import write_google_form_from_yaml
-from .validate_input import validate_yaml
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from .backends import available_backends, backend_distribution, load_backend
+from .cli import commands_epilog
+from .data_product_complexity import Backend
+from .questionnaire_stream import AssessmentAssembler, iter_questionnaire, stream_questionnaire
+from .validate_input import QuestionnaireValidator
+from .render_cache import DEFAULT_CACHE_DIR, RenderCache, cache_key
+from .memory_profile import DEFAULT_TOP_SITES, MemoryProfiler
 import sys
+from typing import Optional
 
 from .data_product_complexity import DataProductComplexityAssessment
 
+
 def load_questionnaire(yaml_path) -> DataProductComplexityAssessment:
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        d =  yaml.safe_load(f)
-        assessment = DataProductComplexityAssessment.from_dict(d["data_product_complexity"])
-        return assessment
-    
-def main():
+    return stream_questionnaire(yaml_path)
+
+
+def load_validated_questionnaire(
+    yaml_path,
+) -> tuple[Optional[DataProductComplexityAssessment], list[str]]:
+    """
+    Validate and load the questionnaire in one pass over the YAML, a
+    section at a time; the questionnaire is None unless it is valid
+    """
+    checker = QuestionnaireValidator()
+    assembler = AssessmentAssembler()
+    try:
+        with open(yaml_path, "r", encoding="utf-8") as f:
+            for path, value in iter_questionnaire(f):
+                # Invalid sections are only reported, never modelled
+                if checker.add(path, value):
+                    assembler.add(path, value)
+    except yaml.YAMLError as e:
+        return None, [f"YAML parsing error: {str(e)}"]
+    valid, errors = checker.result()
+    return (assembler.assessment() if valid else None), errors
+
+
+def output_paths(backends: list[type[Backend]], outputs: list[str]) -> list[str]:
+    """
+    Pair each requested format with an output path. Without --output each
+    format uses its default; one --output shared by several formats keeps
+    its name and takes each format's default suffix. Formats may not share
+    an output path, as they are rendered at the same time.
+    """
+    if not outputs:
+        paths = [b.default_output for b in backends]
+    elif len(outputs) == len(backends):
+        paths = outputs
+    elif len(outputs) == 1:
+        stem = Path(outputs[0])
+        paths = [str(stem.with_suffix(Path(b.default_output).suffix)) for b in backends]
+    else:
+        raise ValueError(
+            f"Got {len(outputs)} output paths for {len(backends)} formats; give one per format or just one."
+        )
+    resolved = [Path(p).resolve() for p in paths]
+    clashes = sorted({p for p, r in zip(paths, resolved) if resolved.count(r) > 1})
+    if clashes:
+        raise ValueError(
+            f"Several formats would be written to {', '.join(clashes)}; give each format its own output path."
+        )
+    return paths
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
-        description="Generate an Excel workbook from a data product complexity YAML specification."
+        description="Generate an Excel workbook from a data product complexity YAML specification.",
+        epilog=commands_epilog(),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("yaml_path", help="Path to the YAML input file.")
-    
+
     parser.add_argument("-f", "--format", default="excel",
-                        help="What to generate (default excel).")
-    parser.add_argument("-o", "--output", default="data_product_complexity_tool.xlsx",
-                        help="Path to the output Excel or Google form app script file.")
+                        help=f"What to generate, comma separated for several of {', '.join(available_backends())} (default excel).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Path to the output Excel or Google form app script file, comma separated to match --format.")
     parser.add_argument("--validate-only", action="store_true",
                         help="Only validate the YAML, do not generate Excel or Google form app script.")
+    parser.add_argument("--cache-dir", nargs="?", const=str(DEFAULT_CACHE_DIR), default=None,
+                        help=f"Reuse earlier renders of the same YAML from this cache (default {DEFAULT_CACHE_DIR}).")
+    parser.add_argument("--profile-memory", nargs="?", type=int, const=DEFAULT_TOP_SITES, default=None,
+                        metavar="TOP_SITES",
+                        help=f"Report traced memory and peak RSS per render stage, with the top allocating sites (default {DEFAULT_TOP_SITES}). Renders formats one at a time and bypasses --cache-dir.")
+    parser.add_argument("--profile-memory-json", default=None,
+                        help="Also write the --profile-memory report as JSON to this path.")
+
+    args = parser.parse_args(argv)
+
+    formats = [f.strip() for f in args.format.split(",") if f.strip()]
+    registered = available_backends()
+    unknown = [f for f in formats if f not in registered]
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+    # Only the selected backends are imported, and only if we'll render
+    backends = {} if args.validate_only else {f: load_backend(f) for f in formats}
+    outputs = [o.strip() for o in args.output.split(",")] if args.output else []
+    if not args.validate_only:
+        try:
+            outputs = output_paths([backends[f] for f in formats], outputs)
+        except ValueError as e:
+            parser.error(str(e))
 
-    args = parser.parse_args()
+    profiler = None
+    if args.profile_memory is not None or args.profile_memory_json:
+        profiler = MemoryProfiler(top_sites=args.profile_memory or DEFAULT_TOP_SITES)
 
-    valid, errors = validate_yaml(args.yaml_path)
+    # Renders are deterministic, so a cached artifact for the same YAML bytes
+    # is what we'd produce anyway, and was validated when it was first made.
+    # A cache hit would leave nothing to profile, though.
+    cache = RenderCache(args.cache_dir) if args.cache_dir and profiler is None else None
+    keys = {}
+    if cache is not None and not args.validate_only:
+        with open(args.yaml_path, "rb") as f:
+            yaml_bytes = f.read()
+        keys = {
+            f: cache_key(yaml_bytes, f, backend_distribution=backend_distribution(f))
+            for f in formats
+        }
+        pending = []
+        for f, output in zip(formats, outputs):
+            if cache.fetch(keys[f], output):
+                print(f"✅ {backends[f].description} copied from cache at: {output}")
+            else:
+                pending.append((f, output))
+        if not pending:
+            return
+        formats, outputs = [list(x) for x in zip(*pending)]
 
-    if not valid:
+    questionnaire, errors = load_validated_questionnaire(args.yaml_path)
+
+    if questionnaire is None:
         print("❌ YAML validation failed:")
         for err in errors:
             print("-", err)
@@ -42,16 +144,35 @@ def main():
     if args.validate_only:
         print("⚠️  --validate-only flag set. Skipping Excel generation.")
         return
-    
-    questionnaire = load_questionnaire(args.yaml_path)
 
-    if args.format == 'excel':
-        ExcelBackend().render(questionnaire, args.output)
-        print(f"✅ Excel workbook created at: {args.output}")
-    
-    if args.format == 'google-form':
-        write_google_form_from_yaml(questionnaire, args.output)
-        print(f"✅ Google form created at: {args.output}")
+    def render(f, output):
+        backends[f]().render(questionnaire, output)
+        if cache is not None:
+            cache.store(keys[f], output)
+
+    if profiler is not None:
+        # tracemalloc is process wide, so concurrent renders would blur
+        # which stage allocated what
+        profiler.start()
+        try:
+            for f, output in zip(formats, outputs):
+                render(f, output)
+                print(f"✅ {backends[f].description} created at: {output}")
+        finally:
+            profiler.stop()
+        for line in profiler.report():
+            print(line)
+        if args.profile_memory_json:
+            profiler.write_json(args.profile_memory_json)
+            print(f"✅ Memory profile written to: {args.profile_memory_json}")
+        return
+
+    # The model is immutable, so every backend can share the one instance
+    with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+        futures = [pool.submit(render, f, output) for f, output in zip(formats, outputs)]
+        for f, output, future in zip(formats, outputs, futures):
+            future.result()
+            print(f"✅ {backends[f].description} created at: {output}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
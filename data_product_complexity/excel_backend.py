@@ -1,4 +1,3 @@
-import pandas as pd
 from openpyxl import Workbook, load_workbook
 from openpyxl.formatting.rule import CellIsRule, ColorScaleRule
 from openpyxl.styles import Font, PatternFill
@@ -7,7 +6,6 @@ from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.chart import BarChart, Reference
 from openpyxl.chart.layout import Layout, ManualLayout
-from openpyxl.cell.cell import Cell
 from .data_product_complexity import (
     DataProductComplexityAssessment,
     Section,
@@ -15,8 +13,33 @@ from .data_product_complexity import (
     QuestionType,
     Backend,
 )
+from .memory_profile import stage
+from .scoring import MAX_BIN, MIN_BIN, NOT_SURE
+from .workbook_layout import (
+    FIXED_TIMESTAMP,
+    SCORE_HELPER_SHEET_NAME,
+    column_letter,
+    data_sheet_name,
+    fitted_width,
+    question_score_formula,
+    score_chart_height,
+    section_score_formula,
+    unique_sheet_name,
+)
 from openpyxl.worksheet.cell_range import CellRange
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+import os
 import re
+import zipfile
+
+QUESTIONS_SHEET_NAME = "Questions"
+# Data sheets have header, title, description and option count rows first
+FIRST_OPTION_ROW = 5
+BOLD = "bold"
+ITALIC = "italic"
+FONTS = {BOLD: Font(bold=True), ITALIC: Font(italic=True)}
 
 
 def apply_font_to_range(wb, range_str, bold=False, italic=False):
@@ -61,30 +84,96 @@ def fit_col_width(worksheet, col: str) -> None:
     worksheet.column_dimensions[col].width = max_length + 2
 
 
+def score_heatmap_rule() -> ColorScaleRule:
+    """
+    Green (1) -> yellow (3) -> red (5) colour scale used wherever 1-5
+    section scores are shown
+    """
+    return ColorScaleRule(
+        start_type="num",
+        start_value=MIN_BIN,
+        start_color="92D050",
+        mid_type="num",
+        mid_value=3,
+        mid_color="FFFF00",
+        end_type="num",
+        end_value=MAX_BIN,
+        end_color="FF0000",
+    )
+
+
+def score_bar_chart(
+    title: str, data_ref: Reference, categories_ref: Reference
+) -> BarChart:
+    """
+    Horizontal bar chart of section scores, styled like the Score sheet's
+    """
+    chart = BarChart()
+    chart.type = "bar"
+    chart.style = 10  # Excel predefined chart style
+    chart.title = title
+    chart.y_axis.title = "Sections"
+    chart.x_axis.title = "Score"
+    chart.y_axis.majorGridlines = None  # Optional: remove vertical gridlines
+    chart.x_axis.majorGridlines = (
+        chart.x_axis.majorGridlines
+    )  # Ensures horizontal gridlines are visible
+
+    chart.add_data(data_ref, titles_from_data=True)
+    chart.set_categories(categories_ref)
+
+    # Layout to roughly center chart (H1 is a good anchor)
+    chart.layout = Layout(
+        manualLayout=ManualLayout(
+            x=0.25,
+            y=0.1,
+            h=0.6,
+            w=0.5,  # Adjust for position and size
+            xMode="factor",
+            yMode="factor",
+            hMode="factor",
+            wMode="factor",
+        )
+    )
+    return chart
+
+
+_CORE_PROPS_DATES = re.compile(
+    rb"(<dcterms:(?:created|modified)[^>]*>)[^<]*(</dcterms:(?:created|modified)>)"
+)
+
+
+def make_xlsx_deterministic(path: str) -> None:
+    """
+    openpyxl stamps the save time into docProps/core.xml and every zip
+    entry; rewrite the package with FIXED_TIMESTAMP in both places.
+    """
+    with zipfile.ZipFile(path) as zin:
+        entries = [(info.filename, zin.read(info.filename)) for info in zin.infolist()]
+
+    fixed_iso = FIXED_TIMESTAMP.strftime("%Y-%m-%dT%H:%M:%SZ").encode("ascii")
+    tmp_path = f"{path}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for name, content in entries:
+            if name == "docProps/core.xml":
+                content = _CORE_PROPS_DATES.sub(rb"\g<1>" + fixed_iso + rb"\g<2>", content)
+            info = zipfile.ZipInfo(name, date_time=FIXED_TIMESTAMP.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            zout.writestr(info, content)
+    os.replace(tmp_path, path)
+
+
 class CellLocationHelper:
     q_to_options_range: dict[Question, str] = {}
     q_to_options_range_with_score: dict[Question, str] = {}
     q_to_questionnaire_cell: dict[Question, str] = {}
 
-    def notify_question_data_pos(self, question: Question, start_cell: Cell):
-        num_options = len(question.options)
-        ws_name = start_cell.parent.title
-        start_cell_for_options = f"{start_cell.column_letter}{start_cell.row}"
-        end_cell_for_options = (
-            f"{start_cell.column_letter}{start_cell.row+num_options-1}"
-        )
-        end_call_for_scores = (
-            f"{get_column_letter(start_cell.column+1)}{start_cell.row+num_options-1}"
-        )
-        self.q_to_options_range[question.question_id] = (
-            f"'{ws_name}'!{start_cell_for_options}:{end_cell_for_options}"
-        )
-        self.q_to_options_range_with_score[question.question_id] = (
-            f"'{ws_name}'!{start_cell_for_options}:{end_call_for_scores}"
-        )
-
-    def notify_question_dropdown_pos(self, question: Question, cell: Cell):
-        self.q_to_questionnaire_cell[question.question_id] = get_full_cell_address(cell)
+    def notify_section_layout(self, layout: "SectionLayout"):
+        self.q_to_options_range.update(layout.options_ranges)
+        self.q_to_options_range_with_score.update(layout.options_and_scores_ranges)
+        for question_id, coordinate, _, _ in layout.dropdowns:
+            self.q_to_questionnaire_cell[question_id] = f"{QUESTIONS_SHEET_NAME}!{coordinate}"
 
     def get_dropdown_pos_for_question(self, question: Question) -> str:
         return self.q_to_questionnaire_cell[question.question_id]
@@ -96,11 +185,150 @@ class CellLocationHelper:
         return self.q_to_options_range[question.question_id]
 
 
-def get_full_cell_address(cell):
+@dataclass(frozen=True)
+class SectionLayout:
     """
-    Get the 'SheetName'!$A$6 form of a cell address
+    One scorable section's share of the workbook: its data sheet rows, its
+    rows and dropdowns on the Questions sheet, column widths and the ranges
+    its score formulas look up. Worked out from the model alone, so the
+    sheets can be written without reading any cells back from openpyxl.
     """
-    return f"{cell.parent.title}!{cell.coordinate}"
+
+    data_sheet_name: str
+    data_rows: list[list[Any]]
+    data_widths: list[int]
+    options_ranges: dict[str, str]
+    options_and_scores_ranges: dict[str, str]
+    # (row, column, value, font) for the Questions sheet, in the order
+    # they are written so fonts are registered in the same order every time
+    question_cells: list[tuple[int, int, Any, Optional[str]]]
+    # (question_id, answer cell, list validation formula, default answer)
+    dropdowns: list[tuple[str, str, str, Optional[str]]]
+    # Longest value this section puts in each Questions sheet column
+    question_value_lengths: dict[int, int]
+    question_rows: int
+
+
+def layout_section(
+    section: Section, sheet_name: str, first_row: int, section_number: int
+) -> SectionLayout:
+    """
+    Lay out `section` with its data on sheet `sheet_name` and its questions
+    from `first_row` of the Questions sheet, numbered `section_number`.
+
+    The data sheet has the questions and options laid out like:
+
+    |             | Question_1 | |  Question_2 | .... | Question_n |
+    | Title       | xxxx       | |xxxx       | .... | ...        |
+    | Description | ....
+    | NumOptions  | ....
+    | Option_1    | ...  |  score |
+    | Option_2    | ...  | score |
+    | ...
+    | Option_n.   | ...
+
+    and the rest of the workbook is calculated from these hidden data
+    sheets (DataValidations for dropdowns, understanding how many options
+    in each question, how many questions in a section etc.)
+    """
+    questions = section.questions
+
+    headers = [""]
+    titles = ["Title"]
+    num_options_row = ["NumOptions"]
+    descriptions = ["Description"]
+    for q in questions:
+        headers.append(f"Question_{q.question_id}")
+        headers.append("")
+        titles.append(q.question_text)
+        titles.append("")
+        descriptions.append(q.description)
+        descriptions.append("")
+        num_options_row.append(len(q.options))
+        num_options_row.append("score")
+    option_rows = []
+    for i in range(max(len(q.options) for q in questions)):
+        row = [f"Option_{i}"]
+        for q in questions:
+            opts = q.options
+            row.append(opts[i].option_text if i < len(opts) else "")
+            row.append(opts[i].score if i < len(opts) else "")
+        option_rows.append(row)
+    data_rows = [headers, titles, descriptions, num_options_row] + option_rows
+    # As fit_col_width on every column but the last score column
+    data_widths = [
+        fitted_width(row[col] for row in data_rows) for col in range(len(questions) * 2)
+    ]
+
+    options_ranges = {}
+    options_and_scores_ranges = {}
+    for idx, q in enumerate(questions, start=1):
+        options_col = column_letter(idx * 2)
+        last_row = FIRST_OPTION_ROW + len(q.options) - 1
+        options_ranges[q.question_id] = (
+            f"'{sheet_name}'!{options_col}{FIRST_OPTION_ROW}:{options_col}{last_row}"
+        )
+        options_and_scores_ranges[q.question_id] = (
+            f"'{sheet_name}'!{options_col}{FIRST_OPTION_ROW}:{column_letter(idx * 2 + 1)}{last_row}"
+        )
+
+    columns = QuestionnaireSheetBuilder.col_indexes
+    # Section heading, then a question and its description per two rows
+    cells = [
+        (first_row, columns["title"], section.title, BOLD),
+        (first_row, columns["q_num"], str(section_number), BOLD),
+    ]
+    dropdowns = []
+    row = first_row + 1
+    for question_num, q in enumerate(questions, start=1):
+        cells.append((row, columns["q_num"], f"{section_number}.{question_num}", None))
+        cells.append((row, columns["title"], q.question_text, None))
+        cells.append((row + 1, columns["description"], q.description, ITALIC))
+        if q.options:
+            # Default to Not sure option
+            default = NOT_SURE if NOT_SURE in [o.option_text for o in q.options] else None
+            dropdowns.append((
+                q.question_id,
+                f"{column_letter(columns['options'])}{row}",
+                f"={options_ranges[q.question_id]}",
+                default,
+            ))
+        row += 2
+
+    lengths: dict[int, int] = {}
+    values = [(column, value) for _, column, value, _ in cells]
+    values += [(columns["options"], default) for _, _, _, default in dropdowns]
+    for column, value in values:
+        if value:
+            lengths[column] = max(lengths.get(column, 0), len(str(value)))
+
+    return SectionLayout(
+        data_sheet_name=sheet_name,
+        data_rows=data_rows,
+        data_widths=data_widths,
+        options_ranges=options_ranges,
+        options_and_scores_ranges=options_and_scores_ranges,
+        question_cells=cells,
+        dropdowns=dropdowns,
+        question_value_lengths=lengths,
+        question_rows=row - first_row + 1,  # and a blank row after
+    )
+
+
+def layout_sections(product: DataProductComplexityAssessment) -> list[SectionLayout]:
+    """
+    SectionLayout for every scorable section, in order
+    """
+    layouts = []
+    sheet_names: list[str] = []
+    # The Data Product Information heading and a blank row come first
+    row = 3
+    for section_number, section in enumerate(product.scorable_sections, start=2):
+        # Numbered where titles clash, the same in both Excel backends
+        sheet_names.append(unique_sheet_name(sheet_names, data_sheet_name(section.title)))
+        layouts.append(layout_section(section, sheet_names[-1], row, section_number))
+        row += layouts[-1].question_rows
+    return layouts
 
 
 class DataSheetBuilder:
@@ -110,97 +338,63 @@ class DataSheetBuilder:
     def __init__(self, cell_location_helper: CellLocationHelper):
         self._cell_location_helper = cell_location_helper
 
-    @staticmethod
-    def _sanitize_sheet_name(name):
-        """Convert to lowercase and keep only _0-9a-zA-Z"""
-        base = "_data_" + re.sub(r"[^0-9a-zA-Z_]", "", name.replace(" ", "_").lower())
-        return base[:31]  # Excel sheet name limit
-
-    def _populate_data_sheet(self, ws: Worksheet, section: Section, index: int):
+    def _populate_data_sheet(self, ws: Worksheet, layout: SectionLayout):
         """
-        For each of the categories we create a hidden _data_categoryname tab that has the questions and options laid
-        out like:
-
-        |             | Question_1 | |  Question_2 | .... | Question_n |
-        | Title       | xxxx       | |xxxx       | .... | ...        |
-        | Description | ....
-        | NumOptions  | ....
-        | Option_1    | ...  |  score |
-        | Option_2    | ...  | score |
-        | ...
-        | Option_n.   | ...
-
-        After this we set up the rest of the Excel file to calculate everything from the
-        hidden data tabs (DataValidations for dropdowns, understanding how many options in each question,
-        how many questions in a section etc.)
+        Write a hidden _data_categoryname sheet laid out by layout_section
         """
-        sheet_name = ws.title
-        category = section.title
-        questions = section.questions
-        headers = [""]
-        titles = ["Title"]
-        num_options_row = ["NumOptions"]
-        descriptions = ["Description"] 
-        for q in questions:
-            headers.append(f"Question_{q.question_id}")
-            headers.append("")
-            titles.append(q.question_text)
-            titles.append("")
-       
-            descriptions.append(q.description)
-            descriptions.append("")
-            num_options_row.append(len(q.options))
-            num_options_row.append("score")
-        max_options = max(len(q.options) for q in questions)
-        option_rows = []
-
-        for i in range(max_options):
-            row = [f"Option_{i}"]
-            for q in questions:
-                opts = q.options
-                row.append(opts[i].option_text if i < len(opts) else "")
-                row.append(opts[i].score if i < len(opts) else "")
-            option_rows.append(row)
-
-        ws.append(headers)
-        ws.append(titles)
-        ws.append(descriptions)
-        ws.append(num_options_row)
-        for row in option_rows:
+        for row in layout.data_rows:
             ws.append(row)
-            
-        for idx, q in enumerate(section.questions, start=1):
-            self._cell_location_helper.notify_question_data_pos(
-                question=q, start_cell=ws.cell(row=5, column=idx*2)
-            )
+        self._cell_location_helper.notify_section_layout(layout)
 
-        # apply_font_to_range(wb, f"{sheet_name}!A1:A{max_options+4}", bold=True)
-        # apply_font_to_range(
-        #     wb, f"{sheet_name}!A1:{get_column_letter(num_questions+1)}1", bold=True
-        # )
-        for col in [get_column_letter(x) for x in range(1, len(section.questions)*2 + 1)]:
-            fit_col_width(ws, col)
-
-    def build(self, wb: Workbook, product: DataProductComplexityAssessment):
-        for section_index, section in enumerate(product.scorable_sections):
-            ws_data = wb.create_sheet(
-                title=DataSheetBuilder._sanitize_sheet_name(section.title)
-            )
+        for col, width in enumerate(layout.data_widths, start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+
+    def build(
+        self,
+        wb: Workbook,
+        product: DataProductComplexityAssessment,
+        layouts: Optional[list[SectionLayout]] = None,
+    ):
+        for layout in layouts if layouts is not None else layout_sections(product):
+            ws_data = wb.create_sheet(title=layout.data_sheet_name)
             ws_data.sheet_state = "hidden"
-            self._populate_data_sheet(ws_data, section, section_index)
+            self._populate_data_sheet(ws_data, layout)
 
 
 class ScoreSheetBuilder:
+    """
+    The visible Score sheet holds one row per section with its 1-5 score and
+    the chart. The per-question weighted scores that feed it live on a hidden
+    helper sheet, one row per question, so each section's total is a SUM over
+    a contiguous range of rows however many sections and questions there are:
+
+    _score_helper:
+    | Question | Weighted score               |
+    | 1.1      | =VLOOKUP(answer, options...) |
+    | 1.2      | ...                          |
+    | 2.1      | ...                          |
+    """
+
     _ws: Worksheet
+    _helper_ws: Worksheet
     _cell_location_helper: CellLocationHelper
 
-    def __init__(self, ws: Worksheet, cell_location_helper: CellLocationHelper):
+    HELPER_SHEET_NAME = SCORE_HELPER_SHEET_NAME
+
+    def __init__(
+        self,
+        ws: Worksheet,
+        cell_location_helper: CellLocationHelper,
+        helper_ws: Worksheet,
+    ):
         self._ws = ws
         self._cell_location_helper = cell_location_helper
+        self._helper_ws = helper_ws
 
     def _formula_for_question(self, question: Question) -> str:
         # For each question
-        #    Use the score for each answer based on the lookup 
+        #    Use the score for each answer based on the lookup
+        #    (CheckBox answers combine their selections' scores by the question's rule)
         #    Weight each question
 
         cell_addr = self._cell_location_helper.get_dropdown_pos_for_question(question)
@@ -209,32 +403,27 @@ class ScoreSheetBuilder:
                 question
             )
         )
-        return f"=VLOOKUP({cell_addr}, {options_and_scores_range},2,FALSE)*{question.weight}"
+        return question_score_formula(question, cell_addr, options_and_scores_range)
     
-    def _formula_for_section(self, section: Section, cursor_row: int) -> str:
+    def _formula_for_section(self, section: Section, first_helper_row: int) -> str:
         # For each question, we've already worked out in _formula_for_question:
         #    Use the score for each answer based on the lookup 
         #    Weight each question
-        #    Answers start in col 3
+        #    One helper row per question, starting at first_helper_row
         # 
         # Now we:
         # Get the total
-        # SUM(row3:row3+len(section.questions))
+        # SUM(helper!B{first}:B{first+len(section.questions)-1})
         num_questions = len(section.questions)
-        sum_range = f"C{cursor_row}:{get_column_letter(3+num_questions)}{cursor_row}"
+        sum_range = (
+            f"'{self._helper_ws.title}'!$B${first_helper_row}"
+            f":$B${first_helper_row + num_questions - 1}"
+        )
         # Normalise the total between 0 and 1
         #   xxx/(sum(max_option_score for each question*question_weight) - sum(min_option_score for each question * question_weight))
-        sum_weighted_min_vals = 0.
-        sum_weighted_max_vals = 0.
-        for question in section.questions:
-            min_value_for_question =  min(o.score for o in question.options) * question.weight
-            max_value_for_question = max(o.score for o in question.options) * question.weight
-            sum_weighted_min_vals += min_value_for_question 
-            sum_weighted_max_vals += max_value_for_question
-        divisor = sum_weighted_max_vals - sum_weighted_min_vals
         # Bin into 1-5 int range
         #   INT(sum_range/{divisor} * 5) + 1
-        formula = f"=INT((SUM({sum_range})- {sum_weighted_min_vals})/{divisor} * 4.999) + 1"
+        formula = section_score_formula(section, sum_range)
         print(formula)
         return formula
 
@@ -245,68 +434,33 @@ class ScoreSheetBuilder:
         self._ws.cell(row=1, column=2, value="Final Score (1–5)")
         self._ws.cell(row=1, column=1).font = Font(bold=True)
         self._ws.cell(row=1, column=2).font = Font(bold=True)
+        self._helper_ws.append(["Question", "Weighted score"])
         
         row = 2  # Start from row 2 to leave space for headers
+        helper_row = 2
 
         for section in product.scorable_sections:
                 self._ws.cell(row=row, column=1, value=section.title)
-                for qidx, question in enumerate(section.questions):
-                    tmp_cell = self._ws.cell(row=row, column=3 + qidx)
-                    tmp_cell.value = self._formula_for_question(question)
-                self._ws.cell(row=row, column=2).value = self._formula_for_section(section, row)
+                for question in section.questions:
+                    self._helper_ws.append(
+                        [question.question_id, self._formula_for_question(question)]
+                    )
+                self._ws.cell(row=row, column=2).value = self._formula_for_section(section, helper_row)
+                helper_row += len(section.questions)
                 row += 1
+        last_row = row - 1
 
         # Apply heatmap conditional formatting to column B
-        heatmap = ColorScaleRule(
-            start_type="num",
-            start_value=1,
-            start_color="92D050",
-            mid_type="num",
-            mid_value=3,
-            mid_color="FFFF00",
-            end_type="num",
-            end_value=5,
-            end_color="FF0000",
-        )
-        self._ws.conditional_formatting.add(f"B2:B{row - 1}", heatmap)
+        self._ws.conditional_formatting.add(f"B2:B{last_row}", score_heatmap_rule())
 
         fit_col_width(worksheet=self._ws, col="A")
         fit_col_width(worksheet=self._ws, col="B")
 
-        for col_letter in [get_column_letter(x) for x in range(3, 30)]:
-            self._ws.column_dimensions[col_letter].hidden = True
-
-        chart = BarChart()
-        chart.type = "bar"
-        chart.style = 10  # Excel predefined chart style
-        chart.title = "Data Product Complexity Scores"
-        chart.y_axis.title = "Sections"
-        chart.x_axis.title = "Score"
-        chart.y_axis.majorGridlines = None  # Optional: remove vertical gridlines
-        chart.x_axis.majorGridlines = (
-            chart.x_axis.majorGridlines
-        )  # Ensures horizontal gridlines are visible
-
         # Reference data
-        data_ref = Reference(self._ws, min_col=2, min_row=1, max_row=8)
-        categories_ref = Reference(self._ws, min_col=1, min_row=2, max_row=8)
-
-        chart.add_data(data_ref, titles_from_data=True)
-        chart.set_categories(categories_ref)
-
-        # Layout to roughly center chart (H1 is a good anchor)
-        chart.layout = Layout(
-            manualLayout=ManualLayout(
-                x=0.25,
-                y=0.1,
-                h=0.6,
-                w=0.5,  # Adjust for position and size
-                xMode="factor",
-                yMode="factor",
-                hMode="factor",
-                wMode="factor",
-            )
-        )
+        data_ref = Reference(self._ws, min_col=2, min_row=1, max_row=last_row)
+        categories_ref = Reference(self._ws, min_col=1, min_row=2, max_row=last_row)
+        chart = score_bar_chart("Data Product Complexity Scores", data_ref, categories_ref)
+        chart.height = score_chart_height(len(product.scorable_sections))
 
         # === Step 3: Insert Chart into Sheet ===
         self._ws.add_chart(chart, "H1")  # Center-ish position
@@ -322,55 +476,6 @@ class QuestionnaireSheetBuilder:
         self._ws = ws
         self._clh = cell_location_helper
 
-    def _render_dropdown_question(
-        self, cursor_row: int, question: Question, section_num: int, question_num: int
-    ) -> int:
-        """
-        Return number of rows added
-        """
-        # assert question.question_type == QuestionType.DROPDOWN
-
-        # Add question number
-        q_num = f"{section_num}.{question_num}"
-        self._ws.cell(row=cursor_row, column=self.col_indexes["q_num"], value=q_num)
-
-        # Add question title
-        self._ws.cell(
-            row=cursor_row,
-            column=self.col_indexes["title"],
-            value=question.question_text,
-        )
-        # Add description in row below
-        d_cell = self._ws.cell(
-            row=cursor_row + 1,
-            column=self.col_indexes["description"],
-            value=question.description,
-        )
-        d_cell.font = Font(italic=True)
-
-        # Add dropdown of options
-        options = question.options
-        if options:
-            dv = DataValidation(
-                type="list",
-                formula1=f"={self._clh.get_options_range_for_question(question=question)}",
-                showDropDown=False,
-            )
-            dropdown_cell = self._ws.cell(
-                row=cursor_row, column=self.col_indexes["options"]
-            )        
-            self._clh.notify_question_dropdown_pos(question=question, cell=dropdown_cell)
-
-            self._ws.add_data_validation(dv)
-            dv.add(dropdown_cell)
-
-            # Default to Not sure option
-            if "Not sure" in [o.option_text for o in options]:
-                dropdown_cell.value = "Not sure"
-        
-        
-        return 2
-
     def _render_section_heading(
         self, section: Section, row: int, section_number: 1
     ) -> int:
@@ -379,12 +484,10 @@ class QuestionnaireSheetBuilder:
         """
         self._ws.cell(
             row=row, column=self.col_indexes["title"], value=f"{section.title}"
-        )
-        self._ws.cell(row=row, column=self.col_indexes["title"]).font = Font(bold=True)
-        q_num_cell = self._ws.cell(
+        ).font = FONTS[BOLD]
+        self._ws.cell(
             row=row, column=self.col_indexes["q_num"], value=str(section_number)
-        )
-        q_num_cell.font = Font(bold=True)
+        ).font = FONTS[BOLD]
         return 1
 
     def _render_data_product_info_section(
@@ -399,25 +502,31 @@ class QuestionnaireSheetBuilder:
         rows_added = self._render_section_heading(section, cursor_row, 1)
         return rows_added + 1  # Add a blank row after
 
-    def _render_scorable_section(
-        self, section: Section, cursor_row: int, section_number: int
-    ) -> int:
+    def _render_scorable_section(self, layout: SectionLayout) -> int:
         """
-        Populate a "scorable" section
+        Write a section laid out by layout_section: its heading, then each
+        question with its description below and a dropdown of its options
 
         return: the number of rows added
         """
-        rows_added = self._render_section_heading(section, cursor_row, section_number)
-        for question_num, question in enumerate(section.questions, start=1):
-            rows_added += self._render_dropdown_question(
-                question=question,
-                section_num=section_number,
-                question_num=question_num,
-                cursor_row=cursor_row + rows_added,
-            )
-        return rows_added + 1  # Add a blank row after
-
-    def build(self, product: DataProductComplexityAssessment) -> None:
+        for row, column, value, font in layout.question_cells:
+            cell = self._ws.cell(row=row, column=column, value=value)
+            if font:
+                cell.font = FONTS[font]
+        for question_id, coordinate, formula, default in layout.dropdowns:
+            dv = DataValidation(type="list", formula1=formula, showDropDown=False)
+            dropdown_cell = self._ws[coordinate]
+            self._ws.add_data_validation(dv)
+            dv.add(dropdown_cell)
+            dropdown_cell.value = default
+        self._clh.notify_section_layout(layout)
+        return layout.question_rows
+
+    def build(
+        self,
+        product: DataProductComplexityAssessment,
+        layouts: Optional[list[SectionLayout]] = None,
+    ) -> None:
         """
         Populates the questions data from the questionnaire yaml,
         setting up the DataValidation (dropdowns) of options for each
@@ -427,15 +536,22 @@ class QuestionnaireSheetBuilder:
         1.1 | Question 1 title | Cell with Options in dropdown
             | Question 1 description
         """
+        if layouts is None:
+            layouts = layout_sections(product)
         cursor_row = 1
         cursor_row += self._render_data_product_info_section(
             product.data_product_info, cursor_row
         )
+        # As fit_col_width, from the values written rather than the cells
+        lengths = {
+            self.col_indexes["q_num"]: 1,
+            self.col_indexes["title"]: len(product.data_product_info.title),
+        }
 
-        for section_index, section in enumerate(product.scorable_sections, start=1):
-            cursor_row += self._render_scorable_section(
-                section=section, cursor_row=cursor_row, section_number=section_index + 1
-            )
+        for layout in layouts:
+            cursor_row += self._render_scorable_section(layout)
+            for column, length in layout.question_value_lengths.items():
+                lengths[column] = max(lengths.get(column, 0), length)
 
         not_sure_fill = PatternFill(
             start_color="FFFFCC", end_color="FFFFCC", fill_type="solid"
@@ -446,12 +562,14 @@ class QuestionnaireSheetBuilder:
             CellIsRule(operator="equal", formula=['"Not sure"'], fill=not_sure_fill),
         )
 
-        fit_col_width(worksheet=self._ws, col="A")
-        fit_col_width(worksheet=self._ws, col="B")
-        fit_col_width(worksheet=self._ws, col="C")
+        for column in sorted(set(self.col_indexes.values())):
+            self._ws.column_dimensions[get_column_letter(column)].width = lengths.get(column, 0) + 2
 
 
 class ExcelBackend(Backend):
+    default_output = "data_product_complexity_tool.xlsx"
+    description = "Excel workbook"
+
     @staticmethod
     def _insert_new_sheet_at_pos(wb: Workbook, sheet_name: str, pos=1) -> Worksheet:
         ws = wb.create_sheet(sheet_name)
@@ -472,21 +590,35 @@ class ExcelBackend(Backend):
         wb = Workbook()
         clh = CellLocationHelper()
         data_sheets = DataSheetBuilder(clh)
-        data_sheets.build(wb, data)
+        with stage("layout sections"):
+            layouts = layout_sections(data)
+        with stage("DataSheetBuilder"):
+            data_sheets.build(wb, data, layouts)
 
         question_sheet_builder = QuestionnaireSheetBuilder(
             ExcelBackend._insert_new_sheet_at_pos(wb, "Questions", 1), clh
         )
-        question_sheet_builder.build(data)
+        with stage("QuestionnaireSheetBuilder"):
+            question_sheet_builder.build(data, layouts)
 
+        score_helper_ws = wb.create_sheet(ScoreSheetBuilder.HELPER_SHEET_NAME)
+        score_helper_ws.sheet_state = "hidden"
         score_sheet_builder = ScoreSheetBuilder(
-            ExcelBackend._insert_new_sheet_at_pos(wb, "Score", 2), clh
+            ExcelBackend._insert_new_sheet_at_pos(wb, "Score", 2), clh, score_helper_ws
         )
-        score_sheet_builder.build(data)
+        with stage("ScoreSheetBuilder"):
+            score_sheet_builder.build(data)
 
         del wb["Sheet"]
-        wb.save("tmp_" + output_path)
-
-        wb = load_workbook("tmp_" + output_path, data_only=False)
-        ExcelBackend._strip_ampersands_from_formulae(wb)
-        wb.save(output_path)
+        output = Path(output_path)
+        tmp_path = output.with_name("tmp_" + output.name)
+        with stage("save"):
+            wb.save(tmp_path)
+        del wb
+
+        with stage("reload and save"):
+            wb = load_workbook(tmp_path, data_only=False)
+            ExcelBackend._strip_ampersands_from_formulae(wb)
+            wb.save(output_path)
+        os.remove(tmp_path)
+        make_xlsx_deterministic(output_path)
@@ -16,6 +16,8 @@ import textwrap
 from typing import Dict, Any, List
 from dataclasses import dataclass
 
+from .data_product_complexity import Backend, DataProductComplexityAssessment
+
 
 @dataclass
 class Question:
@@ -46,24 +48,58 @@ def column_reference(index: int) -> str:
     return ref
 
 
+def form_sections(assessment: DataProductComplexityAssessment) -> List:
+    """
+    The sections in the order they appear in the form (and so in the
+    response sheet's columns)
+    """
+    return [assessment.data_product_info] + list(assessment.scorable_sections)
+
+
+def form_config(assessment: DataProductComplexityAssessment) -> Dict[str, Any]:
+    """
+    The questionnaire in the shape the generated Apps Script expects,
+    with options reduced to their text
+    """
+    return {
+        "formTitle": assessment.title,
+        "sections": [
+            {
+                "section": s.title,
+                "questions": [
+                    {
+                        "question": q.question_text,
+                        "description": q.description,
+                        "questionType": q.question_type.value,
+                        "options": [o.option_text for o in q.options],
+                    }
+                    for q in s.questions
+                ],
+            }
+            for s in form_sections(assessment)
+        ],
+    }
+
+
 REFERENCE_SHEET_COL_OFFSET = 1
 RESPONSE_SHEET_COL_OFFSET = 1
 
 
 class QuestionsConfiguration(object):
 
-    def __init__(self, questionaire_yaml_dict: Dict[str, Any]):
-        self._questionaire_yaml_dict = questionaire_yaml_dict
+    def __init__(self, assessment: DataProductComplexityAssessment):
+        self._assessment = assessment
         self._sections: Dict[int, Section] = {}
-        for i, s in enumerate(
-            questionaire_yaml_dict["data_product_complexity"]["sections"], 1
-        ):
+        for i, s in enumerate(form_sections(assessment), 1):
             questions = {
-                j: Question(question=q["question"], options=q.get("options", []))
-                for j, q in enumerate(s["questions"], 1)
+                j: Question(
+                    question=q.question_text,
+                    options=[o.option_text for o in q.options],
+                )
+                for j, q in enumerate(s.questions, 1)
             }
             self._sections[i] = Section(
-                section_name=s["section"], section_number=i, questions=questions
+                section_name=s.title, section_number=i, questions=questions
             )
 
     def sections(self) -> List[Section]:
@@ -75,6 +111,17 @@ class QuestionsConfiguration(object):
             + question
         )
 
+    def response_columns(self) -> Dict[str, int]:
+        """
+        The 0-based column holding each question's answer in the
+        'Form Responses 1' sheet (and its CSV export), keyed by question_id
+        """
+        return {
+            q.question_id: RESPONSE_SHEET_COL_OFFSET + self.get_index_for(i, j) - 1
+            for i, s in enumerate(form_sections(self._assessment), 1)
+            for j, q in enumerate(s.questions, 1)
+        }
+
     def get_options_range_ref(self, section: int, question: int) -> str:
         col_ref = column_reference(
             REFERENCE_SHEET_COL_OFFSET + self.get_index_for(section, question)
@@ -133,21 +180,21 @@ def to_js(obj):
         raise TypeError(f"Unsupported type: {type(obj)}")
 
 
-def generate_reference_sheet_js(config):
+def generate_reference_sheet_js(assessment: DataProductComplexityAssessment):
     """
     Generate the Apps Script code (as a string) that creates a
-    'Question Options Reference' sheet from the given questionnaire config.
+    'Question Options Reference' sheet from the given questionnaire.
     """
     # 1) Flatten questions
     flat = []
-    for s_idx, sec in enumerate(config["data_product_complexity"]["sections"], start=2):
-        for q_idx, q in enumerate(sec["questions"], start=1):
+    for s_idx, sec in enumerate(form_sections(assessment), start=2):
+        for q_idx, q in enumerate(sec.questions, start=1):
             flat.append(
                 {
                     "section": s_idx,
                     "questionNum": q_idx,
-                    "title": q["question"],
-                    "options": q.get("options", []),
+                    "title": q.question_text,
+                    "options": [o.option_text for o in q.options],
                 }
             )
     # 2) Determine maximum number of options
@@ -185,7 +232,7 @@ def generate_reference_sheet_js(config):
     return textwrap.dedent(snippet).strip()
 
 
-def generate_section_scores_js(config):
+def generate_section_scores_js(assessment: DataProductComplexityAssessment):
     """
     Returns a JS snippet string that:
       - Opens "Form Responses 1"
@@ -199,7 +246,7 @@ def generate_section_scores_js(config):
           - rawRank   = MATCH(response, OFFSET(Ref!$A$5,1,colIndex-1,numOpts,1), FALSE)
           - score     = IF(response="Not sure",0.5,(rawRank-1)/numOpts)
     """
-    qc = QuestionsConfiguration(config)
+    qc = QuestionsConfiguration(assessment)
 
     rows = []
     rows.append(
@@ -236,17 +283,17 @@ def generate_section_scores_js(config):
     return textwrap.dedent(snippet).strip()
 
 
-def generate_script(config):
+def generate_script(assessment: DataProductComplexityAssessment):
     """
     Returns the full Apps Script source as a string,
     injecting the JSON-ified config, marking all questions required,
     and adding a summary sheet with section score formulas.
     """
-    js_config = to_js(config["data_product_complexity"])
+    js_config = to_js(form_config(assessment))
     respSheetName = "Form Responses 1"
 
-    reference_sheet_js = generate_reference_sheet_js(config)
-    scoring_sheet_js = generate_section_scores_js(config)
+    reference_sheet_js = generate_reference_sheet_js(assessment)
+    scoring_sheet_js = generate_section_scores_js(assessment)
 
     template = f"""
     /**
@@ -307,9 +354,17 @@ def generate_script(config):
     return textwrap.dedent(template).strip()
 
 
-def write_google_form_from_yaml(questionair_yaml: Dict[str, Any], output_path: str):
+def write_google_form(assessment: DataProductComplexityAssessment, output_path: str):
 
-    script = generate_script(questionair_yaml)
+    script = generate_script(assessment)
 
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(script + "\n")
+
+
+class GoogleFormBackend(Backend):
+    default_output = "data_product_complexity_form.gs"
+    description = "Google form"
+
+    def render(self, data: DataProductComplexityAssessment, output_path: str) -> None:
+        write_google_form(data, output_path)
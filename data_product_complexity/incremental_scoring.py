@@ -0,0 +1,323 @@
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .google_form_backend import QuestionsConfiguration
+from .responses import RESPONSES_CHUNK_SIZE, all_questions
+from .scoring import AnswerSet, product_name_question, score_answer_sets
+
+CHECKPOINT_VERSION = 2
+HASH_BLOCK_SIZE = 1024 * 1024
+ROW_DIGEST_SIZE = 8
+
+
+@dataclass
+class Checkpoint:
+    """
+    How far a response export has been scored: the number of rows and
+    bytes scored, the last scored timestamp, a hash of those bytes and of
+    each row (to find edited rows), and the size and hash of the output
+    written from them
+    """
+
+    questionnaire_hash: str
+    rows: int = 0
+    byte_offset: int = 0
+    last_timestamp: Optional[str] = None
+    prefix_hash: str = ""
+    header_hash: str = ""
+    row_hashes: list[str] = field(default_factory=list)
+    output_bytes: int = 0
+    output_hash: str = ""
+    version: int = CHECKPOINT_VERSION
+
+    @staticmethod
+    def load(path: str) -> Optional["Checkpoint"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        if data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return Checkpoint(**data)
+
+    def save(self, path: str) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+
+@dataclass
+class IncrementalRun:
+    new_rows: int = 0
+    rescored_rows: list[int] = field(default_factory=list)
+    full_rescore_reason: Optional[str] = None
+
+
+def _row_digest(record: bytes) -> str:
+    return hashlib.blake2b(record, digest_size=ROW_DIGEST_SIZE).hexdigest()
+
+
+def iter_csv_records(f: BinaryIO) -> Iterator[bytes]:
+    """
+    The raw bytes of each CSV record. A quoted field may span lines, so a
+    record ends at the first line end where its quotes are balanced.
+    """
+    pending = b""
+    for line in f:
+        pending += line
+        if pending.count(b'"') % 2 == 0:
+            yield pending
+            pending = b""
+    if pending:
+        yield pending
+
+
+def _parse_record(record: bytes) -> list[str]:
+    return next(csv.reader(io.StringIO(record.decode("utf-8-sig"))), [])
+
+
+def _hash_prefix(f: BinaryIO, size: int) -> str:
+    digest = hashlib.sha256()
+    f.seek(0)
+    remaining = size
+    while remaining > 0:
+        block = f.read(min(HASH_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _hash_output(path: str, size: int) -> str:
+    with open(path, "rb") as f:
+        return _hash_prefix(f, size)
+
+
+class ResponseRowScorer:
+    """
+    Turns rows of a 'Form Responses 1' export into output rows of section
+    scores, with columns found via QuestionsConfiguration
+    """
+
+    def __init__(self, assessment: DataProductComplexityAssessment):
+        self._assessment = assessment
+        self._columns = QuestionsConfiguration(assessment).response_columns()
+        self._questions = all_questions(assessment)
+        name_question = product_name_question(assessment)
+        self._name_id = name_question.question_id if name_question else None
+
+    @property
+    def output_header(self) -> list[str]:
+        return ["row", "product_name", "submitted_at"] + [
+            s.title for s in self._assessment.scorable_sections
+        ]
+
+    def check_header(self, header: list[str], path: str) -> None:
+        for question in self._questions:
+            column = self._columns[question.question_id]
+            found = header[column] if column < len(header) else None
+            if found != question.question_text:
+                raise ValueError(
+                    f"{path}: column {column + 1} is {found!r}, expected question "
+                    f"{question.question_id} '{question.question_text}'"
+                )
+
+    def _answer_set(self, values: list[str]) -> AnswerSet:
+        answers = {
+            qid: values[col] if col < len(values) else ""
+            for qid, col in self._columns.items()
+        }
+        return AnswerSet(
+            product_name=answers.get(self._name_id, "") if self._name_id else "",
+            answers=answers,
+            submitted_at=(values[0] if values else "") or None,
+        )
+
+    def score(self, rows: Iterable[tuple[int, list[str]]]) -> Iterator[list]:
+        """Output rows for (row number, values) pairs, a batch at a time"""
+        rows = iter(rows)
+        while batch := list(islice(rows, RESPONSES_CHUNK_SIZE)):
+            answer_sets = [self._answer_set(values) for _, values in batch]
+            bins = score_answer_sets(self._assessment, answer_sets)
+            for (row_no, _), answer_set, row_bins in zip(batch, answer_sets, bins.tolist()):
+                yield [row_no, answer_set.product_name, answer_set.submitted_at or ""] + row_bins
+
+
+def _write_rows(path: str, rows: Iterable[list], header: Optional[list[str]], mode: str) -> None:
+    with open(path, mode, encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _replace_output_rows(path: str, replacements: dict[int, list]) -> None:
+    """Rewrite the output with the rows whose 'row' number is in `replacements` swapped"""
+    tmp = f"{path}.tmp"
+    with open(path, "r", encoding="utf-8", newline="") as src, open(
+        tmp, "w", encoding="utf-8", newline=""
+    ) as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        writer.writerow(next(reader))
+        for row in reader:
+            writer.writerow(replacements.get(int(row[0]), row))
+    os.replace(tmp, path)
+
+
+def score_incrementally(
+    csv_path: str,
+    assessment: DataProductComplexityAssessment,
+    output_path: str,
+    checkpoint_path: str,
+    full: bool = False,
+) -> IncrementalRun:
+    """
+    Bring the scores in `output_path` up to date with the response export
+    at `csv_path`, scoring only rows appended since the last checkpoint
+    (and any earlier rows that were edited since).
+
+    If the scored prefix's bytes are unchanged the new rows are read from
+    the checkpointed byte offset without parsing anything before it.
+    Otherwise the per-row hashes find the edited rows; a changed header,
+    removed rows, a different questionnaire or an output that doesn't
+    match the checkpoint mean starting over.
+    """
+    scorer = ResponseRowScorer(assessment)
+    run = IncrementalRun()
+    checkpoint = None if full else Checkpoint.load(checkpoint_path)
+    questionnaire_hash = assessment.version_hash()
+
+    if full:
+        run.full_rescore_reason = "requested"
+    elif checkpoint is None:
+        run.full_rescore_reason = "no checkpoint"
+    elif checkpoint.questionnaire_hash != questionnaire_hash:
+        run.full_rescore_reason = "the questionnaire changed"
+    elif not Path(output_path).exists() or Path(output_path).stat().st_size < checkpoint.output_bytes:
+        run.full_rescore_reason = f"{output_path} is missing or shorter than checkpointed"
+    elif _hash_output(output_path, checkpoint.output_bytes) != checkpoint.output_hash:
+        # e.g. an earlier run re-scored edited rows but stopped before
+        # checkpointing them, so the checkpointed bytes no longer end on a row
+        run.full_rescore_reason = f"{output_path} doesn't match the checkpoint"
+    if run.full_rescore_reason:
+        checkpoint = Checkpoint(questionnaire_hash=questionnaire_hash)
+    elif Path(output_path).stat().st_size > checkpoint.output_bytes:
+        # An earlier run appended scores but stopped before checkpointing them
+        with open(output_path, "r+b") as out:
+            out.truncate(checkpoint.output_bytes)
+
+    with open(csv_path, "rb") as f:
+        edited: list[tuple[int, list[str]]] = []
+        if checkpoint.rows and _hash_prefix(f, checkpoint.byte_offset) == checkpoint.prefix_hash:
+            f.seek(checkpoint.byte_offset)
+            records = iter_csv_records(f)
+            row_no = checkpoint.rows
+        else:
+            f.seek(0)
+            records = iter_csv_records(f)
+            header = next(records, b"")
+            scorer.check_header(_parse_record(header), csv_path)
+            if checkpoint.rows and _row_digest(header) != checkpoint.header_hash:
+                run.full_rescore_reason = "the header changed"
+                checkpoint = Checkpoint(questionnaire_hash=questionnaire_hash)
+            checkpoint.header_hash = _row_digest(header)
+            checkpoint.byte_offset = len(header)
+            # Walk the already scored rows looking for edits
+            scored_rows = checkpoint.rows
+            row_no = 0
+            for record in islice(records, scored_rows):
+                row_no += 1
+                digest = _row_digest(record)
+                if digest != checkpoint.row_hashes[row_no - 1]:
+                    checkpoint.row_hashes[row_no - 1] = digest
+                    edited.append((row_no, _parse_record(record)))
+                checkpoint.byte_offset += len(record)
+            if row_no < scored_rows:
+                # Rows were removed: nothing lines up with the output any more
+                run = score_incrementally(csv_path, assessment, output_path, checkpoint_path, full=True)
+                run.full_rescore_reason = "rows were removed"
+                return run
+
+        def new_rows() -> Iterator[tuple[int, list[str]]]:
+            nonlocal row_no
+            for record in records:
+                values = _parse_record(record)
+                if not any(values):
+                    # Trailing blank line
+                    checkpoint.byte_offset += len(record)
+                    continue
+                row_no += 1
+                checkpoint.row_hashes.append(_row_digest(record))
+                checkpoint.byte_offset += len(record)
+                checkpoint.last_timestamp = values[0] or checkpoint.last_timestamp
+                yield row_no, values
+
+        fresh = not checkpoint.rows
+        _write_rows(
+            output_path,
+            scorer.score(new_rows()),
+            header=scorer.output_header if fresh else None,
+            mode="w" if fresh else "a",
+        )
+        run.new_rows = row_no - checkpoint.rows
+        checkpoint.rows = row_no
+
+        if edited:
+            _replace_output_rows(output_path, {r[0]: r for r in scorer.score(edited)})
+            run.rescored_rows = [row_no for row_no, _ in edited]
+
+        checkpoint.prefix_hash = _hash_prefix(f, checkpoint.byte_offset)
+
+    checkpoint.output_bytes = Path(output_path).stat().st_size
+    checkpoint.output_hash = _hash_output(output_path, checkpoint.output_bytes)
+    checkpoint.save(checkpoint_path)
+    return run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Score a growing Google Form response export, only scoring rows added or edited since the last run."
+    )
+    parser.add_argument("yaml_path", help="Path to the questionnaire YAML the form was generated from.")
+    parser.add_argument("csv_path", help="The 'Form Responses 1' sheet exported as CSV.")
+    parser.add_argument("-o", "--output", default="response_scores.csv",
+                        help="CSV of section scores per response row, appended to on each run.")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Where to keep track of what has been scored (default: next to --output).")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the checkpoint and score every row again.")
+
+    args = parser.parse_args(argv)
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint.json"
+
+    assessment = load_questionnaire(args.yaml_path)
+    try:
+        run = score_incrementally(args.csv_path, assessment, args.output, checkpoint_path, full=args.full)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if run.full_rescore_reason:
+        print(f"⚠️  Scored every row ({run.full_rescore_reason}).")
+    if run.rescored_rows:
+        print(f"⚠️  Re-scored {len(run.rescored_rows)} edited rows: {', '.join(map(str, run.rescored_rows))}")
+    print(f"✅ {run.new_rows} new rows scored into: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
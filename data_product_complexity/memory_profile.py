@@ -0,0 +1,151 @@
+import json
+import sys
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TOP_SITES = 10
+TRACEBACK_FRAMES = 1
+
+# Allocations made by the profiler itself, or by imports happening to run
+# during a stage, say nothing about the renderer
+_IGNORED_TRACES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+# The profiler started most recently, which `stage` reports to
+_active: Optional["MemoryProfiler"] = None
+
+
+def stage(name: str):
+    """
+    Profile a named stage of a render if a MemoryProfiler is running,
+    otherwise do nothing; backends can wrap their expensive steps in this
+    unconditionally
+    """
+    return _active.stage(name) if _active is not None else nullcontext()
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """High-water mark of this process's resident set size, where the OS reports it"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _format_size(size: Optional[int]) -> str:
+    if size is None:
+        return "n/a"
+    if abs(size) < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    location: str
+    size_diff: int
+    count_diff: int
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """
+    Memory used by one profiled stage: how much traced memory it left
+    allocated, the traced peak while it ran, the process peak RSS once it
+    finished, and where its allocations came from
+    """
+
+    name: str
+    allocated: int
+    traced_peak: int
+    peak_rss: Optional[int]
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+
+class MemoryProfiler:
+    """
+    tracemalloc snapshots around named stages of a render. Stages must not
+    nest, and tracing is process wide, so backends should be rendered one at
+    a time while profiling.
+    """
+
+    def __init__(self, top_sites: int = DEFAULT_TOP_SITES):
+        self._top_sites = top_sites
+        self.stages: list[StageMemory] = []
+
+    def start(self) -> None:
+        global _active
+        tracemalloc.start(TRACEBACK_FRAMES)
+        _active = self
+
+    def stop(self) -> None:
+        global _active
+        tracemalloc.stop()
+        _active = None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        before = self._snapshot()
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        yield
+        end_size, peak = tracemalloc.get_traced_memory()
+        after = self._snapshot()
+
+        growth = [d for d in after.compare_to(before, "lineno") if d.size_diff > 0]
+        self.stages.append(
+            StageMemory(
+                name=name,
+                allocated=end_size - start_size,
+                traced_peak=peak - start_size,
+                peak_rss=peak_rss_bytes(),
+                top_sites=[
+                    AllocationSite(
+                        location=f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                        size_diff=d.size_diff,
+                        count_diff=d.count_diff,
+                    )
+                    for d in growth[: self._top_sites]
+                ],
+            )
+        )
+
+    def report(self) -> Iterator[str]:
+        for stage in self.stages:
+            yield (
+                f"{stage.name}: retained {_format_size(stage.allocated)}, "
+                f"traced peak {_format_size(stage.traced_peak)}, peak RSS {_format_size(stage.peak_rss)}"
+            )
+            for site in stage.top_sites:
+                yield f"    {_format_size(site.size_diff):>12}  {site.count_diff:>9} blocks  {site.location}"
+        yield f"Peak RSS: {_format_size(peak_rss_bytes())}"
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "stages": [asdict(stage) for stage in self.stages],
+                    "peak_rss": peak_rss_bytes(),
+                },
+                f,
+                indent=2,
+            )
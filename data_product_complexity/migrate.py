@@ -0,0 +1,226 @@
+import argparse
+import difflib
+import io
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+NOT_SURE_SCORE = 0.5
+DEFAULT_WEIGHT = 1
+
+
+def _round_trip_yaml():
+    try:
+        from ruamel.yaml import YAML
+    except ImportError as e:
+        raise ImportError(
+            "Migrating questionnaires needs ruamel.yaml: pip install 'data-product-complexity-tool[migrate]'"
+        ) from e
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.width = 4096
+    # Indented like the questionnaires, so only migrated lines change
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    return yaml
+
+
+def score_options(
+    options: list[str], not_sure_score: float = NOT_SURE_SCORE
+) -> list[dict[str, Any]]:
+    """
+    Turn a plain list of option texts into {optionText, score} entries:
+    'Not sure' scores `not_sure_score` and the remaining options are
+    spread evenly over (0, 1] in the order given.
+    """
+    total = sum(1 for opt in options if opt.lower() != "not sure")
+    scored = []
+    rank = 0
+    for opt in options:
+        if opt.lower() == "not sure":
+            score = not_sure_score
+        else:
+            rank += 1
+            score = round(rank / total, 3)
+        scored.append({"optionText": opt, "score": score})
+    return scored
+
+
+@dataclass
+class MigrationReport:
+    path: str
+    output_path: Optional[str] = None
+    options_scored: list[str] = field(default_factory=list)
+    weights_set: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.options_scored or self.weights_set)
+
+
+def migrate_document(
+    data: Any, weight: Optional[float] = None, report: Optional[MigrationReport] = None
+) -> MigrationReport:
+    """
+    Apply the score and weight transforms to a parsed questionnaire in place:
+    options given as plain strings get scores (see score_options, honouring
+    a legacy per-question notSureScore), and questions get a weight, `weight` if given or DEFAULT_WEIGHT if they
+    have none yet.
+    """
+    report = report or MigrationReport(path="")
+    for s_idx, section in enumerate(data.get("data_product_complexity", {}).get("sections", [])):
+        for q_idx, question in enumerate(section.get("questions", []), start=1):
+            label = f"{s_idx}.{q_idx}"
+            new_weight = weight if weight is not None else question.get("weight", DEFAULT_WEIGHT)
+            if question.get("weight") != new_weight:
+                question["weight"] = new_weight
+                report.weights_set.append(label)
+
+            options = question.get("options")
+            if isinstance(options, list) and options and all(isinstance(o, str) for o in options):
+                # Older questionnaires could override the 'Not sure' score per question
+                not_sure_score = question.pop("notSureScore", NOT_SURE_SCORE)
+                question["options"] = score_options(options, not_sure_score)
+                report.options_scored.append(label)
+    return report
+
+
+# A line that starts a YAML node (sequence item, key, comment or document
+# marker) rather than continuing a wrapped plain scalar
+_NODE_START = re.compile(r"(-(\s|$)|#|---|\.\.\.|[^\s#][^:#]*:(\s|$))")
+
+
+def _logical_lines(text: str) -> list[list[str]]:
+    """`text`'s lines, with each wrapped scalar's continuation lines grouped with it"""
+    units: list[tuple[int, list[str]]] = []
+    for line in text.splitlines(keepends=True):
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if (
+            units
+            and stripped.strip()
+            and indent > units[-1][0]
+            and not _NODE_START.match(stripped)
+        ):
+            units[-1][1].append(line)
+        else:
+            units.append((indent, [line]))
+    return [lines for _, lines in units]
+
+
+def keep_original_wrapping(original: str, migrated: str) -> str:
+    """
+    ruamel.yaml doesn't keep where long plain scalars were wrapped; put
+    back the original lines wherever the migrated ones only differ in
+    wrapping
+    """
+    old = _logical_lines(original)
+    new = _logical_lines(migrated)
+    matcher = difflib.SequenceMatcher(
+        None,
+        [" ".join("".join(u).split()) for u in old],
+        [" ".join("".join(u).split()) for u in new],
+        autojunk=False,
+    )
+    kept = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        for unit in old[i1:i2] if tag == "equal" else new[j1:j2]:
+            kept.extend(unit)
+    return "".join(kept)
+
+
+def migrate_file(
+    path: str,
+    output_path: Optional[str] = None,
+    weight: Optional[float] = None,
+    dry_run: bool = False,
+) -> MigrationReport:
+    """
+    Migrate one questionnaire file, keeping its key order and comments,
+    and write the result to `output_path` unless `dry_run` is set. Files
+    that are already migrated are copied unchanged to another
+    `output_path`, and left alone when migrating in place.
+    """
+    report = MigrationReport(path=path, output_path=output_path)
+    yaml = _round_trip_yaml()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            original = f.read()
+        data = yaml.load(original)
+        migrate_document(data, weight=weight, report=report)
+        in_place = output_path is not None and Path(output_path).resolve() == Path(path).resolve()
+        if output_path and not dry_run and (report.changed or not in_place):
+            migrated = original
+            if report.changed:
+                buf = io.StringIO()
+                yaml.dump(data, buf)
+                migrated = keep_original_wrapping(original, buf.getvalue())
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(migrated)
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Apply score and weight transforms to questionnaire YAML files."
+    )
+    parser.add_argument("paths", nargs="+", help="Questionnaire YAML files to migrate.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--in-place", action="store_true",
+                        help="Rewrite each file in place.")
+    target.add_argument("--output-dir",
+                        help="Write migrated files to this directory, keeping their names.")
+    target.add_argument("--dry-run", action="store_true",
+                        help="Only report what would change.")
+    parser.add_argument("--weight", type=float, default=None,
+                        help=f"Set every question's weight to this (default: only add weight {DEFAULT_WEIGHT} where missing).")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of worker processes (default: one per CPU).")
+
+    args = parser.parse_args(argv)
+
+    _round_trip_yaml()  # fail fast if ruamel.yaml is missing
+
+    outputs = [
+        None if args.dry_run
+        else p if args.in_place
+        else str(Path(args.output_dir) / Path(p).name)
+        for p in args.paths
+    ]
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        reports = list(
+            pool.map(
+                migrate_file,
+                args.paths,
+                outputs,
+                [args.weight] * len(args.paths),
+                [args.dry_run] * len(args.paths),
+            )
+        )
+
+    failed = False
+    for report in reports:
+        if report.error:
+            failed = True
+            print(f"❌ {report.path}: {report.error}")
+        elif not report.changed:
+            where = f" -> {report.output_path}" if report.output_path not in (None, report.path) else ""
+            print(f"✅ {report.path}{where}: already migrated")
+        else:
+            where = f" -> {report.output_path}" if report.output_path else " (dry run)"
+            print(
+                f"✅ {report.path}{where}: scored options of {len(report.options_scored)} questions, "
+                f"set weight on {len(report.weights_set)} questions"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
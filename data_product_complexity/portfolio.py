@@ -0,0 +1,142 @@
+import argparse
+import sys
+from itertools import islice
+from typing import Iterable
+
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.chart import Reference
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .excel_backend import fit_col_width, score_bar_chart, score_heatmap_rule
+from .responses import RESPONSES_CHUNK_SIZE, iter_answer_sets
+from .scoring import MAX_BIN, MIN_BIN, AnswerSet, score_answer_sets
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+class PortfolioScores:
+    """
+    The 1-5 bin of every section for every assessed product, accumulated a
+    batch at a time so only one batch of raw answers is ever held in memory.
+    """
+
+    def __init__(self, assessment: DataProductComplexityAssessment):
+        self.section_titles = [s.title for s in assessment.scorable_sections]
+        self.products: list[tuple[str, str]] = []
+        self._assessment = assessment
+        self._batches: list[np.ndarray] = []
+
+    def add(self, answer_sets: Iterable[AnswerSet], batch_size=RESPONSES_CHUNK_SIZE):
+        answer_sets = iter(answer_sets)
+        while batch := list(islice(answer_sets, batch_size)):
+            self._batches.append(
+                score_answer_sets(self._assessment, batch).astype(np.int8)
+            )
+            self.products.extend((a.product_name, a.submitted_at or "") for a in batch)
+
+    @property
+    def bins(self) -> np.ndarray:
+        """(n_products, n_sections) array of section bins"""
+        if not self._batches:
+            return np.empty((0, len(self.section_titles)), dtype=np.int8)
+        return np.concatenate(self._batches)
+
+    def statistics(self) -> dict[str, np.ndarray]:
+        """Per-section summary statistics, each an (n_sections,) array"""
+        bins = self.bins
+        stats = {"Mean": bins.mean(axis=0)}
+        for p, values in zip(PERCENTILES, np.percentile(bins, PERCENTILES, axis=0)):
+            stats["Median" if p == 50 else f"P{p}"] = values
+        return stats
+
+    def distribution(self) -> np.ndarray:
+        """(n_sections, 5) array counting how many products landed in each bin"""
+        bin_values = np.arange(MIN_BIN, MAX_BIN + 1)
+        return (self.bins[:, :, np.newaxis] == bin_values).sum(axis=0)
+
+
+class PortfolioWorkbookBuilder:
+    def __init__(self, scores: PortfolioScores):
+        self._scores = scores
+
+    @staticmethod
+    def _write_header(ws: Worksheet, headers: list[str]) -> None:
+        ws.append(headers)
+        for cell in ws[1]:
+            cell.font = Font(bold=True)
+
+    def _build_statistics_sheet(self, ws: Worksheet) -> None:
+        stats = self._scores.statistics()
+        self._write_header(ws, ["Section"] + list(stats.keys()))
+        for i, title in enumerate(self._scores.section_titles):
+            ws.append([title] + [round(float(v[i]), 2) for v in stats.values()])
+
+        last_row = len(self._scores.section_titles) + 1
+        last_col = get_column_letter(len(stats) + 1)
+        ws.conditional_formatting.add(f"B2:{last_col}{last_row}", score_heatmap_rule())
+        fit_col_width(worksheet=ws, col="A")
+
+        median_col = list(stats.keys()).index("Median") + 2
+        data_ref = Reference(ws, min_col=median_col, min_row=1, max_row=last_row)
+        categories_ref = Reference(ws, min_col=1, min_row=2, max_row=last_row)
+        chart = score_bar_chart("Portfolio Median Complexity Scores", data_ref, categories_ref)
+        ws.add_chart(chart, f"{get_column_letter(len(stats) + 3)}1")
+
+    def _build_distribution_sheet(self, ws: Worksheet) -> None:
+        self._write_header(
+            ws, ["Section"] + [f"Score {b}" for b in range(MIN_BIN, MAX_BIN + 1)]
+        )
+        for title, counts in zip(self._scores.section_titles, self._scores.distribution()):
+            ws.append([title] + [int(c) for c in counts])
+        fit_col_width(worksheet=ws, col="A")
+
+    def _build_products_sheet(self, ws: Worksheet) -> None:
+        self._write_header(ws, ["Product", "Submitted"] + self._scores.section_titles)
+        for (name, submitted), bins in zip(self._scores.products, self._scores.bins):
+            ws.append([name, submitted] + [int(b) for b in bins])
+
+        last_row = len(self._scores.products) + 1
+        last_col = get_column_letter(len(self._scores.section_titles) + 2)
+        ws.conditional_formatting.add(f"C2:{last_col}{last_row}", score_heatmap_rule())
+        fit_col_width(worksheet=ws, col="A")
+        fit_col_width(worksheet=ws, col="B")
+
+    def build(self, output_path: str) -> None:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Statistics"
+        self._build_statistics_sheet(ws)
+        self._build_distribution_sheet(wb.create_sheet("Distribution"))
+        self._build_products_sheet(wb.create_sheet("Products"))
+        wb.save(output_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Roll up many scored data product assessments into one summary workbook."
+    )
+    parser.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    parser.add_argument("inputs", nargs="+",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    parser.add_argument("-o", "--output", default="portfolio_summary.xlsx",
+                        help="Path to the summary Excel workbook.")
+
+    args = parser.parse_args(argv)
+
+    assessment = load_questionnaire(args.yaml_path)
+    scores = PortfolioScores(assessment)
+    scores.add(iter_answer_sets(args.inputs, assessment))
+    if not scores.products:
+        print("❌ No assessments found in the given inputs.")
+        sys.exit(1)
+    PortfolioWorkbookBuilder(scores).build(args.output)
+    print(f"✅ Portfolio summary of {len(scores.products)} assessments created at: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Reads questionnaire YAML one section at a time from the parser's event
+stream, so a questionnaire's raw document never has to be in memory all at
+once next to the model built from it:
+
+    for path, value in iter_questionnaire(f):
+        # ("data_product_complexity", "formTitle"), "..."
+        # ("data_product_complexity", "sections", 0), {"section": ..., "questions": [...]}
+        ...
+
+Uses libyaml's parser when PyYAML was built with it.
+"""
+from typing import IO, Any, Iterator, Optional, Union
+
+import yaml
+from yaml.events import (
+    AliasEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from .data_product_complexity import DataProductComplexityAssessment, Section
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# libyaml's composer leaves the anchor's name out of its errors
+_NAME_ANCHORS_IN_ERRORS = YamlLoader is yaml.SafeLoader
+
+ROOT_KEY = "data_product_complexity"
+SECTIONS_KEY = "sections"
+
+QuestionnairePath = tuple[Union[str, int], ...]
+
+
+class _EventComposer:
+    """
+    Builds nodes from the loader's events as yaml.composer.Composer does, but
+    for one value at a time, so each section can be constructed and dropped
+    before the next is parsed
+    """
+
+    def __init__(self, loader: yaml.SafeLoader):
+        self._loader = loader
+        self._anchors: dict[str, Node] = {}
+
+    @staticmethod
+    def _anchor_error(message: str, anchor: str) -> str:
+        return f"{message} {anchor!r}" if _NAME_ANCHORS_IN_ERRORS else message
+
+    def compose(self) -> Node:
+        loader = self._loader
+        event = loader.get_event()
+        if isinstance(event, AliasEvent):
+            if event.anchor not in self._anchors:
+                raise yaml.composer.ComposerError(
+                    None,
+                    None,
+                    self._anchor_error("found undefined alias", event.anchor),
+                    event.start_mark,
+                )
+            return self._anchors[event.anchor]
+
+        if event.anchor is not None and event.anchor in self._anchors:
+            raise yaml.composer.ComposerError(
+                self._anchor_error("found duplicate anchor", event.anchor) + "; first occurrence",
+                self._anchors[event.anchor].start_mark,
+                "second occurrence",
+                event.start_mark,
+            )
+
+        if isinstance(event, ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = loader.resolve(ScalarNode, event.value, event.implicit)
+            node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        elif isinstance(event, SequenceStartEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = loader.resolve(SequenceNode, None, event.implicit)
+            node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+            while not loader.check_event(SequenceEndEvent):
+                node.value.append(self.compose())
+            node.end_mark = loader.get_event().end_mark
+        elif isinstance(event, MappingStartEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = loader.resolve(MappingNode, None, event.implicit)
+            node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+            while not loader.check_event(MappingEndEvent):
+                key = self.compose()
+                node.value.append((key, self.compose()))
+            node.end_mark = loader.get_event().end_mark
+        else:
+            raise yaml.composer.ComposerError(
+                None, None, f"expected a node, but found {type(event).__name__}", event.start_mark
+            )
+
+        if event.anchor is not None:
+            self._anchors[event.anchor] = node
+        return node
+
+    def construct(self) -> Any:
+        return self._loader.construct_document(self.compose())
+
+
+def _iter_mapping(composer: _EventComposer, loader: yaml.SafeLoader) -> Iterator[Any]:
+    """Keys of the mapping just started, leaving each key's value next in the stream"""
+    loader.get_event()
+    while not loader.check_event(MappingEndEvent):
+        yield composer.construct()
+    loader.get_event()
+
+
+def iter_questionnaire(stream: Union[str, IO]) -> Iterator[tuple[QuestionnairePath, Any]]:
+    """
+    (path, value) for each part of a questionnaire document: every section
+    on its own as it is parsed, and the values around them whole. The root
+    mapping and the sections list are announced empty before their parts,
+    so a key given twice replaces what came before, as it does when the
+    document is loaded whole. A document that isn't shaped like a
+    questionnaire comes out whole too, with an empty path, for the
+    validators to report on.
+    """
+    loader = YamlLoader(stream)
+    composer = _EventComposer(loader)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(StreamEndEvent):
+            yield (), None
+            return
+        document_start = loader.get_event()
+
+        if not loader.check_event(MappingStartEvent):
+            yield (), composer.construct()
+        else:
+            yield from _iter_root(composer, loader)
+
+        loader.get_event()  # DocumentEndEvent
+        if not loader.check_event(StreamEndEvent):
+            raise yaml.composer.ComposerError(
+                "expected a single document in the stream",
+                document_start.start_mark,
+                "but found another document",
+                loader.get_event().start_mark,
+            )
+    finally:
+        loader.dispose()
+
+
+def _iter_root(composer: _EventComposer, loader: yaml.SafeLoader) -> Iterator[tuple[QuestionnairePath, Any]]:
+    for key in _iter_mapping(composer, loader):
+        if key != ROOT_KEY or not loader.check_event(MappingStartEvent):
+            yield (key,), composer.construct()
+            continue
+        yield (ROOT_KEY,), {}
+        for field in _iter_mapping(composer, loader):
+            if field != SECTIONS_KEY or not loader.check_event(SequenceStartEvent):
+                yield (ROOT_KEY, field), composer.construct()
+                continue
+            yield (ROOT_KEY, SECTIONS_KEY), []
+            loader.get_event()
+            index = 0
+            while not loader.check_event(SequenceEndEvent):
+                yield (ROOT_KEY, SECTIONS_KEY, index), composer.construct()
+                index += 1
+            loader.get_event()
+
+
+class AssessmentAssembler:
+    """
+    Collects iter_questionnaire parts into a DataProductComplexityAssessment,
+    turning each section into a Section as it arrives
+    """
+
+    def __init__(self):
+        self.title: Optional[str] = None
+        self.sections: list[Section] = []
+
+    def add(self, path: QuestionnairePath, value: Any) -> None:
+        if path == (ROOT_KEY,):
+            self.title = None
+            self.sections = []
+        elif path == (ROOT_KEY, SECTIONS_KEY):
+            self.sections = []
+        elif path == (ROOT_KEY, "formTitle"):
+            self.title = value
+        elif len(path) == 3 and path[:2] == (ROOT_KEY, SECTIONS_KEY):
+            index = path[2]
+            # The information section is "0"; scorable sections are numbered
+            # from 1, as DataProductComplexityAssessment.from_dict does
+            section_id = "0" if index == 0 else index
+            self.sections.append(Section.from_dict(value, section_id=section_id))
+
+    def assessment(self) -> DataProductComplexityAssessment:
+        if self.title is None or not self.sections:
+            raise KeyError(f"{ROOT_KEY} needs a formTitle and at least one section")
+        return DataProductComplexityAssessment(
+            title=self.title,
+            data_product_info=self.sections[0],
+            scorable_sections=self.sections[1:],
+        )
+
+
+def stream_questionnaire(yaml_path: str) -> DataProductComplexityAssessment:
+    """Load a questionnaire without validating it, one section at a time"""
+    assembler = AssessmentAssembler()
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        for path, value in iter_questionnaire(f):
+            assembler.add(path, value)
+    return assembler.assessment()
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "data-product-complexity"
+DISTRIBUTION_NAME = "data-product-complexity-tool"
+
+
+def tool_version() -> str:
+    """
+    The installed package version plus a digest of this package's source,
+    so editing the renderers in a dev checkout also invalidates the cache
+    """
+    try:
+        version = metadata.version(DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        version = "dev"
+    digest = hashlib.sha256()
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+
+def cache_key(
+    yaml_bytes: bytes,
+    backend: str,
+    options: Optional[dict] = None,
+    backend_distribution: str = "",
+) -> str:
+    """
+    Content address of a render: the YAML, backend, options and tool
+    version, and the name and version of the distribution providing the
+    backend (see backends.backend_distribution), so upgrading a plugin
+    backend doesn't serve its old renders
+    """
+    digest = hashlib.sha256()
+    for part in (
+        yaml_bytes,
+        backend.encode("utf-8"),
+        json.dumps(options or {}, sort_keys=True).encode("utf-8"),
+        tool_version().encode("utf-8"),
+        backend_distribution.encode("utf-8"),
+    ):
+        # Length-prefix each part so adjacent parts can't run into each other
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _atomic_copy(src: Path, dst: Path) -> None:
+    """
+    Copy rather than hard link: a link would let anyone editing the output
+    in place silently change the cached artifact too
+    """
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class RenderCache:
+    """
+    Rendered artifacts stored under their cache_key. Renders are
+    deterministic, so an artifact with the same key is byte-for-byte what a
+    fresh render would produce.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self._dir = Path(cache_dir)
+
+    def _artifact_path(self, key: str, suffix: str) -> Path:
+        return self._dir / key[:2] / f"{key}{suffix}"
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Copy the artifact for `key` to `output_path` if there is one"""
+        output = Path(output_path)
+        artifact = self._artifact_path(key, output.suffix)
+        if not artifact.exists():
+            return False
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_copy(artifact, output)
+        return True
+
+    def store(self, key: str, output_path: str) -> None:
+        """Keep a freshly rendered `output_path` as the artifact for `key`"""
+        output = Path(output_path)
+        artifact = self._artifact_path(key, output.suffix)
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_copy(output, artifact)
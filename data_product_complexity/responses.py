@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from .data_product_complexity import DataProductComplexityAssessment, Question
+from .scoring import AnswerSet, product_name_question
+
+RESPONSES_CHUNK_SIZE = 1000
+
+
+def all_questions(assessment: DataProductComplexityAssessment) -> list[Question]:
+    """
+    Every question in form order, i.e. the order of the columns after
+    'Timestamp' in a Google Form response export.
+    """
+    return list(assessment.data_product_info.questions) + [
+        q for s in assessment.scorable_sections for q in s.questions
+    ]
+
+
+def read_workbook_answers(
+    path: str, assessment: DataProductComplexityAssessment
+) -> AnswerSet:
+    """
+    Harvest the answers from a filled-in workbook produced by ExcelBackend.
+
+    The Questions sheet numbers scorable sections from 2 (the Data Product
+    Information heading is 1), so question_id "1.3" is labelled "2.3" there.
+    The workbook has no cell for the product name or submission time, so
+    the file name and modification time stand in.
+    """
+    labels = {
+        f"{section_index + 1}.{question_num}": question.question_id
+        for section_index, section in enumerate(assessment.scorable_sections, start=1)
+        for question_num, question in enumerate(section.questions, start=1)
+    }
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        answers = {}
+        for q_num, _, answer in wb["Questions"].iter_rows(
+            min_col=1, max_col=3, values_only=True
+        ):
+            question_id = labels.get(str(q_num)) if q_num is not None else None
+            if question_id is not None and answer is not None:
+                answers[question_id] = str(answer)
+    finally:
+        wb.close()
+    modified = datetime.fromtimestamp(Path(path).stat().st_mtime, timezone.utc)
+    return AnswerSet(
+        product_name=Path(path).stem,
+        answers=answers,
+        submitted_at=modified.isoformat(timespec="seconds"),
+    )
+
+
+def iter_response_csv(
+    path: str,
+    assessment: DataProductComplexityAssessment,
+    chunksize: int = RESPONSES_CHUNK_SIZE,
+) -> Iterator[AnswerSet]:
+    """
+    Stream the rows of a Google Form response export ("Form Responses 1"
+    downloaded as CSV) as AnswerSets, `chunksize` rows at a time.
+    """
+    questions = all_questions(assessment)
+    name_question = product_name_question(assessment)
+    reader = pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunksize)
+    for chunk in reader:
+        header = list(chunk.columns)
+        if len(header) < len(questions) + 1:
+            raise ValueError(
+                f"{path}: expected a Timestamp column followed by {len(questions)} question columns, got {len(header)} columns"
+            )
+        for question, column in zip(questions, header[1:]):
+            if column != question.question_text:
+                raise ValueError(
+                    f"{path}: column '{column}' does not match question {question.question_id} '{question.question_text}'"
+                )
+        for row in chunk.itertuples(index=False, name=None):
+            answers = {q.question_id: row[i] for i, q in enumerate(questions, start=1)}
+            yield AnswerSet(
+                product_name=(
+                    answers.get(name_question.question_id, "") if name_question else ""
+                ),
+                answers=answers,
+                submitted_at=row[0] or None,
+            )
+
+
+def iter_answer_sets(
+    paths: list[str], assessment: DataProductComplexityAssessment
+) -> Iterator[AnswerSet]:
+    """
+    Answer sets from a mix of harvested workbooks (.xlsx) and response
+    exports (.csv), one file open at a time.
+    """
+    for path in paths:
+        suffix = Path(path).suffix.lower()
+        if suffix == ".xlsx":
+            yield read_workbook_answers(path, assessment)
+        elif suffix == ".csv":
+            yield from iter_response_csv(path, assessment)
+        else:
+            raise ValueError(f"Don't know how to read answers from '{path}'")
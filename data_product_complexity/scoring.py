@@ -0,0 +1,307 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+import math
+
+import numpy as np
+
+from .data_product_complexity import (
+    DataProductComplexityAssessment,
+    MultiSelectRule,
+    Question,
+    QuestionType,
+    Section,
+)
+
+NOT_SURE = "Not sure"
+
+# Section totals are normalised to [0, 1] and then stretched by this factor
+# before truncating, so that a perfect score still lands in the top bin (5)
+# rather than overflowing into a 6th one.
+BIN_SCALE = 4.999
+MIN_BIN = 1
+MAX_BIN = 5
+
+# CheckBox selections are scored as bitmasks of option indices
+MAX_SELECTABLE_OPTIONS = 64
+# How Google Forms (and the Questions sheet) join several selections
+SELECTION_SEPARATOR = ", "
+
+
+@dataclass(frozen=True)
+class AnswerSet:
+    """
+    One completed questionnaire: the selected option text for each
+    question, keyed by Question.question_id ("1.3", ...)
+    """
+
+    product_name: str
+    answers: dict[str, str] = field(default_factory=dict)
+    submitted_at: Optional[str] = None
+
+
+def product_name_question(
+    assessment: DataProductComplexityAssessment,
+) -> Optional[Question]:
+    """
+    The first ShortAnswer in the Data Product Information section is
+    where people type the data product's name.
+    """
+    for question in assessment.data_product_info.questions:
+        if question.question_type == QuestionType.SHORT_ANSWER:
+            return question
+    return None
+
+
+def scorable_questions(assessment: DataProductComplexityAssessment) -> list[Question]:
+    """Every question of every scorable section, section by section"""
+    return [q for s in assessment.scorable_sections for q in s.questions]
+
+
+def is_multi_select(question: Question) -> bool:
+    return question.question_type == QuestionType.CHECKBOX
+
+
+def multi_select_rule(question: Question) -> MultiSelectRule:
+    return question.scoring_rule or MultiSelectRule.MAX
+
+
+def split_selections(option_texts: Iterable[str], answer: str) -> list[str]:
+    """
+    The options selected in a CheckBox answer, e.g. "Raw, Conform". Option
+    texts may themselves contain the separator, so parts are joined back up
+    until they make an option.
+    """
+    options = set(option_texts)
+    if answer in options:
+        return [answer]
+    selections = []
+    pending = None
+    for part in answer.split(SELECTION_SEPARATOR):
+        pending = part if pending is None else f"{pending}{SELECTION_SEPARATOR}{part}"
+        if pending in options:
+            selections.append(pending)
+            pending = None
+    if pending is not None:
+        raise ValueError(f"'{pending}' is not an option")
+    return selections
+
+
+def selection_mask(question: Question, answer: Optional[str]) -> int:
+    """
+    The CheckBox answer as a bitmask with bit i set if Question.options[i]
+    was selected; 0 if unanswered
+    """
+    if not answer:
+        return 0
+    indexes = {o.option_text: i for i, o in enumerate(question.options)}
+    try:
+        selections = split_selections(indexes, answer)
+    except ValueError:
+        raise ValueError(
+            f"'{answer}' is not a selection of options for question {question.question_id} '{question.question_text}'"
+        ) from None
+    mask = 0
+    for selection in selections:
+        mask |= 1 << indexes[selection]
+    return mask
+
+
+def multi_select_scores(question: Question, masks: np.ndarray) -> np.ndarray:
+    """
+    Unweighted scores of a CheckBox question for an array of selection_mask
+    bitmasks, combined by the question's MultiSelectRule. Unanswered (0)
+    masks count as 'Not sure'.
+    """
+    scores = np.array([o.score for o in question.options], dtype=np.float64)
+    masks = np.asarray(masks, dtype=np.uint64)
+    if not masks.all():
+        not_sure = [i for i, o in enumerate(question.options) if o.option_text == NOT_SURE]
+        if not not_sure:
+            raise ValueError(
+                f"Question {question.question_id} '{question.question_text}' is unanswered and has no '{NOT_SURE}' option"
+            )
+        masks = np.where(masks == 0, np.uint64(1 << not_sure[0]), masks)
+    selected = ((masks[:, None] >> np.arange(len(scores), dtype=np.uint64)) & np.uint64(1)).astype(bool)
+
+    rule = multi_select_rule(question)
+    if rule == MultiSelectRule.MAX:
+        return np.where(selected, scores, -np.inf).max(axis=1)
+    total = selected @ scores
+    if rule == MultiSelectRule.SUM_CAPPED:
+        return np.minimum(total, scores.max())
+    return total / selected.sum(axis=1)
+
+
+def section_bounds(section: Section) -> tuple[float, float]:
+    """
+    The lowest and highest weighted total a section can reach, used to
+    normalise the section's total before binning. Every MultiSelectRule
+    keeps a CheckBox question's score within its options' range.
+    """
+    sum_weighted_min_vals = 0.0
+    sum_weighted_max_vals = 0.0
+    for question in section.questions:
+        sum_weighted_min_vals += min(o.score for o in question.options) * question.weight
+        sum_weighted_max_vals += max(o.score for o in question.options) * question.weight
+    return sum_weighted_min_vals, sum_weighted_max_vals
+
+
+def section_normaliser(section: Section) -> tuple[float, float]:
+    """
+    (offset, divisor) mapping a section's weighted total onto [0, 1] as
+    (total - offset) / divisor; the Score sheet formulas and compiled
+    scoring tables both take them from here.
+    """
+    lower, upper = section_bounds(section)
+    return lower, upper - lower
+
+
+def question_score(question: Question, answer: Optional[str]) -> float:
+    """
+    Weighted score for a single answer. Unanswered questions fall back to
+    'Not sure', which is what the questionnaire dropdowns default to.
+    """
+    if is_multi_select(question):
+        mask = selection_mask(question, answer)
+        return float(multi_select_scores(question, np.array([mask]))[0]) * question.weight
+    if answer is None or answer == "":
+        answer = NOT_SURE
+    for option in question.options:
+        if option.option_text == answer:
+            return option.score * question.weight
+    raise ValueError(
+        f"'{answer}' is not an option for question {question.question_id} '{question.question_text}'"
+    )
+
+
+def bin_section_total(total: float, lower: float, upper: float) -> int:
+    """
+    Python equivalent of the Score sheet's INT((SUM(...) - min)/divisor * 4.999) + 1
+    """
+    return math.floor((total - lower) / (upper - lower) * BIN_SCALE) + MIN_BIN
+
+
+def bin_section_totals(totals: np.ndarray, lower, upper) -> np.ndarray:
+    """
+    Vectorised bin_section_total: `totals` is (n_assessments, n_sections),
+    `lower`/`upper` broadcast over the section axis.
+    """
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    return (
+        np.floor((totals - lower) / (upper - lower) * BIN_SCALE).astype(np.int64)
+        + MIN_BIN
+    )
+
+
+def score_section(section: Section, answers: dict[str, str]) -> int:
+    total = sum(
+        question_score(q, answers.get(q.question_id)) for q in section.questions
+    )
+    return bin_section_total(total, *section_bounds(section))
+
+
+def score_assessment(
+    assessment: DataProductComplexityAssessment, answer_set: AnswerSet
+) -> dict[str, int]:
+    """
+    The 1-5 bin for each scorable section, keyed by section title
+    """
+    return {
+        section.title: score_section(section, answer_set.answers)
+        for section in assessment.scorable_sections
+    }
+
+
+def option_scores(
+    assessment: DataProductComplexityAssessment, answer_sets: Iterable[AnswerSet]
+) -> np.ndarray:
+    """
+    (n_answer_sets, n_questions) array of the selected options' scores,
+    before weighting, columns in scorable question order (section by section).
+
+    CheckBox answers are turned into selection bitmasks (each distinct
+    answer text only once) and scored a whole column at a time.
+    """
+    questions = scorable_questions(assessment)
+    single = [
+        (i, q, {o.option_text: o.score for o in q.options})
+        for i, q in enumerate(questions)
+        if not is_multi_select(q)
+    ]
+    # answer text -> bitmask, filled in as answers are seen
+    multi = [(i, q, {}) for i, q in enumerate(questions) if is_multi_select(q)]
+
+    rows = []
+    mask_rows = []
+    for answer_set in answer_sets:
+        row = np.empty(len(questions), dtype=np.float64)
+        for i, question, lookup in single:
+            answer = answer_set.answers.get(question.question_id) or NOT_SURE
+            try:
+                row[i] = lookup[answer]
+            except KeyError:
+                raise ValueError(
+                    f"'{answer}' is not an option for question {question.question_id} '{question.question_text}'"
+                ) from None
+        rows.append(row)
+        if multi:
+            mask_row = np.empty(len(multi), dtype=np.uint64)
+            for j, (_, question, masks) in enumerate(multi):
+                answer = answer_set.answers.get(question.question_id) or ""
+                mask = masks.get(answer)
+                if mask is None:
+                    mask = masks[answer] = selection_mask(question, answer)
+                mask_row[j] = mask
+            mask_rows.append(mask_row)
+
+    if not rows:
+        return np.empty((0, len(questions)), dtype=np.float64)
+    scores = np.vstack(rows)
+    if multi:
+        masks = np.vstack(mask_rows)
+        for j, (i, question, _) in enumerate(multi):
+            scores[:, i] = multi_select_scores(question, masks[:, j])
+    return scores
+
+
+def weighted_scores(
+    assessment: DataProductComplexityAssessment, answer_sets: Iterable[AnswerSet]
+) -> np.ndarray:
+    """
+    (n_answer_sets, n_questions) array of weighted question scores, columns
+    in scorable question order (section by section)
+    """
+    weights = np.array(
+        [q.weight for q in scorable_questions(assessment)], dtype=np.float64
+    )
+    return option_scores(assessment, answer_sets) * weights
+
+
+def bin_weighted_scores(
+    assessment: DataProductComplexityAssessment, weighted: np.ndarray
+) -> np.ndarray:
+    """
+    Sum a weighted_scores() array per section and bin each total,
+    giving an (n_answer_sets, n_sections) array of 1-5 bins
+    """
+    sections = assessment.scorable_sections
+    if weighted.shape[0] == 0:
+        return np.empty((0, len(sections)), dtype=np.int64)
+    section_starts = np.cumsum([0] + [len(s.questions) for s in sections[:-1]])
+    bounds = np.array([section_bounds(s) for s in sections], dtype=np.float64)
+    totals = np.add.reduceat(weighted, section_starts, axis=1)
+    return bin_section_totals(totals, bounds[:, 0], bounds[:, 1])
+
+
+def score_answer_sets(
+    assessment: DataProductComplexityAssessment, answer_sets: Iterable[AnswerSet]
+) -> np.ndarray:
+    """
+    Score a batch of answer sets in one go, returning an
+    (n_answer_sets, n_sections) array of 1-5 bins.
+
+    Option text is looked up per answer, but the section totals and the
+    binning are done on the whole batch at once.
+    """
+    return bin_weighted_scores(assessment, weighted_scores(assessment, answer_sets))
@@ -0,0 +1,73 @@
+import json
+from typing import Any
+
+from .data_product_complexity import Backend, DataProductComplexityAssessment, Question
+from .scoring import (
+    BIN_SCALE,
+    MAX_BIN,
+    MIN_BIN,
+    NOT_SURE,
+    SELECTION_SEPARATOR,
+    is_multi_select,
+    multi_select_rule,
+    section_normaliser,
+)
+from .table_scorer import FORMAT_VERSION, TABLE_FORMAT
+
+
+def _compile_question(question: Question) -> dict[str, Any]:
+    compiled = {
+        "id": question.question_id,
+        "weight": question.weight,
+        "options": {o.option_text: o.score for o in question.options},
+    }
+    if is_multi_select(question):
+        compiled["multiSelect"] = multi_select_rule(question).value
+    return compiled
+
+
+def compile_scoring_table(assessment: DataProductComplexityAssessment) -> dict[str, Any]:
+    """
+    Everything needed to score answers to `assessment` (option scores,
+    weights and section normalisers) as plain JSON-able data for
+    table_scorer.ScoringTable. Normalisers come from section_normaliser,
+    as the Score sheet formulas' do, so the two can't disagree. CheckBox
+    questions carry the rule their selections' scores combine by.
+    """
+    sections = []
+    for section in assessment.scorable_sections:
+        offset, divisor = section_normaliser(section)
+        sections.append(
+            {
+                "title": section.title,
+                "offset": offset,
+                "divisor": divisor,
+                "questions": [_compile_question(q) for q in section.questions],
+            }
+        )
+    return {
+        "format": TABLE_FORMAT,
+        "formatVersion": FORMAT_VERSION,
+        "questionnaireHash": assessment.version_hash(),
+        "title": assessment.title,
+        "notSure": NOT_SURE,
+        "binScale": BIN_SCALE,
+        "minBin": MIN_BIN,
+        "maxBin": MAX_BIN,
+        "selectionSeparator": SELECTION_SEPARATOR,
+        "sections": sections,
+    }
+
+
+class ScoringTableBackend(Backend):
+    default_output = "data_product_complexity_scoring.json"
+    description = "Scoring table"
+
+    def render(self, data: DataProductComplexityAssessment, output_path: str) -> None:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(
+                compile_scoring_table(data),
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
@@ -0,0 +1,169 @@
+import argparse
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from .data_product_complexity import DataProductComplexityAssessment
+from .data_product_complexity_tool import load_questionnaire
+from .responses import RESPONSES_CHUNK_SIZE, iter_answer_sets
+from .scoring import (
+    NOT_SURE,
+    AnswerSet,
+    bin_section_totals,
+    bin_weighted_scores,
+    scorable_questions,
+    section_bounds,
+    weighted_scores,
+)
+
+DEFAULT_SAMPLES = 1000
+PERCENTILES = [10, 50, 90]
+# Upper bound on samples x assessments x questions held in memory at once
+MAX_SAMPLED_VALUES = 8_000_000
+
+
+class NotSureSensitivity:
+    """
+    Monte Carlo view of how much the 'Not sure' answers could move each
+    section's 1-5 bin: every 'Not sure' (or unanswered) question is
+    re-drawn uniformly from the question's real options and the sections
+    re-binned, many samples at once.
+    """
+
+    def __init__(
+        self,
+        assessment: DataProductComplexityAssessment,
+        samples: int = DEFAULT_SAMPLES,
+        seed: Optional[int] = None,
+    ):
+        self._assessment = assessment
+        self._samples = samples
+        self._rng = np.random.default_rng(seed)
+
+        questions = scorable_questions(assessment)
+        real_options = [
+            [o.score * q.weight for o in q.options if o.option_text != NOT_SURE]
+            for q in questions
+        ]
+        # (n_questions, max_options) weighted option scores, padded with 0s
+        # past each question's own option count
+        self._num_options = np.array([len(o) for o in real_options], dtype=np.int64)
+        self._option_scores = np.zeros(
+            (len(questions), max(self._num_options.max(initial=0), 1)),
+            dtype=np.float64,
+        )
+        for i, scores in enumerate(real_options):
+            self._option_scores[i, : len(scores)] = scores
+        self._question_ids = [q.question_id for q in questions]
+
+        sections = assessment.scorable_sections
+        self._section_starts = np.cumsum([0] + [len(s.questions) for s in sections[:-1]])
+        bounds = np.array([section_bounds(s) for s in sections], dtype=np.float64)
+        self._lower, self._upper = bounds[:, 0], bounds[:, 1]
+
+    def _not_sure_mask(self, answer_sets: list[AnswerSet]) -> np.ndarray:
+        """(n_answer_sets, n_questions) True where the answer can be re-drawn"""
+        mask = np.array(
+            [
+                [(a.answers.get(qid) or NOT_SURE) == NOT_SURE for qid in self._question_ids]
+                for a in answer_sets
+            ],
+            dtype=bool,
+        ).reshape(len(answer_sets), len(self._question_ids))
+        # Questions with nothing but 'Not sure' keep their fixed score
+        return mask & (self._num_options > 0)
+
+    def _sample_bins(self, weighted: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        (samples, n_answer_sets, n_sections) bins with every masked answer
+        replaced by a uniformly drawn real option
+        """
+        shape = (self._samples,) + weighted.shape
+        drawn = (self._rng.random(shape) * self._num_options).astype(np.int64)
+        sampled = self._option_scores[np.arange(weighted.shape[1]), drawn]
+        values = np.where(mask, sampled, weighted)
+        totals = np.add.reduceat(values, self._section_starts, axis=-1)
+        return bin_section_totals(totals, self._lower, self._upper)
+
+    def percentiles(self, answer_sets: list[AnswerSet]) -> np.ndarray:
+        """
+        (len(PERCENTILES), n_answer_sets, n_sections) percentiles of each
+        section's sampled bins
+        """
+        return self._percentiles(
+            weighted_scores(self._assessment, answer_sets),
+            self._not_sure_mask(answer_sets),
+        )
+
+    def _percentiles(self, weighted: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        per_chunk = max(1, MAX_SAMPLED_VALUES // (self._samples * max(weighted.shape[1], 1)))
+        results = [
+            np.percentile(
+                self._sample_bins(weighted[i : i + per_chunk], mask[i : i + per_chunk]),
+                PERCENTILES,
+                axis=0,
+                method="nearest",
+            )
+            for i in range(0, weighted.shape[0], per_chunk)
+        ]
+        if not results:
+            return np.empty((len(PERCENTILES), 0, len(self._lower)))
+        return np.concatenate(results, axis=1)
+
+    def report(
+        self, answer_sets: Iterable[AnswerSet], batch_size: int = RESPONSES_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        One row per assessment and section: the fixed-0.5 bin alongside the
+        p10/p50/p90 of the sampled bins, a batch of assessments at a time
+        """
+        sections = self._assessment.scorable_sections
+        answer_sets = iter(answer_sets)
+        while batch := list(islice(answer_sets, batch_size)):
+            weighted = weighted_scores(self._assessment, batch)
+            fixed = bin_weighted_scores(self._assessment, weighted)
+            mask = self._not_sure_mask(batch)
+            not_sure_counts = np.add.reduceat(mask.astype(np.int64), self._section_starts, axis=1)
+            pct = self._percentiles(weighted, mask)
+            n = len(batch)
+            frame = {
+                "product_name": np.repeat([a.product_name for a in batch], len(sections)),
+                "submitted_at": np.repeat([a.submitted_at or "" for a in batch], len(sections)),
+                "section": np.tile([s.title for s in sections], n),
+                "not_sure_answers": not_sure_counts.ravel(),
+                "score": fixed.ravel(),
+            }
+            for p, values in zip(PERCENTILES, pct):
+                frame[f"p{p}"] = values.astype(np.int64).ravel()
+            yield pd.DataFrame(frame)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Estimate how far 'Not sure' answers could move each section's score."
+    )
+    parser.add_argument("yaml_path", help="Path to the questionnaire YAML the answers were collected against.")
+    parser.add_argument("inputs", nargs="+",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    parser.add_argument("-o", "--output", default="not_sure_sensitivity.csv",
+                        help="Path to the CSV report.")
+    parser.add_argument("-n", "--samples", type=int, default=DEFAULT_SAMPLES,
+                        help=f"Monte Carlo samples per assessment (default {DEFAULT_SAMPLES}).")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed, for reproducible reports.")
+
+    args = parser.parse_args(argv)
+
+    assessment = load_questionnaire(args.yaml_path)
+    sensitivity = NotSureSensitivity(assessment, samples=args.samples, seed=args.seed)
+    rows = 0
+    for i, frame in enumerate(sensitivity.report(iter_answer_sets(args.inputs, assessment))):
+        frame.to_csv(args.output, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        rows += len(frame)
+    print(f"✅ 'Not sure' sensitivity for {rows} assessment sections written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Scores answers from a compiled scoring table (see scoring_table.py) with
+nothing but the standard library, and without importing the rest of this
+package, so it can be copied as-is into other code bases.
+
+    table = ScoringTable.load("data_product_complexity_scoring.json")
+    table.score({"1.1": "Many different stakeholders", "3.2": ["Raw", "Conform"], ...})
+    # -> {"Stakeholders and organisation": 3, ...}
+"""
+import json
+import math
+from typing import Any, Union
+
+TABLE_FORMAT = "data-product-complexity-scoring-table"
+# Version 2 added multi-select (CheckBox) questions; version 1 tables,
+# which score every question as single choice, are still read
+FORMAT_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+
+
+class ScoringTable:
+    """
+    A compiled questionnaire: per question its weight and option -> score
+    lookup, and per section the normaliser its weighted total is binned by
+    """
+
+    def __init__(self, table: dict[str, Any]):
+        if table.get("format") != TABLE_FORMAT:
+            raise ValueError(f"Not a scoring table (format {table.get('format')!r})")
+        if table.get("formatVersion") not in READABLE_VERSIONS:
+            raise ValueError(
+                f"Unsupported scoring table version {table.get('formatVersion')!r}, "
+                f"this loader reads versions {', '.join(map(str, READABLE_VERSIONS))}"
+            )
+        self.questionnaire_hash: str = table["questionnaireHash"]
+        self.title: str = table["title"]
+        self._not_sure: str = table["notSure"]
+        self._bin_scale: float = table["binScale"]
+        self._min_bin: int = table["minBin"]
+        self._separator: str = table.get("selectionSeparator", ", ")
+        # (title, offset, divisor, [(question_id, weight, options, multi_select)])
+        # per section; multi_select is the rule name or None for single choice
+        self._sections = [
+            (
+                s["title"],
+                s["offset"],
+                s["divisor"],
+                [
+                    (q["id"], q["weight"], q["options"], q.get("multiSelect"))
+                    for q in s["questions"]
+                ],
+            )
+            for s in table["sections"]
+        ]
+
+    @classmethod
+    def load(cls, path: str) -> "ScoringTable":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def loads(cls, text: str) -> "ScoringTable":
+        return cls(json.loads(text))
+
+    @property
+    def section_titles(self) -> list[str]:
+        return [title for title, *_ in self._sections]
+
+    def _selections(self, options: dict[str, float], answer: Union[str, list[str]]) -> list[str]:
+        if isinstance(answer, list):
+            return answer
+        if answer in options:
+            return [answer]
+        # Selections joined into one string; option texts may contain the
+        # separator themselves, so rejoin parts until they make an option
+        selections = []
+        pending = None
+        for part in answer.split(self._separator):
+            pending = part if pending is None else pending + self._separator + part
+            if pending in options:
+                selections.append(pending)
+                pending = None
+        if pending is not None:
+            selections.append(pending)
+        return selections
+
+    def _multi_select_score(
+        self, options: dict[str, float], rule: str, answer: Union[str, list[str]]
+    ) -> float:
+        scores = [options[s] for s in self._selections(options, answer)]
+        if rule == "max":
+            return max(scores)
+        if rule == "sum-capped":
+            return min(sum(scores), max(options.values()))
+        if rule == "mean":
+            return sum(scores) / len(scores)
+        raise ValueError(f"Unknown multi-select rule {rule!r}")
+
+    def score(self, answers: dict[str, Union[None, str, list[str]]]) -> dict[str, int]:
+        """
+        The 1-5 bin for each section, keyed by section title, from the
+        selected option text per question id; unanswered questions count
+        as 'Not sure'. Multi-select answers are a list of option texts, or
+        them joined by ", " as Google Forms exports them.
+        """
+        not_sure = self._not_sure
+        scores = {}
+        for title, offset, divisor, questions in self._sections:
+            total = 0
+            for question_id, weight, options, multi_select in questions:
+                answer = answers.get(question_id) or not_sure
+                try:
+                    if multi_select:
+                        total += self._multi_select_score(options, multi_select, answer) * weight
+                    else:
+                        total += options[answer] * weight
+                except KeyError as e:
+                    raise ValueError(
+                        f"'{e.args[0]}' is not an option for question {question_id}"
+                    ) from None
+            scores[title] = math.floor((total - offset) / divisor * self._bin_scale) + self._min_bin
+        return scores
@@ -1,16 +1,15 @@
-import yaml
-from cerberus import Validator
-import pprint
+import argparse
+import glob
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 
+import yaml
+from cerberus import DocumentError, Validator
 
-# Load and parse the YAML file
-def load_yaml_file(file_path):
-    try:
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
-        return data, None
-    except yaml.YAMLError as e:
-        return None, f"YAML parsing error: {str(e)}"
+from .questionnaire_stream import ROOT_KEY, SECTIONS_KEY, iter_questionnaire
 
 
 # Cerberus schema definition
@@ -67,6 +66,13 @@ schema = {
                                         "max": 1.0,
                                         "required": False,
                                     },
+                                    # How a CheckBox question's selected
+                                    # options' scores combine (default max)
+                                    "scoringRule": {
+                                        "type": "string",
+                                        "allowed": ["max", "sum-capped", "mean"],
+                                        "required": False,
+                                    },
                                 },
                             },
                         },
@@ -78,6 +84,13 @@ schema = {
 }
 
 
+# The rules for one entry of data_product_complexity.sections
+section_schema = schema["data_product_complexity"]["schema"]["sections"]["schema"]["schema"]
+
+# CheckBox selections are scored as 64-bit masks
+MAX_CHECKBOX_OPTIONS = 64
+
+
 # Custom rules beyond Cerberus
 def custom_validation(data):
     errors = []
@@ -96,57 +109,294 @@ def custom_validation(data):
         errors.append("Missing required section: 'Data Product Information'.")
 
     for section in data["data_product_complexity"]["sections"]:
-        for q in section.get("questions", []):
-            q_type = q.get("questionType")
-            options = q.get("options")
-
-            if q_type == "ShortAnswer":
-                # if "options" in q:
-                #     errors.append(
-                #         f"'options' should not be present for ShortAnswer in question '{q.get('question')}'."
-                #     )
-                pass
-            elif q_type in ["DropDown", "CheckBox"]:
-                if not options:
-                    errors.append(
-                        f"'options' must be a non-empty list for {q_type} in question '{q.get('question')}'."
-                    )
-                if (
-                    q_type == "DropDown"
-                    and options
-                    and options[-1]["optionText"] != "Not sure"
-                    and section["section"] != "Data Product Information"
-                ):
-                    errors.append(
-                        f"The last option for DropDown question '{q.get('question')}' must be 'Not sure'."
-                    )
+        errors.extend(section_errors(section))
 
     return errors
 
 
-# Full validation function
-def validate_yaml(file_path):
-    data, parse_error = load_yaml_file(file_path)
-    if parse_error:
-        return False, [parse_error]
+def section_errors(section):
+    """Custom rules for the questions of one section"""
+    errors = []
+    for q in section.get("questions", []):
+        q_type = q.get("questionType")
+        options = q.get("options")
 
-    v = Validator(schema)
-    if not v.validate(data):
-        pprint.pprint(v.errors)
-        cerberus_errors = [f"Cerberus: {e}" for e in v.errors]
-    else:
-        cerberus_errors = []
+        if q_type == "ShortAnswer":
+            # if "options" in q:
+            #     errors.append(
+            #         f"'options' should not be present for ShortAnswer in question '{q.get('question')}'."
+            #     )
+            pass
+        elif q_type in ["DropDown", "CheckBox"]:
+            if not options:
+                errors.append(
+                    f"'options' must be a non-empty list for {q_type} in question '{q.get('question')}'."
+                )
+            if (
+                q_type == "DropDown"
+                and options
+                and options[-1]["optionText"] != "Not sure"
+                and section["section"] != "Data Product Information"
+            ):
+                errors.append(
+                    f"The last option for DropDown question '{q.get('question')}' must be 'Not sure'."
+                )
+            if q_type == "CheckBox" and options and len(options) > MAX_CHECKBOX_OPTIONS:
+                errors.append(
+                    f"CheckBox question '{q.get('question')}' has {len(options)} options, "
+                    f"at most {MAX_CHECKBOX_OPTIONS} are supported."
+                )
+
+        if "scoringRule" in q and q_type != "CheckBox":
+            errors.append(
+                f"'scoringRule' only applies to CheckBox questions, not {q_type} question '{q.get('question')}'."
+            )
+
+    return errors
+
+
+class QuestionnaireValidator:
+    """
+    Validates a questionnaire read a section at a time by
+    questionnaire_stream.iter_questionnaire: each section is checked as it
+    arrives and can be dropped afterwards, and `result` gives the same
+    errors validate_data would for the whole document.
+    """
+
+    def __init__(self, validator=None, section_validator=None):
+        self._validator = validator or Validator(schema)
+        self._section_validator = section_validator or Validator(section_schema)
+        # Everything but the sections themselves
+        self._skeleton = {}
+        self._schema_errors = []
+        self._custom_errors = []
+        self._has_info_section = False
+
+    def add(self, path, value):
+        """
+        Check one (path, value) part; False if it was a section that
+        failed validation
+        """
+        if path == ():
+            self._skeleton = value
+            return True
+        if path in ((ROOT_KEY,), (ROOT_KEY, SECTIONS_KEY)):
+            # The root or its sections again: the later value replaces the
+            # earlier one, sections and all
+            self._schema_errors = []
+            self._custom_errors = []
+            self._has_info_section = False
+        if len(path) == 3 and path[:2] == (ROOT_KEY, SECTIONS_KEY):
+            return self._add_section(path[2], value)
+        parent = self._skeleton
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[path[-1]] = value
+        return True
+
+    def _add_section(self, index, section):
+        field_path = f"{ROOT_KEY}.{SECTIONS_KEY}.{index}"
+        if section is None:
+            self._schema_errors.append(f"{field_path}: null value not allowed")
+            return False
+        if not isinstance(section, dict):
+            self._schema_errors.append(f"{field_path}: must be of dict type")
+            return False
+        if not self._section_validator.validate(section):
+            self._schema_errors.extend(
+                _flatten_cerberus_errors(self._section_validator.errors, field_path)
+            )
+            return False
+        self._custom_errors.extend(section_errors(section))
+        if section.get("section") == "Data Product Information":
+            self._has_info_section = True
+        return True
+
+    def result(self):
+        """(valid, errors) for everything added"""
+        schema_errors = []
+        try:
+            valid = self._validator.validate(self._skeleton)
+        except DocumentError as e:
+            # Not a mapping at all, or an empty file
+            return False, [f"Cerberus: {e}"]
+        if not valid:
+            schema_errors = list(_flatten_cerberus_errors(self._validator.errors))
+        schema_errors += self._schema_errors
+        if schema_errors:
+            return False, [f"Cerberus: {e}" for e in schema_errors]
+
+        if ROOT_KEY not in self._skeleton:
+            return False, ["Missing top-level 'data_product_complexity' key."]
+        errors = []
+        if not self._has_info_section:
+            errors.append("Missing required section: 'Data Product Information'.")
+        errors += self._custom_errors
+        return len(errors) == 0, errors
+
+
+# Full validation function, reading the file a section at a time
+def validate_yaml(file_path, validator=None, section_validator=None):
+    checker = QuestionnaireValidator(validator, section_validator)
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for path, value in iter_questionnaire(f):
+                checker.add(path, value)
+    except yaml.YAMLError as e:
+        return False, [f"YAML parsing error: {str(e)}"]
+    return checker.result()
+
+
+# Validation of an already-parsed document, e.g. from yaml.safe_load; gives
+# the same result as validate_yaml on the file. Building a Validator compiles
+# the schema, so callers validating many documents can pass one in to reuse.
+def validate_data(data, validator=None):
+    v = validator or Validator(schema)
+    try:
+        valid = v.validate(data)
+    except DocumentError as e:
+        return False, [f"Cerberus: {e}"]
+    if not valid:
+        # The custom rules index into the structure the schema guarantees
+        return False, [f"Cerberus: {e}" for e in _flatten_cerberus_errors(v.errors)]
 
     custom_errors = custom_validation(data)
-    return len(cerberus_errors + custom_errors) == 0, cerberus_errors + custom_errors
+    return len(custom_errors) == 0, custom_errors
 
 
-# Example usage
-if __name__ == "__main__":
-    valid, errors = validate_yaml("your_file.yaml")
-    if valid:
-        print("YAML is valid ✅")
+def _flatten_cerberus_errors(errors, path=""):
+    """
+    Cerberus nests errors as {field: [message | {subfield: [...]}]}; turn
+    that into 'data_product_complexity.sections.2.questions.0: message' lines
+    """
+    for field, entries in errors.items():
+        field_path = f"{path}.{field}" if path else str(field)
+        for entry in entries:
+            if isinstance(entry, dict):
+                yield from _flatten_cerberus_errors(entry, field_path)
+            else:
+                yield f"{field_path}: {entry}"
+
+
+# One compiled schema per worker process
+_worker_validator = None
+_worker_section_validator = None
+
+
+def _init_worker():
+    global _worker_validator, _worker_section_validator
+    _worker_validator = Validator(schema)
+    _worker_section_validator = Validator(section_schema)
+
+
+def _validate_file_timed(file_path):
+    start = time.perf_counter()
+    try:
+        valid, errors = validate_yaml(file_path, _worker_validator, _worker_section_validator)
+    except Exception as e:
+        valid, errors = False, [f"{type(e).__name__}: {e}"]
+    return {
+        "path": file_path,
+        "valid": valid,
+        "errors": errors,
+        "seconds": round(time.perf_counter() - start, 6),
+    }
+
+
+def expand_paths(patterns):
+    """Paths and glob patterns (** allowed) to a sorted, de-duplicated list of files"""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True)
+        # Keep literal paths that don't exist so they're reported as errors
+        paths.update(matches if matches else [pattern])
+    return sorted(paths)
+
+
+def validate_files(file_paths, jobs=None):
+    """
+    Validate many files across a process pool, returning one result dict
+    (path, valid, errors, seconds) per file in the order given
+    """
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        return list(pool.map(_validate_file_timed, file_paths, chunksize=8))
+
+
+def json_report(results, elapsed):
+    return json.dumps(
+        {
+            "summary": {
+                "files": len(results),
+                "valid": sum(r["valid"] for r in results),
+                "invalid": sum(not r["valid"] for r in results),
+                "seconds": round(elapsed, 6),
+            },
+            "files": results,
+        },
+        indent=2,
+    )
+
+
+def junit_report(results, elapsed):
+    suite = ET.Element(
+        "testsuite",
+        name="questionnaire-validation",
+        tests=str(len(results)),
+        failures=str(sum(not r["valid"] for r in results)),
+        time=f"{elapsed:.6f}",
+    )
+    for r in results:
+        case = ET.SubElement(
+            suite, "testcase", classname="validate", name=r["path"], time=f"{r['seconds']:.6f}"
+        )
+        if not r["valid"]:
+            failure = ET.SubElement(case, "failure", message=f"{len(r['errors'])} validation error(s)")
+            failure.text = "\n".join(r["errors"])
+    return ET.tostring(suite, encoding="unicode", xml_declaration=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Validate many questionnaire YAML files in parallel."
+    )
+    parser.add_argument("paths", nargs="+", help="YAML files or glob patterns (quote them to use ** recursion).")
+    parser.add_argument("--report-format", choices=["text", "json", "junit"], default="text",
+                        help="Report format (default text).")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Write the report here instead of stdout.")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of worker processes (default: one per CPU).")
+
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = validate_files(expand_paths(args.paths), jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+
+    if args.report_format == "json":
+        report = json_report(results, elapsed)
+    elif args.report_format == "junit":
+        report = junit_report(results, elapsed)
+    else:
+        lines = []
+        for r in results:
+            if r["valid"]:
+                lines.append(f"✅ {r['path']} ({r['seconds'] * 1000:.1f} ms)")
+            else:
+                lines.append(f"❌ {r['path']} ({r['seconds'] * 1000:.1f} ms)")
+                lines.extend(f"- {err}" for err in r["errors"])
+        lines.append(f"{sum(r['valid'] for r in results)}/{len(results)} files valid in {elapsed:.2f}s")
+        report = "\n".join(lines)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
     else:
-        print("YAML is invalid ❌:")
-        for err in errors:
-            print("-", err)
+        print(report)
+
+    if not all(r["valid"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import argparse
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+import yaml
+
+from .data_product_complexity import DataProductComplexityAssessment, Question
+from .migrate import migrate_document
+from .responses import RESPONSES_CHUNK_SIZE, all_questions, iter_answer_sets
+from .scoring import (
+    SELECTION_SEPARATOR,
+    AnswerSet,
+    score_answer_sets,
+    split_selections,
+)
+
+
+def normalise_text(text: str) -> str:
+    """Case and whitespace insensitive form of question/option text"""
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def load_any_questionnaire(yaml_path: str) -> DataProductComplexityAssessment:
+    """
+    Load a questionnaire of any version, scoring plain-text options the way
+    `migrate` would so older specs can be modelled too
+    """
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    migrate_document(data)
+    return DataProductComplexityAssessment.from_dict(data["data_product_complexity"])
+
+
+@dataclass(frozen=True)
+class QuestionMapping:
+    new_question_id: str
+    options: dict[str, str]
+    reworded: bool = False
+
+
+def _remap_selections(mapping: QuestionMapping, answer: str) -> Optional[str]:
+    """A CheckBox answer's selections each mapped to the new options, if they all map"""
+    try:
+        selections = split_selections(mapping.options, answer)
+    except ValueError:
+        return None
+    return SELECTION_SEPARATOR.join(mapping.options[s] for s in selections)
+
+
+@dataclass
+class VersionMap:
+    """
+    Precomputed old question_id -> new question_id / old option -> new
+    option lookups between two questionnaire versions, plus everything
+    that could not be mapped unambiguously.
+    """
+
+    old_hash: str
+    new_hash: str
+    questions: dict[str, QuestionMapping] = field(default_factory=dict)
+    dropped_questions: list[str] = field(default_factory=list)
+    ambiguous_questions: dict[str, list[str]] = field(default_factory=dict)
+    dropped_options: dict[str, list[str]] = field(default_factory=dict)
+    added_questions: list[str] = field(default_factory=list)
+
+    def remap(self, answer_set: AnswerSet) -> tuple[AnswerSet, int]:
+        """
+        The answer set re-keyed onto the new questionnaire, and how many
+        answers had nowhere to go (dropped or ambiguous questions/options);
+        those are left out, so they score as 'Not sure'
+        """
+        answers = {}
+        unmapped = 0
+        for question_id, answer in answer_set.answers.items():
+            mapping = self.questions.get(question_id)
+            if mapping is None:
+                unmapped += 1
+                continue
+            if not mapping.options:
+                # Free text questions carry their answer over as-is
+                answers[mapping.new_question_id] = answer
+                continue
+            new_answer = mapping.options.get(answer) or _remap_selections(mapping, answer)
+            if new_answer is None:
+                if answer:
+                    unmapped += 1
+                continue
+            answers[mapping.new_question_id] = new_answer
+        return (
+            AnswerSet(
+                product_name=answer_set.product_name,
+                answers=answers,
+                submitted_at=answer_set.submitted_at,
+            ),
+            unmapped,
+        )
+
+    def issues(self) -> Iterator[str]:
+        for question_id in self.dropped_questions:
+            yield f"question {question_id} has no counterpart in the new questionnaire"
+        for question_id, candidates in self.ambiguous_questions.items():
+            yield f"question {question_id} matches several new questions: {', '.join(candidates)}"
+        for question_id, options in self.dropped_options.items():
+            yield f"question {question_id} options not in the new questionnaire: {', '.join(options)}"
+        for question_id in self.added_questions:
+            yield f"new question {question_id} has no counterpart in the old questionnaire"
+        for question_id, mapping in self.questions.items():
+            if mapping.reworded:
+                yield f"question {question_id} was reworded as {mapping.new_question_id}"
+
+
+def _option_signature(section_title: str, question: Question) -> tuple:
+    return (
+        normalise_text(section_title),
+        frozenset(normalise_text(o.option_text) for o in question.options),
+    )
+
+
+def _description_signature(section_title: str, question: Question) -> tuple:
+    return (normalise_text(section_title), normalise_text(question.description))
+
+
+# Tried in order on questions whose text didn't match
+REWORDING_SIGNATURES = [_option_signature, _description_signature]
+
+
+def _section_titles(assessment: DataProductComplexityAssessment) -> dict[str, str]:
+    return {
+        q.question_id: s.title
+        for s in [assessment.data_product_info] + list(assessment.scorable_sections)
+        for q in s.questions
+    }
+
+
+def build_version_map(
+    old: DataProductComplexityAssessment, new: DataProductComplexityAssessment
+) -> VersionMap:
+    """
+    Match questions by their normalised text; questions left over on both
+    sides are then matched within their section by identical option set,
+    then by description, which catches rewording. Options are matched by
+    normalised text. Everything is hashed up front so remapping an answer
+    is a pair of dict lookups.
+    """
+    version_map = VersionMap(old_hash=old.version_hash(), new_hash=new.version_hash())
+    new_questions = all_questions(new)
+    new_sections = _section_titles(new)
+    old_sections = _section_titles(old)
+
+    by_text: dict[str, list[Question]] = defaultdict(list)
+    for q in new_questions:
+        by_text[normalise_text(q.question_text)].append(q)
+
+    matched_new = set()
+    unmatched_old = []
+    pairs = []
+    for old_q in all_questions(old):
+        candidates = by_text.get(normalise_text(old_q.question_text), [])
+        if len(candidates) == 1:
+            pairs.append((old_q, candidates[0], False))
+            matched_new.add(candidates[0].question_id)
+        elif len(candidates) > 1:
+            version_map.ambiguous_questions[old_q.question_id] = [c.question_id for c in candidates]
+            matched_new.update(c.question_id for c in candidates)
+        else:
+            unmatched_old.append(old_q)
+
+    for signature in REWORDING_SIGNATURES:
+        by_signature: dict[tuple, list[Question]] = defaultdict(list)
+        for q in new_questions:
+            if q.question_id not in matched_new:
+                by_signature[signature(new_sections[q.question_id], q)].append(q)
+        still_unmatched = []
+        for old_q in unmatched_old:
+            candidates = by_signature.get(signature(old_sections[old_q.question_id], old_q), [])
+            if len(candidates) == 1:
+                pairs.append((old_q, candidates[0], True))
+                matched_new.add(candidates[0].question_id)
+            elif len(candidates) > 1:
+                version_map.ambiguous_questions[old_q.question_id] = [c.question_id for c in candidates]
+            else:
+                still_unmatched.append(old_q)
+        unmatched_old = still_unmatched
+    version_map.dropped_questions = [q.question_id for q in unmatched_old]
+
+    for old_q, new_q, reworded in pairs:
+        new_options = {normalise_text(o.option_text): o.option_text for o in new_q.options}
+        options = {}
+        dropped = []
+        for o in old_q.options:
+            new_option = new_options.get(normalise_text(o.option_text))
+            if new_option is None:
+                dropped.append(o.option_text)
+            else:
+                options[o.option_text] = new_option
+        if dropped:
+            version_map.dropped_options[old_q.question_id] = dropped
+        version_map.questions[old_q.question_id] = QuestionMapping(
+            new_question_id=new_q.question_id, options=options, reworded=reworded
+        )
+
+    version_map.added_questions = [
+        q.question_id for q in new_questions if q.question_id not in matched_new
+    ]
+    return version_map
+
+
+def rescore(
+    version_map: VersionMap,
+    new: DataProductComplexityAssessment,
+    answer_sets: Iterable[AnswerSet],
+    batch_size: int = RESPONSES_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Remap old answer sets and score them against the new questionnaire, a
+    batch at a time: one row per answer set with every section's bin
+    """
+    section_titles = [s.title for s in new.scorable_sections]
+    answer_sets = iter(answer_sets)
+    while batch := list(islice(answer_sets, batch_size)):
+        remapped, unmapped = zip(*(version_map.remap(a) for a in batch))
+        frame = pd.DataFrame(score_answer_sets(new, remapped), columns=section_titles)
+        frame.insert(0, "product_name", [a.product_name for a in batch])
+        frame.insert(1, "submitted_at", [a.submitted_at or "" for a in batch])
+        frame.insert(2, "unmapped_answers", list(unmapped))
+        yield frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Re-score answers collected against an older questionnaire version against a newer one."
+    )
+    parser.add_argument("old_yaml_path", help="Questionnaire the answers were collected against.")
+    parser.add_argument("new_yaml_path", help="Questionnaire to score them against.")
+    parser.add_argument("inputs", nargs="*",
+                        help="Filled-in workbooks (.xlsx) and/or Google Form response exports (.csv).")
+    parser.add_argument("-o", "--output", default="rescored_assessments.csv",
+                        help="Path to the CSV of re-scored assessments.")
+
+    args = parser.parse_args(argv)
+
+    old = load_any_questionnaire(args.old_yaml_path)
+    new = load_any_questionnaire(args.new_yaml_path)
+    version_map = build_version_map(old, new)
+
+    issues = list(version_map.issues())
+    for issue in issues:
+        print(f"⚠️  {issue}")
+    print(f"Mapped {len(version_map.questions)} of {len(all_questions(old))} questions "
+          f"({len(issues)} issues).")
+
+    if not args.inputs:
+        return
+    rows = 0
+    frames = rescore(version_map, new, iter_answer_sets(args.inputs, old))
+    for i, frame in enumerate(frames):
+        frame.to_csv(args.output, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        rows += len(frame)
+    print(f"✅ {rows} assessments re-scored against {args.new_yaml_path} at: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Sheet names, chart sizing and score formulas shared by the Excel backends.
+Kept free of openpyxl so the streaming backend can use them without it.
+"""
+import re
+from datetime import datetime
+from typing import Iterable
+
+from .data_product_complexity import MultiSelectRule, Question, Section
+from .scoring import (
+    BIN_SCALE,
+    NOT_SURE,
+    SELECTION_SEPARATOR,
+    is_multi_select,
+    multi_select_rule,
+    section_normaliser,
+)
+
+# Stamped into the document properties and zip entries instead of "now", so
+# the same questionnaire always renders to the same bytes
+FIXED_TIMESTAMP = datetime(2000, 1, 1, 0, 0, 0)
+
+MAX_SHEET_NAME_LENGTH = 31  # Excel's limit
+SCORE_HELPER_SHEET_NAME = "_score_helper"
+
+# Chart height in cm: openpyxl's default, growing per section so bars stay
+# legible as sections are added
+DEFAULT_CHART_HEIGHT = 7.5
+CHART_HEIGHT_PER_SECTION = 0.5
+
+
+def column_letter(index: int) -> str:
+    """1 -> A, 27 -> AA"""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def data_sheet_name(section_title: str) -> str:
+    """Convert to lowercase and keep only _0-9a-zA-Z"""
+    base = "_data_" + re.sub(r"[^0-9a-zA-Z_]", "", section_title.replace(" ", "_").lower())
+    return base[:MAX_SHEET_NAME_LENGTH]
+
+
+def unique_sheet_name(existing: list[str], name: str) -> str:
+    """
+    `name`, or if a sheet already has it (case insensitively) `name` with
+    the lowest free number appended, cutting `name` short where needed to
+    keep within MAX_SHEET_NAME_LENGTH
+    """
+    taken = {n.lower() for n in existing}
+    if name.lower() not in taken:
+        return name
+    number = 1
+    while True:
+        suffix = str(number)
+        candidate = name[: MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        if candidate.lower() not in taken:
+            return candidate
+        number += 1
+
+
+def fitted_width(values: Iterable) -> int:
+    """As excel_backend.fit_col_width: the longest value plus 2"""
+    return max((len(str(v)) for v in values if v), default=0) + 2
+
+
+def score_chart_height(num_sections: int) -> float:
+    return max(DEFAULT_CHART_HEIGHT, CHART_HEIGHT_PER_SECTION * num_sections)
+
+
+def weighted_score_formula(
+    question: Question, answer_cell: str, options_and_scores_range: str
+) -> str:
+    """The answer's score looked up from its option table, times the question's weight"""
+    return f"=VLOOKUP({answer_cell}, {options_and_scores_range},2,FALSE)*{question.weight}"
+
+
+def multi_select_score_formula(
+    question: Question, answer_cell: str, options_and_scores_range: str
+) -> str:
+    """
+    A CheckBox answer's selections (options typed separated by ", ", blank
+    meaning 'Not sure') scored by the question's MultiSelectRule, as
+    scoring.multi_select_scores does, times the question's weight
+    """
+    sep = SELECTION_SEPARATOR
+    answer = f'IF({answer_cell}="","{NOT_SURE}",{answer_cell})'
+    selected = (
+        f'ISNUMBER(FIND("{sep}"&INDEX({options_and_scores_range},0,1)&"{sep}",'
+        f' "{sep}"&{answer}&"{sep}"))'
+    )
+    scores = f"INDEX({options_and_scores_range},0,2)"
+    rule = multi_select_rule(question)
+    if rule == MultiSelectRule.MAX:
+        combined = f"SUMPRODUCT(MAX({selected}*{scores}))"
+    elif rule == MultiSelectRule.SUM_CAPPED:
+        best = max(o.score for o in question.options)
+        combined = f"MIN(SUMPRODUCT({selected}*{scores}),{best})"
+    else:
+        combined = f"SUMPRODUCT({selected}*{scores})/SUMPRODUCT(--{selected})"
+    return f"={combined}*{question.weight}"
+
+
+def question_score_formula(
+    question: Question, answer_cell: str, options_and_scores_range: str
+) -> str:
+    """The weighted score formula for a question of any type"""
+    if is_multi_select(question):
+        return multi_select_score_formula(question, answer_cell, options_and_scores_range)
+    return weighted_score_formula(question, answer_cell, options_and_scores_range)
+
+
+def section_score_formula(section: Section, sum_range: str) -> str:
+    """
+    The section's 1-5 score from the sum of its weighted question scores
+    over `sum_range`, normalised by section_normaliser and binned like
+    scoring.bin_section_total
+    """
+    offset, divisor = section_normaliser(section)
+    return f"=INT((SUM({sum_range})- {offset})/{divisor} * {BIN_SCALE}) + 1"
@@ -0,0 +1,544 @@
+import io
+import zipfile
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from .data_product_complexity import (
+    Backend,
+    DataProductComplexityAssessment,
+    Question,
+    Section,
+)
+from .memory_profile import stage
+from .scoring import MAX_BIN, MIN_BIN, NOT_SURE
+from .workbook_layout import (
+    FIXED_TIMESTAMP,
+    SCORE_HELPER_SHEET_NAME,
+    column_letter,
+    data_sheet_name,
+    fitted_width,
+    question_score_formula,
+    score_chart_height,
+    section_score_formula,
+    unique_sheet_name,
+)
+
+QUESTIONS_SHEET = "Questions"
+SCORE_SHEET = "Score"
+SCORE_HEADER = "Final Score (1–5)"
+CHART_TITLE = "Data Product Complexity Scores"
+# Data sheets have header, title, description and option count rows first
+FIRST_OPTION_ROW = 5
+CHART_WIDTH = 15  # cm, openpyxl's default
+EMU_PER_CM = 360000
+
+# cellXfs indexes in STYLES_XML
+PLAIN, BOLD, ITALIC = 0, 1, 2
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_PREFIX = "application/vnd.openxmlformats-officedocument"
+
+STYLES_XML = (
+    f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b val="1"/><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><i val="1"/><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    "</fonts>"
+    '<fills count="2"><fill><patternFill/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '<dxfs count="1"><dxf><fill><patternFill patternType="solid">'
+    '<fgColor rgb="00FFFFCC"/><bgColor rgb="00FFFFCC"/></patternFill></fill></dxf></dxfs>'
+    "</styleSheet>"
+)
+
+
+def _text_cell(ref: str, text: Optional[str], style: int = PLAIN) -> str:
+    if not text:
+        return ""
+    style_attr = f' s="{style}"' if style else ""
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def _number_cell(ref: str, value) -> str:
+    return f'<c r="{ref}" t="n"><v>{value}</v></c>'
+
+
+def _formula_cell(ref: str, formula: str) -> str:
+    # Formulas are built with their leading "=", which SpreadsheetML leaves out
+    return f'<c r="{ref}"><f>{escape(formula[1:])}</f></c>'
+
+
+def _row(row: int, cells: Iterable[str]) -> str:
+    return f'<row r="{row}">{"".join(cells)}</row>'
+
+
+@contextmanager
+def _part(zf: zipfile.ZipFile, name: str) -> Iterator[TextIO]:
+    """A text stream straight into a new, deflated zip entry"""
+    info = zipfile.ZipInfo(name, date_time=FIXED_TIMESTAMP.timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    with zf.open(info, "w") as raw:
+        out = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        yield out
+        out.flush()
+        out.detach()
+
+
+def _write_worksheet(
+    out: TextIO,
+    dimension: str,
+    widths: list[int],
+    rows: Iterable[str],
+    after_rows: Iterable[str] = (),
+    drawing: bool = False,
+) -> None:
+    """
+    One worksheet part. Elements have a fixed order in SpreadsheetML, so
+    everything that goes before the rows (dimension, column widths) is
+    worked out up front and everything after them is generated afterwards.
+    """
+    out.write(
+        f'<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+        f'<dimension ref="{dimension}"/>'
+        '<sheetViews><sheetView workbookViewId="0"/></sheetViews>'
+        '<sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>'
+    )
+    if widths:
+        out.write("<cols>")
+        for idx, width in enumerate(widths, start=1):
+            out.write(f'<col min="{idx}" max="{idx}" width="{width}" customWidth="1"/>')
+        out.write("</cols>")
+    out.write("<sheetData>")
+    for row in rows:
+        out.write(row)
+    out.write("</sheetData>")
+    for element in after_rows:
+        out.write(element)
+    out.write('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>')
+    if drawing:
+        out.write('<drawing r:id="rId1"/>')
+    out.write("</worksheet>")
+
+
+class StreamingExcelBackend(Backend):
+    """
+    Writes the same workbook as ExcelBackend (sheets, dropdowns, formulas,
+    conditional formatting and chart) as SpreadsheetML streamed straight into
+    the zip, without building a cell object model. Memory stays flat however
+    large the questionnaire, and each section is walked a handful of times
+    rather than materialised.
+    """
+
+    default_output = "data_product_complexity_tool.xlsx"
+    description = "Excel workbook"
+
+    @staticmethod
+    def _data_sheet_names(assessment: DataProductComplexityAssessment) -> list[str]:
+        names: list[str] = []
+        for section in assessment.scorable_sections:
+            names.append(unique_sheet_name(names, data_sheet_name(section.title)))
+        return names
+
+    @staticmethod
+    def _answer_rows(
+        assessment: DataProductComplexityAssessment,
+    ) -> Iterator[tuple[int, int, Question, int]]:
+        """
+        (scorable section index, question index, question, row) for every
+        question on the Questions sheet, following QuestionnaireSheetBuilder:
+        the info section heading and a blank row, then per section a heading,
+        two rows per question and a blank row
+        """
+        row = 3
+        for s_idx, section in enumerate(assessment.scorable_sections):
+            row += 1
+            for q_idx, question in enumerate(section.questions, start=1):
+                yield s_idx, q_idx, question, row
+                row += 2
+            row += 1
+
+    @staticmethod
+    def _options_range(sheet_name: str, q_idx: int, question: Question, with_scores: bool) -> str:
+        options_col = column_letter(2 * q_idx)
+        end_col = column_letter(2 * q_idx + 1) if with_scores else options_col
+        last_row = FIRST_OPTION_ROW + len(question.options) - 1
+        return f"'{sheet_name}'!{options_col}{FIRST_OPTION_ROW}:{end_col}{last_row}"
+
+    def _write_questions_sheet(
+        self, out: TextIO, assessment: DataProductComplexityAssessment, data_sheets: list[str]
+    ) -> None:
+        sections = assessment.scorable_sections
+        info = assessment.data_product_info
+        numbers = [str(s_idx + 2) for s_idx in range(len(sections))]
+        # Each section adds a heading, two rows per question and a blank row;
+        # the last row with content is the one before the final blank row
+        last_row = 1
+        if sections:
+            last_row = 3 + sum(2 * len(s.questions) + 2 for s in sections) - 2
+        questions = [q for s in sections for q in s.questions]
+        has_dropdowns = any(q.options for q in questions)
+
+        def question_numbers():
+            yield "1"
+            yield from numbers
+            for s_idx, q_idx, _, _ in self._answer_rows(assessment):
+                yield f"{numbers[s_idx]}.{q_idx}"
+
+        def texts():
+            yield info.title
+            for section in sections:
+                yield section.title
+                for q in section.questions:
+                    yield q.question_text
+                    yield q.description
+
+        widths = [
+            fitted_width(question_numbers()),
+            fitted_width(texts()),
+            fitted_width(NOT_SURE for q in questions if self._defaults_to_not_sure(q)),
+        ]
+
+        def rows():
+            yield _row(1, [_text_cell("A1", "1", BOLD), _text_cell("B1", info.title, BOLD)])
+            row = 3
+            for s_idx, section in enumerate(sections):
+                yield _row(row, [
+                    _text_cell(f"A{row}", numbers[s_idx], BOLD),
+                    _text_cell(f"B{row}", section.title, BOLD),
+                ])
+                row += 1
+                for q_idx, question in enumerate(section.questions, start=1):
+                    yield _row(row, [
+                        _text_cell(f"A{row}", f"{numbers[s_idx]}.{q_idx}"),
+                        _text_cell(f"B{row}", question.question_text),
+                        _text_cell(f"C{row}", NOT_SURE if self._defaults_to_not_sure(question) else None),
+                    ])
+                    yield _row(row + 1, [_text_cell(f"B{row + 1}", question.description, ITALIC)])
+                    row += 2
+                row += 1
+
+        def after_rows():
+            yield (
+                f'<conditionalFormatting sqref="B1:B{last_row}">'
+                '<cfRule type="cellIs" dxfId="0" priority="1" operator="equal">'
+                f"<formula>{escape(chr(34) + NOT_SURE + chr(34))}</formula></cfRule>"
+                "</conditionalFormatting>"
+            )
+            if has_dropdowns:
+                yield f'<dataValidations count="{sum(1 for q in questions if q.options)}">'
+                for s_idx, q_idx, question, row in self._answer_rows(assessment):
+                    if not question.options:
+                        continue
+                    options = self._options_range(data_sheets[s_idx], q_idx, question, with_scores=False)
+                    yield (
+                        f'<dataValidation type="list" allowBlank="0" showDropDown="0" '
+                        f'showInputMessage="0" showErrorMessage="0" sqref="C{row}">'
+                        f"<formula1>={escape(options)}</formula1></dataValidation>"
+                    )
+                yield "</dataValidations>"
+
+        _write_worksheet(
+            out,
+            dimension=f"A1:{'C' if has_dropdowns else 'B'}{last_row}",
+            widths=widths,
+            rows=rows(),
+            after_rows=after_rows(),
+        )
+
+    @staticmethod
+    def _defaults_to_not_sure(question: Question) -> bool:
+        return any(o.option_text == NOT_SURE for o in question.options)
+
+    def _write_data_sheet(self, out: TextIO, section: Section) -> None:
+        questions = section.questions
+        max_options = max(len(q.options) for q in questions)
+
+        def label_column():
+            yield from ("Title", "Description", "NumOptions")
+            yield from (f"Option_{i}" for i in range(max_options))
+
+        def option_column(q: Question):
+            yield from (f"Question_{q.question_id}", q.question_text, q.description, len(q.options))
+            yield from (o.option_text for o in q.options)
+
+        def score_column(q: Question):
+            yield "score"
+            yield from (o.score for o in q.options)
+
+        widths = [fitted_width(label_column())]
+        for q in questions:
+            widths.append(fitted_width(option_column(q)))
+            widths.append(fitted_width(score_column(q)))
+        # fit_col_width stops at column 2 * questions, short of the last score column
+        widths = widths[: 2 * len(questions)]
+
+        def rows():
+            yield _row(1, [
+                _text_cell(f"{column_letter(2 * i)}1", f"Question_{q.question_id}")
+                for i, q in enumerate(questions, start=1)
+            ])
+            yield _row(2, [_text_cell("A2", "Title")] + [
+                _text_cell(f"{column_letter(2 * i)}2", q.question_text)
+                for i, q in enumerate(questions, start=1)
+            ])
+            yield _row(3, [_text_cell("A3", "Description")] + [
+                _text_cell(f"{column_letter(2 * i)}3", q.description)
+                for i, q in enumerate(questions, start=1)
+            ])
+            cells = [_text_cell("A4", "NumOptions")]
+            for i, q in enumerate(questions, start=1):
+                cells.append(_number_cell(f"{column_letter(2 * i)}4", len(q.options)))
+                cells.append(_text_cell(f"{column_letter(2 * i + 1)}4", "score"))
+            yield _row(4, cells)
+            for o_idx in range(max_options):
+                row = FIRST_OPTION_ROW + o_idx
+                cells = [_text_cell(f"A{row}", f"Option_{o_idx}")]
+                for i, q in enumerate(questions, start=1):
+                    if o_idx < len(q.options):
+                        option = q.options[o_idx]
+                        cells.append(_text_cell(f"{column_letter(2 * i)}{row}", option.option_text))
+                        cells.append(_number_cell(f"{column_letter(2 * i + 1)}{row}", option.score))
+                yield _row(row, cells)
+
+        _write_worksheet(
+            out,
+            dimension=f"A1:{column_letter(2 * len(questions) + 1)}{FIRST_OPTION_ROW + max_options - 1}",
+            widths=widths,
+            rows=rows(),
+        )
+
+    def _write_score_helper_sheet(
+        self, out: TextIO, assessment: DataProductComplexityAssessment, data_sheets: list[str]
+    ) -> None:
+        def rows():
+            yield _row(1, [_text_cell("A1", "Question"), _text_cell("B1", "Weighted score")])
+            for row, (s_idx, q_idx, question, answer_row) in enumerate(
+                self._answer_rows(assessment), start=2
+            ):
+                formula = question_score_formula(
+                    question,
+                    f"{QUESTIONS_SHEET}!C{answer_row}",
+                    self._options_range(data_sheets[s_idx], q_idx, question, with_scores=True),
+                )
+                yield _row(row, [_text_cell(f"A{row}", question.question_id), _formula_cell(f"B{row}", formula)])
+
+        num_questions = sum(len(s.questions) for s in assessment.scorable_sections)
+        _write_worksheet(out, dimension=f"A1:B{num_questions + 1}", widths=[], rows=rows())
+
+    def _score_formulas(self, assessment: DataProductComplexityAssessment) -> Iterator[str]:
+        helper_row = 2
+        for section in assessment.scorable_sections:
+            last = helper_row + len(section.questions) - 1
+            yield section_score_formula(
+                section, f"'{SCORE_HELPER_SHEET_NAME}'!$B${helper_row}:$B${last}"
+            )
+            helper_row = last + 1
+
+    def _write_score_sheet(self, out: TextIO, assessment: DataProductComplexityAssessment) -> None:
+        sections = assessment.scorable_sections
+        last_row = len(sections) + 1
+        widths = [
+            fitted_width(["Section"] + [s.title for s in sections]),
+            fitted_width([SCORE_HEADER] + list(self._score_formulas(assessment))),
+        ]
+
+        def rows():
+            yield _row(1, [_text_cell("A1", "Section", BOLD), _text_cell("B1", SCORE_HEADER, BOLD)])
+            for row, (section, formula) in enumerate(
+                zip(sections, self._score_formulas(assessment)), start=2
+            ):
+                yield _row(row, [_text_cell(f"A{row}", section.title), _formula_cell(f"B{row}", formula)])
+
+        heatmap = (
+            f'<conditionalFormatting sqref="B2:B{last_row}">'
+            '<cfRule type="colorScale" priority="1"><colorScale>'
+            f'<cfvo type="num" val="{MIN_BIN}"/><cfvo type="num" val="3"/><cfvo type="num" val="{MAX_BIN}"/>'
+            '<color rgb="0092D050"/><color rgb="00FFFF00"/><color rgb="00FF0000"/>'
+            "</colorScale></cfRule></conditionalFormatting>"
+        )
+        _write_worksheet(
+            out,
+            dimension=f"A1:B{last_row}",
+            widths=widths,
+            rows=rows(),
+            after_rows=[heatmap],
+            drawing=True,
+        )
+
+    @staticmethod
+    def _drawing_xml(num_sections: int) -> str:
+        height = int(score_chart_height(num_sections) * EMU_PER_CM)
+        return (
+            '<xdr:wsDr xmlns:xdr="http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing" '
+            'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+            f'xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" xmlns:r="{_REL_NS}">'
+            "<xdr:oneCellAnchor>"
+            "<xdr:from><xdr:col>7</xdr:col><xdr:colOff>0</xdr:colOff><xdr:row>0</xdr:row><xdr:rowOff>0</xdr:rowOff></xdr:from>"
+            f'<xdr:ext cx="{CHART_WIDTH * EMU_PER_CM}" cy="{height}"/>'
+            '<xdr:graphicFrame macro=""><xdr:nvGraphicFramePr><xdr:cNvPr id="1" name="Chart 1"/><xdr:cNvGraphicFramePr/></xdr:nvGraphicFramePr>'
+            '<xdr:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></xdr:xfrm>'
+            '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/chart">'
+            '<c:chart r:id="rId1"/></a:graphicData></a:graphic></xdr:graphicFrame>'
+            "<xdr:clientData/></xdr:oneCellAnchor></xdr:wsDr>"
+        )
+
+    @staticmethod
+    def _chart_xml(num_sections: int) -> str:
+        last_row = num_sections + 1
+
+        def title(text: str) -> str:
+            return (
+                "<c:title><c:tx><c:rich><a:bodyPr/><a:p><a:pPr><a:defRPr/></a:pPr>"
+                f"<a:r><a:t>{escape(text)}</a:t></a:r></a:p></c:rich></c:tx><c:overlay val=\"0\"/></c:title>"
+            )
+
+        def axis_common(ax_id: int, cross_ax: int, position: str, axis_title: str) -> str:
+            return (
+                f'<c:axId val="{ax_id}"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+                f'<c:delete val="0"/><c:axPos val="{position}"/>{title(axis_title)}'
+                '<c:majorTickMark val="none"/><c:minorTickMark val="none"/>'
+                f'<c:crossAx val="{cross_ax}"/>'
+            )
+
+        return (
+            '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" '
+            f'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" xmlns:r="{_REL_NS}">'
+            f"<c:chart>{title(CHART_TITLE)}<c:autoTitleDeleted val=\"0\"/><c:plotArea>"
+            '<c:layout><c:manualLayout><c:xMode val="factor"/><c:yMode val="factor"/>'
+            '<c:wMode val="factor"/><c:hMode val="factor"/>'
+            '<c:x val="0.25"/><c:y val="0.1"/><c:w val="0.5"/><c:h val="0.6"/></c:manualLayout></c:layout>'
+            '<c:barChart><c:barDir val="bar"/><c:grouping val="clustered"/><c:varyColors val="0"/>'
+            '<c:ser><c:idx val="0"/><c:order val="0"/>'
+            f"<c:tx><c:strRef><c:f>'{SCORE_SHEET}'!B1</c:f></c:strRef></c:tx>"
+            '<c:spPr><a:ln><a:prstDash val="solid"/></a:ln></c:spPr>'
+            f"<c:cat><c:numRef><c:f>'{SCORE_SHEET}'!$A$2:$A${last_row}</c:f></c:numRef></c:cat>"
+            f"<c:val><c:numRef><c:f>'{SCORE_SHEET}'!$B$2:$B${last_row}</c:f></c:numRef></c:val>"
+            '</c:ser><c:gapWidth val="150"/><c:axId val="10"/><c:axId val="100"/></c:barChart>'
+            f"<c:catAx>{axis_common(10, 100, 'l', 'Score')}<c:lblOffset val=\"100\"/></c:catAx>"
+            f"<c:valAx>{axis_common(100, 10, 'b', 'Sections')}</c:valAx>"
+            "</c:plotArea>"
+            '<c:legend><c:legendPos val="r"/><c:overlay val="0"/></c:legend>'
+            '<c:plotVisOnly val="1"/><c:dispBlanksAs val="gap"/></c:chart></c:chartSpace>'
+        )
+
+    @staticmethod
+    def _package_xml(sheets: list[tuple[str, bool]]) -> dict[str, str]:
+        """
+        The parts describing the package: content types, relationships,
+        document properties and the workbook's sheet list
+        """
+        sheet_type = f"{_CT_PREFIX}.spreadsheetml.worksheet+xml"
+        content_types = (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{_CT_PREFIX}.spreadsheetml.sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{_CT_PREFIX}.spreadsheetml.styles+xml"/>'
+            + "".join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{sheet_type}"/>'
+                for i in range(1, len(sheets) + 1)
+            )
+            + f'<Override PartName="/xl/drawings/drawing1.xml" ContentType="{_CT_PREFIX}.drawing+xml"/>'
+            f'<Override PartName="/xl/charts/chart1.xml" ContentType="{_CT_PREFIX}.drawingml.chart+xml"/>'
+            '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+            f'<Override PartName="/docProps/app.xml" ContentType="{_CT_PREFIX}.extended-properties+xml"/>'
+            "</Types>"
+        )
+        timestamp = FIXED_TIMESTAMP.strftime("%Y-%m-%dT%H:%M:%SZ")
+        workbook = (
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><bookViews><workbookView activeTab="0"/></bookViews><sheets>'
+            + "".join(
+                f'<sheet name={quoteattr(name)} sheetId="{i}" state="{"hidden" if hidden else "visible"}" r:id="rId{i}"/>'
+                for i, (name, hidden) in enumerate(sheets, start=1)
+            )
+            + '</sheets><calcPr calcId="124519" fullCalcOnLoad="1"/></workbook>'
+        )
+        workbook_rels = (
+            f'<Relationships xmlns="{_PKG_REL_NS}">'
+            + "".join(
+                f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                for i in range(1, len(sheets) + 1)
+            )
+            + f'<Relationship Id="rId{len(sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+            "</Relationships>"
+        )
+        return {
+            "[Content_Types].xml": content_types,
+            "_rels/.rels": (
+                f'<Relationships xmlns="{_PKG_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+                f'<Relationship Id="rId2" Type="{_PKG_REL_NS}/metadata/core-properties" Target="docProps/core.xml"/>'
+                f'<Relationship Id="rId3" Type="{_REL_NS}/extended-properties" Target="docProps/app.xml"/>'
+                "</Relationships>"
+            ),
+            "docProps/core.xml": (
+                '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+                'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+                'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+                f'<dcterms:created xsi:type="dcterms:W3CDTF">{timestamp}</dcterms:created>'
+                f'<dcterms:modified xsi:type="dcterms:W3CDTF">{timestamp}</dcterms:modified>'
+                "</cp:coreProperties>"
+            ),
+            "docProps/app.xml": (
+                '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+                "<Application>data-product-complexity-tool</Application></Properties>"
+            ),
+            "xl/workbook.xml": workbook,
+            "xl/_rels/workbook.xml.rels": workbook_rels,
+            "xl/styles.xml": STYLES_XML,
+        }
+
+    def render(self, data: DataProductComplexityAssessment, output_path: str) -> None:
+        data_sheets = self._data_sheet_names(data)
+        num_sections = len(data.scorable_sections)
+        # Same sheet order as ExcelBackend
+        sheets = (
+            [(QUESTIONS_SHEET, False), (SCORE_SHEET, False)]
+            + [(name, True) for name in data_sheets]
+            + [(SCORE_HELPER_SHEET_NAME, True)]
+        )
+
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, xml in self._package_xml(sheets).items():
+                with _part(zf, name) as out:
+                    out.write(xml)
+
+            with stage("Questions sheet"), _part(zf, "xl/worksheets/sheet1.xml") as out:
+                self._write_questions_sheet(out, data, data_sheets)
+            with stage("Score sheet"):
+                with _part(zf, "xl/worksheets/sheet2.xml") as out:
+                    self._write_score_sheet(out, data)
+                with _part(zf, "xl/worksheets/_rels/sheet2.xml.rels") as out:
+                    out.write(
+                        f'<Relationships xmlns="{_PKG_REL_NS}"><Relationship Id="rId1" '
+                        f'Type="{_REL_NS}/drawing" Target="../drawings/drawing1.xml"/></Relationships>'
+                    )
+                with _part(zf, "xl/drawings/drawing1.xml") as out:
+                    out.write(self._drawing_xml(num_sections))
+                with _part(zf, "xl/drawings/_rels/drawing1.xml.rels") as out:
+                    out.write(
+                        f'<Relationships xmlns="{_PKG_REL_NS}"><Relationship Id="rId1" '
+                        f'Type="{_REL_NS}/chart" Target="../charts/chart1.xml"/></Relationships>'
+                    )
+                with _part(zf, "xl/charts/chart1.xml") as out:
+                    out.write(self._chart_xml(num_sections))
+            with stage("data sheets"):
+                for sheet_number, section in enumerate(data.scorable_sections, start=3):
+                    with _part(zf, f"xl/worksheets/sheet{sheet_number}.xml") as out:
+                        self._write_data_sheet(out, section)
+            with stage("score helper sheet"):
+                with _part(zf, f"xl/worksheets/sheet{len(sheets)}.xml") as out:
+                    self._write_score_helper_sheet(out, data, data_sheets)
@@ -0,0 +1,50 @@
+"""
+Times rendering a generated questionnaire with each Excel backend, to see
+how renders grow with the number of sections:
+
+    PYTHONPATH=. python tests/benchmark_score_sheet.py --sections 100 200 400 --questions 20
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from data_product_complexity.excel_backend import ExcelBackend
+from data_product_complexity.xlsx_stream_backend import StreamingExcelBackend
+from generated_questionnaire import generated_questionnaire
+
+BACKENDS = {"excel": ExcelBackend, "excel-stream": StreamingExcelBackend}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Excel renders of generated questionnaires.")
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 200, 400],
+                        help="Numbers of scorable sections to try.")
+    parser.add_argument("--questions", type=int, default=20,
+                        help="Most questions per section (each has 1 to this many).")
+    parser.add_argument("--repeat", type=int, default=3, help="Renders per size; the best is reported.")
+    args = parser.parse_args(argv)
+
+    print("sections\tquestions\t" + "\t".join(f"{name} (s)" for name in BACKENDS))
+    with tempfile.TemporaryDirectory() as tmp:
+        for sections in args.sections:
+            questionnaire = generated_questionnaire(sections, args.questions)
+            questions = sum(len(s.questions) for s in questionnaire.scorable_sections)
+            timings = []
+            for name, backend in BACKENDS.items():
+                output = str(Path(tmp) / f"{name}.xlsx")
+                best = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    # ExcelBackend prints every section formula
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        backend().render(questionnaire, output)
+                    best = min(best, time.perf_counter() - start)
+                timings.append(f"{best:.2f}")
+            print(f"{sections}\t{questions}\t" + "\t".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Synthetic questionnaires for exercising the workbook layout at sizes the
+shipped questionnaire doesn't reach
+"""
+import random
+
+from data_product_complexity.data_product_complexity import DataProductComplexityAssessment
+
+LONG_TITLE = "Section with a very long title that Excel would truncate"
+
+
+def generated_questionnaire(
+    sections: int, max_questions: int, seed: int = 0
+) -> DataProductComplexityAssessment:
+    """
+    `sections` scorable sections of 1 to `max_questions` questions each,
+    some CheckBox, with every tenth section sharing one long title
+    """
+    rng = random.Random(seed)
+
+    def question(s, q):
+        options = [
+            {"optionText": f"Option {o} of {s}.{q}", "score": round(o / 4, 3)}
+            for o in range(1, rng.randint(2, 6))
+        ] + [{"optionText": "Not sure", "score": 0.5}]
+        checkbox = rng.random() < 0.2
+        return {
+            "question": f"Question {s}.{q}?",
+            "description": f"Description of question {s}.{q}",
+            "questionType": "CheckBox" if checkbox else "DropDown",
+            "weight": rng.choice([0.5, 1, 2]),
+            "options": options,
+            **({"scoringRule": rng.choice(["max", "sum-capped", "mean"])} if checkbox else {}),
+        }
+
+    return DataProductComplexityAssessment.from_dict({
+        "formTitle": "Generated questionnaire",
+        "sections": [
+            {
+                "section": "Data Product Information",
+                "questions": [{
+                    "question": "What is the data product name?",
+                    "description": "A unique identifier for the data product",
+                    "questionType": "ShortAnswer",
+                }],
+            }
+        ] + [
+            {
+                "section": LONG_TITLE if s % 10 == 0 else f"Section {s}",
+                "questions": [question(s, q) for q in range(1, rng.randint(1, max_questions) + 1)],
+            }
+            for s in range(1, sections + 1)
+        ],
+    })
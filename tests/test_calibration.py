@@ -0,0 +1,65 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data_product_complexity.calibration import latest_answer_sets, write_weighted_questionnaire
+from data_product_complexity.data_product_complexity_tool import load_questionnaire
+from data_product_complexity.scoring import AnswerSet, scorable_questions
+
+QUESTIONNAIRE = Path(__file__).parent.parent / "full_data_product_complexity_questionnaire.yaml"
+
+
+def answer_set(product, submitted_at, marker):
+    return AnswerSet(product_name=product, answers={"marker": marker}, submitted_at=submitted_at)
+
+
+def markers(answer_sets):
+    return {a.product_name: a.answers["marker"] for a in answer_sets}
+
+
+def test_latest_answer_set_is_by_submission_time_not_input_order():
+    answer_sets = [
+        answer_set("a", "10/1/2024 09:00:00", "newest"),
+        answer_set("a", "9/30/2024 14:05:33", "older"),
+        answer_set("b", "2024-10-02T08:00:00Z", "newest"),
+        answer_set("b", "2024-10-02 09:00:00+02:00", "older"),
+        answer_set("not costed", "2025-01-01", "ignored"),
+    ]
+
+    assert markers(latest_answer_sets(answer_sets, ["a", "b"])) == {"a": "newest", "b": "newest"}
+
+
+def test_input_order_decides_only_without_a_submission_time():
+    answer_sets = [
+        answer_set("a", "2024-10-01", "first"),
+        answer_set("a", None, "second"),
+        answer_set("b", None, "first"),
+        answer_set("b", "2024-10-01", "second"),
+    ]
+
+    assert markers(latest_answer_sets(answer_sets, ["a", "b"])) == {"a": "second", "b": "second"}
+
+
+def test_day_first_timestamps():
+    answer_sets = [answer_set("a", "2/10/2024 09:00", "2 October"), answer_set("a", "9/3/2024 09:00", "9 March")]
+
+    assert markers(latest_answer_sets(answer_sets, ["a"], day_first=True)) == {"a": "2 October"}
+
+
+def test_calibrated_questionnaire_only_changes_weights(tmp_path):
+    pytest.importorskip("ruamel.yaml")
+    assessment = load_questionnaire(str(QUESTIONNAIRE))
+    weights = np.arange(1, len(scorable_questions(assessment)) + 1) / 8
+    output = tmp_path / "calibrated.yaml"
+
+    write_weighted_questionnaire(str(QUESTIONNAIRE), weights, str(output))
+
+    original = QUESTIONNAIRE.read_text(encoding="utf-8").splitlines()
+    calibrated = output.read_text(encoding="utf-8").splitlines()
+    assert len(calibrated) == len(original)
+    changed = [(old, new) for old, new in zip(original, calibrated) if old != new]
+    assert all(re.fullmatch(r"\s+weight: \S+", new) for _, new in changed)
+    calibrated_weights = [q.weight for q in scorable_questions(load_questionnaire(str(output)))]
+    assert calibrated_weights == weights.tolist()
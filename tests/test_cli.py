@@ -0,0 +1,14 @@
+import pytest
+
+from data_product_complexity.cli import COMMAND_HELP, COMMANDS, main
+
+
+def test_help_lists_every_command(capsys):
+    with pytest.raises(SystemExit):
+        main(["--help"])
+
+    help_text = capsys.readouterr().out
+    assert set(COMMAND_HELP) == set(COMMANDS)
+    for name, description in COMMAND_HELP.items():
+        assert f"  {name} " in help_text
+        assert description in help_text
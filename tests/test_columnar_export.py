@@ -0,0 +1,64 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from data_product_complexity.columnar_export import (
+    answer_column,
+    bin_column,
+    export_scored_assessments,
+)
+from data_product_complexity.data_product_complexity_tool import load_questionnaire
+from data_product_complexity.responses import all_questions
+from data_product_complexity.scoring import AnswerSet, is_multi_select, score_answer_sets
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+
+QUESTIONNAIRE = Path(__file__).parent.parent / "full_data_product_complexity_questionnaire.yaml"
+
+
+def random_answer_sets(assessment, n, seed=1):
+    rng = random.Random(seed)
+    answer_sets = []
+    for i in range(n):
+        answers = {}
+        for q in all_questions(assessment):
+            if not q.options:
+                answers[q.question_id] = f"product-{i}"
+            elif is_multi_select(q):
+                picked = rng.sample(q.options, rng.randint(0, min(3, len(q.options))))
+                answers[q.question_id] = ", ".join(o.option_text for o in picked)
+            else:
+                # Leave some unanswered, which scores as "Not sure"
+                answers[q.question_id] = rng.choice([""] + [o.option_text for o in q.options])
+        answer_sets.append(
+            AnswerSet(product_name=f"product-{i}", answers=answers, submitted_at=f"2025-01-{i % 28 + 1:02d}")
+        )
+    return answer_sets
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trips_over_several_batches(tmp_path, suffix):
+    assessment = load_questionnaire(str(QUESTIONNAIRE))
+    answer_sets = random_answer_sets(assessment, 50)
+    output = str(tmp_path / f"scored{suffix}")
+
+    assert export_scored_assessments(assessment, answer_sets, output, row_group_size=7) == 50
+
+    if suffix == ".parquet":
+        assert pa.parquet.ParquetFile(output).num_row_groups == 8
+        table = pa.parquet.read_table(output)
+    else:
+        with pa.ipc.open_file(output) as reader:
+            assert reader.num_record_batches == 8
+            table = reader.read_all()
+
+    assert table.column("product_name").to_pylist() == [a.product_name for a in answer_sets]
+    for q in all_questions(assessment):
+        expected = [a.answers[q.question_id] or None for a in answer_sets]
+        assert table.column(answer_column(q.question_id)).to_pylist() == expected
+    bins = score_answer_sets(assessment, answer_sets)
+    for i, section in enumerate(assessment.scorable_sections):
+        assert table.column(bin_column(section.section_id)).to_pylist() == bins[:, i].tolist()
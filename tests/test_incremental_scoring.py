@@ -0,0 +1,150 @@
+import csv
+import random
+from pathlib import Path
+
+import pytest
+
+from data_product_complexity.data_product_complexity_tool import load_questionnaire
+from data_product_complexity.incremental_scoring import Checkpoint, score_incrementally
+from data_product_complexity.responses import all_questions, iter_response_csv
+from data_product_complexity.scoring import score_answer_sets
+
+QUESTIONNAIRE = Path(__file__).parent.parent / "full_data_product_complexity_questionnaire.yaml"
+
+
+@pytest.fixture(scope="module")
+def assessment():
+    return load_questionnaire(str(QUESTIONNAIRE))
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return (
+        str(tmp_path / "responses.csv"),
+        str(tmp_path / "scores.csv"),
+        str(tmp_path / "scores.csv.checkpoint.json"),
+    )
+
+
+def response_rows(assessment, count, seed=0, start=0):
+    """Form export rows: a timestamp, then an answer for every question"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(start, start + count):
+        row = [f"2025-01-{i % 28 + 1:02d} 10:{i % 60:02d}:00"]
+        for question in all_questions(assessment):
+            if question.options:
+                row.append(rng.choice(question.options).option_text)
+            else:
+                row.append(f"product-{i}")
+        rows.append(row)
+    return rows
+
+
+def write_export(path, assessment, rows, final_newline=True):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Timestamp"] + [q.question_text for q in all_questions(assessment)])
+        writer.writerows(rows)
+    if not final_newline:
+        text = Path(path).read_bytes()
+        Path(path).write_bytes(text.rstrip(b"\r\n"))
+
+
+def full_scores(csv_path, assessment):
+    """What scoring the whole export from scratch gives"""
+    answer_sets = list(iter_response_csv(csv_path, assessment))
+    bins = score_answer_sets(assessment, answer_sets)
+    return [
+        [str(row_no), a.product_name, a.submitted_at or ""] + [str(b) for b in row_bins]
+        for row_no, (a, row_bins) in enumerate(zip(answer_sets, bins.tolist()), start=1)
+    ]
+
+
+def output_rows(output_path):
+    with open(output_path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_appended_rows_are_scored(assessment, paths):
+    csv_path, output, checkpoint = paths
+    rows = response_rows(assessment, 30)
+    write_export(csv_path, assessment, rows[:20])
+    score_incrementally(csv_path, assessment, output, checkpoint)
+
+    write_export(csv_path, assessment, rows)
+    run = score_incrementally(csv_path, assessment, output, checkpoint)
+
+    assert run.full_rescore_reason is None
+    assert run.new_rows == 10
+    assert output_rows(output) == full_scores(csv_path, assessment)
+
+
+def test_edited_rows_are_rescored(assessment, paths):
+    csv_path, output, checkpoint = paths
+    rows = response_rows(assessment, 20)
+    write_export(csv_path, assessment, rows)
+    score_incrementally(csv_path, assessment, output, checkpoint)
+
+    rows[4] = response_rows(assessment, 1, seed=1, start=4)[0]
+    write_export(csv_path, assessment, rows + response_rows(assessment, 5, start=20))
+    run = score_incrementally(csv_path, assessment, output, checkpoint)
+
+    assert run.full_rescore_reason is None
+    assert run.rescored_rows == [5]
+    assert run.new_rows == 5
+    assert output_rows(output) == full_scores(csv_path, assessment)
+
+
+def test_removed_rows_mean_a_full_rescore(assessment, paths):
+    csv_path, output, checkpoint = paths
+    rows = response_rows(assessment, 20)
+    write_export(csv_path, assessment, rows)
+    score_incrementally(csv_path, assessment, output, checkpoint)
+
+    write_export(csv_path, assessment, rows[:10])
+    run = score_incrementally(csv_path, assessment, output, checkpoint)
+
+    assert run.full_rescore_reason == "rows were removed"
+    assert output_rows(output) == full_scores(csv_path, assessment)
+
+
+def test_final_row_without_a_newline(assessment, paths):
+    csv_path, output, checkpoint = paths
+    rows = response_rows(assessment, 15)
+    write_export(csv_path, assessment, rows[:10], final_newline=False)
+    score_incrementally(csv_path, assessment, output, checkpoint)
+    assert output_rows(output) == full_scores(csv_path, assessment)
+
+    write_export(csv_path, assessment, rows)
+    run = score_incrementally(csv_path, assessment, output, checkpoint)
+
+    assert run.new_rows == 5
+    assert output_rows(output) == full_scores(csv_path, assessment)
+
+
+@pytest.mark.parametrize("edit", [False, True])
+def test_interrupted_run_with_a_stale_checkpoint(assessment, paths, edit):
+    csv_path, output, checkpoint = paths
+    rows = response_rows(assessment, 20)
+    write_export(csv_path, assessment, rows)
+    score_incrementally(csv_path, assessment, output, checkpoint)
+    stale = Path(checkpoint).read_bytes()
+
+    # A run that wrote its scores but was stopped before checkpointing them.
+    # Renaming a product changes the length of its already written row.
+    if edit:
+        rows[2] = [value.replace("product-2", "product-two") for value in rows[2]]
+    rows += response_rows(assessment, 10, start=20)
+    write_export(csv_path, assessment, rows)
+    score_incrementally(csv_path, assessment, output, checkpoint)
+    Path(checkpoint).write_bytes(stale)
+    assert Checkpoint.load(checkpoint).output_bytes < Path(output).stat().st_size
+
+    rows += response_rows(assessment, 5, start=30)
+    write_export(csv_path, assessment, rows)
+    run = score_incrementally(csv_path, assessment, output, checkpoint)
+
+    # Appended scores are dropped and scored again; a rewritten output can't be trusted
+    assert (run.full_rescore_reason is not None) == edit
+    assert output_rows(output) == full_scores(csv_path, assessment)
@@ -0,0 +1,70 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from data_product_complexity.migrate import migrate_file
+
+pytest.importorskip("ruamel.yaml")
+
+QUESTIONNAIRE = Path(__file__).parent.parent / "full_data_product_complexity_questionnaire.yaml"
+
+
+def test_in_place_only_changes_migrated_lines(tmp_path):
+    original = QUESTIONNAIRE.read_text(encoding="utf-8")
+    # Drop the first scorable question's weight
+    start = original.index("weight: 1", original.index("Stakeholders"))
+    line_start = original.rindex("\n", 0, start)
+    path = tmp_path / "questionnaire.yaml"
+    path.write_text(original[:line_start] + original[original.index("\n", start):], encoding="utf-8")
+
+    report = migrate_file(str(path), output_path=str(path))
+
+    assert report.error is None
+    assert len(report.weights_set) == 1
+    assert path.read_text(encoding="utf-8") == original
+
+
+def test_wrapped_lines_next_to_changed_weights_are_kept(tmp_path):
+    original = QUESTIONNAIRE.read_text(encoding="utf-8")
+    # Wrap a description just above its question's weight
+    short = (
+        "          description: A unique identifier for the data product\n"
+        "          questionType: ShortAnswer\n"
+    )
+    wrapped = (
+        "          questionType: ShortAnswer\n"
+        "          description: A unique identifier\n            for the data product\n"
+    )
+    path = tmp_path / "questionnaire.yaml"
+    path.write_text(original.replace(short, wrapped), encoding="utf-8")
+
+    report = migrate_file(str(path), output_path=str(path), weight=2)
+
+    assert report.error is None
+    assert path.read_text(encoding="utf-8") == re.sub(
+        r"weight: \S+", "weight: 2", original.replace(short, wrapped)
+    )
+
+
+def test_already_migrated_files_are_copied_to_the_output_dir(tmp_path):
+    output = tmp_path / "out" / QUESTIONNAIRE.name
+
+    report = migrate_file(str(QUESTIONNAIRE), output_path=str(output))
+
+    assert report.error is None
+    assert not report.changed
+    assert output.read_bytes() == QUESTIONNAIRE.read_bytes()
+
+
+def test_already_migrated_files_are_not_rewritten_in_place(tmp_path):
+    path = tmp_path / QUESTIONNAIRE.name
+    path.write_bytes(QUESTIONNAIRE.read_bytes())
+    os.utime(path, (0, 0))
+
+    report = migrate_file(str(path), output_path=str(path))
+
+    assert report.error is None
+    assert not report.changed
+    assert path.stat().st_mtime == 0
@@ -0,0 +1,31 @@
+import importlib
+
+from data_product_complexity.backends import ENTRY_POINT_GROUP, backend_distribution
+from data_product_complexity.render_cache import cache_key
+
+
+def install_plugin(site, version):
+    dist_info = site / "dpc_plugin-{}.dist-info".format(version)
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: dpc-plugin\nVersion: {version}\n", encoding="utf-8"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{ENTRY_POINT_GROUP}]\nplugin-format = dpc_plugin:PluginBackend\n", encoding="utf-8"
+    )
+    importlib.invalidate_caches()
+
+
+def test_upgrading_a_plugin_backend_changes_its_cache_key(tmp_path, monkeypatch):
+    install_plugin(tmp_path / "v1", "1.0")
+    install_plugin(tmp_path / "v2", "2.0")
+
+    monkeypatch.syspath_prepend(str(tmp_path / "v1"))
+    old = backend_distribution("plugin-format")
+    monkeypatch.syspath_prepend(str(tmp_path / "v2"))
+    new = backend_distribution("plugin-format")
+
+    assert (old, new) == ("dpc-plugin==1.0", "dpc-plugin==2.0")
+    assert cache_key(b"yaml", "plugin-format", backend_distribution=old) != cache_key(
+        b"yaml", "plugin-format", backend_distribution=new
+    )
@@ -0,0 +1,62 @@
+import re
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+from data_product_complexity.excel_backend import ExcelBackend
+from data_product_complexity.workbook_layout import MAX_SHEET_NAME_LENGTH, SCORE_HELPER_SHEET_NAME
+from data_product_complexity.xlsx_stream_backend import StreamingExcelBackend
+from generated_questionnaire import generated_questionnaire
+
+SUM_RANGE = re.compile(r"SUM\('" + SCORE_HELPER_SHEET_NAME + r"'!\$B\$(\d+):\$B\$(\d+)\)")
+CHART_REF = re.compile(r"<(?:c:)?f>'?Score'?!\$([AB])\$(\d+):\$[AB]\$(\d+)</(?:c:)?f>")
+
+
+@pytest.fixture(scope="module")
+def questionnaire():
+    return generated_questionnaire(sections=300, max_questions=6)
+
+
+@pytest.mark.parametrize("backend", [ExcelBackend, StreamingExcelBackend])
+def test_large_questionnaire_score_sheet(tmp_path, questionnaire, backend):
+    output = str(tmp_path / "questionnaire.xlsx")
+    backend().render(questionnaire, output)
+
+    wb = load_workbook(output)
+    assert all(len(name) <= MAX_SHEET_NAME_LENGTH for name in wb.sheetnames)
+    assert len(set(wb.sheetnames)) == len(wb.sheetnames)
+    score = wb["Score"]
+    helper = wb[SCORE_HELPER_SHEET_NAME]
+    assert helper.sheet_state == "hidden"
+
+    # Each section's score sums exactly its own questions' helper rows
+    helper_row = 2
+    sections = questionnaire.scorable_sections
+    for row, section in enumerate(sections, start=2):
+        assert score.cell(row=row, column=1).value == section.title
+        first, last = map(int, SUM_RANGE.search(score.cell(row=row, column=2).value).groups())
+        assert (first, last) == (helper_row, helper_row + len(section.questions) - 1)
+        assert [helper.cell(row=r, column=1).value for r in range(first, last + 1)] == [
+            q.question_id for q in section.questions
+        ]
+        helper_row = last + 1
+    assert helper.max_row == helper_row - 1
+
+    # Only the section scores are formulas on the visible sheet
+    last_row = len(sections) + 1
+    formulas = [
+        cell.coordinate
+        for row in score.iter_rows()
+        for cell in row
+        if isinstance(cell.value, str) and cell.value.startswith("=")
+    ]
+    assert formulas == [f"B{r}" for r in range(2, last_row + 1)]
+
+    # The chart covers every section
+    with zipfile.ZipFile(output) as z:
+        charts = [n for n in z.namelist() if n.startswith("xl/charts/chart")]
+        assert len(charts) == 1
+        refs = {col: (int(a), int(b)) for col, a, b in CHART_REF.findall(z.read(charts[0]).decode())}
+    assert refs["A"] == (2, last_row)
+    assert refs["B"][1] == last_row
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from data_product_complexity import questionnaire_stream
+from data_product_complexity.validate_input import validate_data, validate_yaml
+
+QUESTIONNAIRE = (Path(__file__).parent.parent / "full_data_product_complexity_questionnaire.yaml").read_text(
+    encoding="utf-8"
+)
+INFO = "    - section: Data Product Information\n"
+STAKEHOLDERS = "    - section: Stakeholders and organisation\n"
+SOURCE_DATA = "    - section: Source Data\n"
+NOT_SURE = "            - optionText: Not sure\n              score: 0.5\n"
+
+
+def validate_whole(path):
+    """The whole-document path: load the file in one go, then validate_data"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=questionnaire_stream.YamlLoader)
+    except yaml.YAMLError as e:
+        return False, [f"YAML parsing error: {e}"]
+    return validate_data(data)
+
+
+def replace_once(text, old, new):
+    assert old in text
+    return text.replace(old, new, 1)
+
+
+def replace_after(text, marker, old, new):
+    start = text.index(marker)
+    return text[:start] + replace_once(text[start:], old, new)
+
+
+MALFORMED = {
+    "bad section": replace_after(
+        QUESTIONNAIRE, STAKEHOLDERS, "questionType: DropDown", "questionType: Radio"
+    ),
+    "bad custom rule": replace_after(QUESTIONNAIRE, STAKEHOLDERS, NOT_SURE, ""),
+    "missing info section": replace_once(QUESTIONNAIRE, INFO, "    - section: Info\n"),
+    "non-dict section": replace_once(QUESTIONNAIRE, STAKEHOLDERS, "    - just text\n" + STAKEHOLDERS),
+    "null section": replace_once(QUESTIONNAIRE, STAKEHOLDERS, "    - null\n" + STAKEHOLDERS),
+    "missing root key": replace_once(QUESTIONNAIRE, "data_product_complexity:", "questionnaire:"),
+    "missing form title": replace_once(QUESTIONNAIRE, "  formTitle:", "  title:"),
+    "sections not a list": "data_product_complexity:\n  formTitle: T\n  sections:\n    a: 1\n",
+    "not a mapping": "- 1\n- 2\n",
+    "empty file": "",
+    "yaml syntax error": replace_after(
+        QUESTIONNAIRE, STAKEHOLDERS, "questionType: DropDown", "questionType: [DropDown"
+    ),
+    "undefined alias": replace_after(QUESTIONNAIRE, STAKEHOLDERS, "weight: 1", "weight: *nowhere"),
+    "duplicate anchor": replace_after(
+        replace_once(QUESTIONNAIRE, "weight: 1", "weight: &w 1"), STAKEHOLDERS, "weight: 1", "weight: &w 1"
+    ),
+    "two documents": QUESTIONNAIRE + "---\nfoo: 1\n",
+    # The later key wins when the document is loaded whole
+    "repeated root key": QUESTIONNAIRE + "data_product_complexity:\n  formTitle: T\n  sections: []\n",
+    "repeated sections key": QUESTIONNAIRE + "  sections:\n    - section: Other\n      questions: []\n",
+    "valid root after an invalid one": "data_product_complexity:\n  formTitle: T\n  sections:\n    - 1\n"
+    + QUESTIONNAIRE,
+}
+
+# An option anchored in one section and aliased from the next, and a
+# question's fields merged from an anchor in an earlier section
+ALIASED = {
+    "alias across sections": replace_after(
+        replace_after(
+            QUESTIONNAIRE,
+            STAKEHOLDERS,
+            NOT_SURE,
+            NOT_SURE.replace("- optionText", "- &not_sure\n              optionText"),
+        ),
+        SOURCE_DATA,
+        NOT_SURE,
+        "            - *not_sure\n",
+    ),
+    "merge key across sections": replace_after(
+        replace_after(
+            QUESTIONNAIRE,
+            STAKEHOLDERS,
+            "          questionType: DropDown\n",
+            "          <<: &dropdown\n            questionType: DropDown\n",
+        ),
+        SOURCE_DATA,
+        "          questionType: DropDown\n",
+        "          <<: *dropdown\n",
+    ),
+    "aliased section": replace_once(
+        QUESTIONNAIRE, STAKEHOLDERS, "    - &stakeholders\n      section: Stakeholders and organisation\n"
+    )
+    + "    - *stakeholders\n",
+}
+
+
+@pytest.fixture(params=["libyaml", "python"])
+def loader(request, monkeypatch):
+    """Run each comparison with both of PyYAML's parsers where libyaml is built in"""
+    if request.param == "python":
+        monkeypatch.setattr(questionnaire_stream, "YamlLoader", yaml.SafeLoader)
+        monkeypatch.setattr(questionnaire_stream, "_NAME_ANCHORS_IN_ERRORS", True)
+    elif not hasattr(yaml, "CSafeLoader"):
+        pytest.skip("PyYAML is built without libyaml")
+    return request.param
+
+
+@pytest.mark.parametrize("name", MALFORMED)
+def test_malformed_documents_report_the_same_errors(tmp_path, loader, name):
+    path = tmp_path / "questionnaire.yaml"
+    path.write_text(MALFORMED[name], encoding="utf-8")
+
+    expected = validate_whole(path)
+
+    assert expected[0] is False or name == "valid root after an invalid one"
+    assert validate_yaml(str(path)) == expected
+
+
+@pytest.mark.parametrize("name", ALIASED)
+def test_anchors_and_aliases_across_sections(tmp_path, loader, name):
+    path = tmp_path / "questionnaire.yaml"
+    path.write_text(ALIASED[name], encoding="utf-8")
+
+    assert validate_yaml(str(path)) == validate_whole(path) == (True, [])
+
+
+def test_unchanged_questionnaire_is_valid(tmp_path):
+    path = tmp_path / "questionnaire.yaml"
+    path.write_text(QUESTIONNAIRE, encoding="utf-8")
+
+    assert validate_yaml(str(path)) == validate_whole(path) == (True, [])
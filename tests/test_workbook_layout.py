@@ -0,0 +1,22 @@
+from data_product_complexity.workbook_layout import (
+    MAX_SHEET_NAME_LENGTH,
+    data_sheet_name,
+    unique_sheet_name,
+)
+
+
+def test_unique_sheet_names_of_long_titles_stay_within_excels_limit():
+    title = "Section with a very long title that Excel would truncate"
+    names: list[str] = []
+    for _ in range(12):
+        names.append(unique_sheet_name(names, data_sheet_name(title)))
+
+    assert len({n.lower() for n in names}) == len(names)
+    assert all(len(n) <= MAX_SHEET_NAME_LENGTH for n in names)
+    assert names[1] == "_data_section_with_a_very_long1"
+    assert names[11] == "_data_section_with_a_very_lon11"
+
+
+def test_short_duplicate_names_are_numbered_like_openpyxl():
+    assert unique_sheet_name(["Sheet", "_data_scope"], "_data_Scope") == "_data_Scope1"
+    assert unique_sheet_name(["_data_scope", "_data_scope1"], "_data_scope") == "_data_scope2"